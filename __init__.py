@@ -1,2 +1,3 @@
 from .compiler import *
 from .compiled_schema import CompiledSchema
+from .compiled_module import compile_to_module
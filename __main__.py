@@ -0,0 +1,3 @@
+from .compiled_module import main
+
+main()
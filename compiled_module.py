@@ -0,0 +1,155 @@
+import argparse
+import importlib
+import typing
+
+from .compiled_schema import CompiledSchema, _function_source, _order_local_dependencies
+from .compiler.utils.compile_context import CompileFlags
+from .compiler.utils.template import Template
+
+
+_module_template = '''
+"""
+Generated by roasted marshmallow from $schema_names, do not edit.
+"""
+
+$imports
+
+
+$schemas
+
+
+__all__ = [$exported_names]
+'''.lstrip()
+
+_schema_template = '''
+def __create_$schema_class():
+    schema = $schema_class()
+
+    $locals
+
+    $definitions
+
+    return $create_functions
+
+
+$function_names = __create_$schema_class()
+'''.strip()
+
+_load_dispatch_template = '''
+def $function_name(data, partial=$partial, unknown=$unknown):
+    if partial is True or partial and is_collection(partial):
+        return $partial_function(data, partial, unknown)
+    return $full_function(data, partial, unknown)
+'''.strip()
+
+_module_function_arguments = {
+    'load': 'data, partial, unknown',
+    'load_many': 'data, partial, unknown',
+    'load_partial': 'data, partial, unknown',
+    'load_many_partial': 'data, partial, unknown',
+    'dump': 'obj',
+    'dump_many': 'obj',
+    'dumps': 'obj',
+    'dumps_many': 'obj',
+    'load_columns': "data, unknown=None, kind='list'",
+    'reload': 'data, previous_data, previous_result, partial=None, unknown=None',
+}
+
+# full and partial loads are compiled separately, the exported load functions dispatch between them
+_module_load_dispatch = {
+    'load': 'load_partial',
+    'load_many': 'load_many_partial',
+}
+_module_load_functions = {*_module_load_dispatch.keys(), *_module_load_dispatch.values()}
+
+
+def compile_to_module(schemas: typing.Iterable[type[CompiledSchema]], flags: CompileFlags,
+                      module_filename: str = None) -> str:
+    imports = set()
+    schema_sources = []
+    exported_names = []
+    schema_classes = {}
+    for schema_class in schemas:
+        if schema_class.__name__ in schema_classes:
+            raise ValueError(f'Duplicate schema name {schema_class.__name__} '
+                             f'({schema_class.__module__} and {schema_classes[schema_class.__name__].__module__})')
+        elif '<locals>' in schema_class.__qualname__:
+            raise ValueError(f'Schema {schema_class.__qualname__} is not importable')
+        schema_classes[schema_class.__name__] = schema_class
+        imports.add(f'from {schema_class.__module__} import {schema_class.__name__}')
+        imports.add('from marshmallow.utils import is_collection')
+
+        schema = schema_class()
+        encoded = schema._encode_functions(flags)
+        definitions, function_names, create_functions, locals_ = [], [], [], {}
+        for name, encoded_function in encoded.items():
+            if encoded_function.pre_deserialize_routines or encoded_function.post_deserialize_routines:
+                raise ValueError(f'Schema {schema_class.__name__} uses routines, which can not be compiled ahead of time')
+            source, local_names = _function_source(name, _module_function_arguments[name], encoded_function)
+            definitions.append(source)
+            function_names.append(f'_{name}_{schema_class.__name__}' if name in _module_load_functions
+                                  else f'{name}_{schema_class.__name__}')
+            create_functions.append(f'__create_{name}({", ".join(local_names)})')
+            locals_.update(encoded_function.locals)
+
+        dispatch_sources, dispatch_names = [], []
+        for name, partial_name in _module_load_dispatch.items():
+            template = Template(_load_dispatch_template)
+            template.substitute(function_name=f'{name}_{schema_class.__name__}',
+                                partial=repr(schema.partial),
+                                unknown=repr(schema.unknown),
+                                full_function=f'_{name}_{schema_class.__name__}',
+                                partial_function=f'_{partial_name}_{schema_class.__name__}')
+            dispatch_sources.append(str(template))
+            dispatch_names.append(f'{name}_{schema_class.__name__}')
+
+        imports.update(s for v, s in locals_.values() if v is None or 'import ' in s)
+        locals_ = {k: v for k, v in locals_.items() if not (v[0] is None or 'import ' in v[1])}
+
+        template = Template(_schema_template)
+        template.safe_substitute(schema_class=schema_class.__name__,
+                                 function_names=', '.join(function_names),
+                                 create_functions=', '.join(create_functions))
+        template.substitute_indented(locals='\n'.join(f'{k} = {v}' for k, v in _order_local_dependencies(locals_)),
+                                     definitions='\n\n'.join(definitions))
+        schema_sources.append('\n\n\n'.join([str(template), *dispatch_sources]))
+        exported_names += dispatch_names + [n for n in function_names if not n.startswith('_')]
+
+    template = Template(_module_template)
+    template.substitute(schema_names=', '.join(f'{c.__module__}.{c.__qualname__}' for c in schema_classes.values()),
+                        imports='\n'.join(sorted(imports)),
+                        schemas='\n\n\n'.join(schema_sources),
+                        exported_names=', '.join(f"'{name}'" for name in exported_names))
+    code = str(template)
+    if module_filename is not None:
+        with open(module_filename, 'w') as f:
+            f.write(code)
+    return code
+
+
+def _import_schema(path: str) -> type[CompiledSchema]:
+    module_name, _, class_name = path.partition(':')
+    if not class_name:
+        raise argparse.ArgumentTypeError(f'Expected module:Schema, got {path}')
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _parse_flag(flag: str) -> tuple[str, bool | str]:
+    name, separator, value = flag.partition('=')
+    if not separator:
+        raise argparse.ArgumentTypeError(f'Expected name=value, got {flag}')
+    elif value.lower() in ('true', 'false'):
+        return name, value.lower() == 'true'
+    # the remaining flags take a mode name, like numeric_lists=array
+    return name, value
+
+
+def main(args: list[str] = None):
+    parser = argparse.ArgumentParser(description='Compiles schemas ahead of time into an importable Python module.')
+    parser.add_argument('-o', '--output', required=True, help='filename of the generated module')
+    parser.add_argument('-f', '--flag', type=_parse_flag, action='append', default=[],
+                        help='compile flag as name=true|false or name=mode, can be given multiple times')
+    parser.add_argument('schemas', type=_import_schema, nargs='+', help='schemas to compile as module:Schema')
+    parsed = parser.parse_args(args)
+    compile_to_module(parsed.schemas, CompileFlags(**dict(parsed.flag)), parsed.output)
+
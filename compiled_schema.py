@@ -1,13 +1,29 @@
+import importlib
+import json
+import marshal
+import math
+import os
+import re
+from concurrent.futures import Executor, ProcessPoolExecutor
+from types import CodeType
 import typing
-from datetime import datetime
 
-from marshmallow import Schema, types
-from marshmallow.decorators import PRE_LOAD, POST_LOAD, PRE_DUMP, POST_DUMP
+from marshmallow import Schema, ValidationError, types
+from marshmallow.decorators import PRE_LOAD, POST_LOAD, PRE_DUMP, POST_DUMP, VALIDATES_SCHEMA
+from marshmallow.error_store import merge_errors
+from marshmallow.utils import is_collection
 
-from .compiler.encoders.encoder import DeserializeArgs, SerializeArgs
+from .compiler.encoders.encoder import Encoder, DeserializeArgs, SerializeArgs
+from .compiler.encoders.schema_encoder import SchemaEncoder
 from .compiler.encoders.visitor import visitor
 from .compiler.utils.compile_context import CompileContext, CompileFlags, EncodedReturn
 from .compiler.utils.template import Template
+from .compiler.utils.code_cache import CodeCache, schema_fingerprint
+from .compiler.utils.columns import ColumnarResult
+from .compiler.utils.json_format import JsonResult, json_value
+from .compiler.utils.json_stream import JsonSource, iter_json_array, iter_json_lines
+from .compiler.utils.load_statistics import LoadStatistics
+from .compiler.utils.reload import unchanged
 
 
 _deserialize_template = '''
@@ -113,50 +129,313 @@ def _order_local_dependencies(locals_: dict[str, tuple[typing.Any, str]]) -> lis
     return [(key, locals_[key][1]) for key in ordered_dependencies]
 
 
+_function_template = '''
+def __create_$function_name($local_names):
+    def $function_name($function_arguments):
+        $definitions
+
+        $code
+        return result
+    return $function_name
+'''.strip()
+
+
+_function_arguments = {
+    'load': 'data, partial, unknown',
+    'load_many': 'data, partial, unknown',
+    'load_partial': 'data, partial, unknown',
+    'load_many_partial': 'data, partial, unknown',
+    'dump': 'obj',
+    'dump_many': 'obj',
+    'dumps': 'obj',
+    'dumps_many': 'obj',
+    'load_columns': 'data, unknown, kind',
+    'reload': 'data, previous_data, previous_result, partial, unknown',
+}
+
+# most callers never load partially or into columns, these functions are compiled on their first use
+_on_demand_functions = ('load_partial', 'load_many_partial', 'load_columns')
+
+
+def _function_source(function_name: str, function_arguments: str, encoded: EncodedReturn) -> tuple[str, list[str]]:
+    local_names = [k for k, v in encoded.locals.items() if v[0] is not None]
+    template = Template(_function_template)
+    template.safe_substitute(function_name=function_name,
+                             function_arguments=function_arguments,
+                             local_names=', '.join(local_names))
+    template.substitute_indented(definitions='\n\n'.join(encoded.definitions),
+                                 code=encoded.code)
+    return str(template), local_names
+
+
+def _create_functions(code: CodeType, functions: dict[str, list[str]],
+                      locals_: dict[str, typing.Any]) -> dict[str, typing.Callable]:
+    namespace = {}
+    exec(code, namespace)
+    return {name: namespace[f'__create_{name}'](**{k: locals_[k] for k in local_names})
+            for name, local_names in functions.items()}
+
+
+def _evaluate_locals(schema: Schema, local_sources: dict[str, str]) -> dict[str, typing.Any]:
+    namespace = {'schema': schema}
+    imports = {k: s for k, s in local_sources.items() if 'import ' in s}
+    for source in imports.values():
+        exec(source, namespace)
+    locals_ = {k: (None, s) for k, s in local_sources.items() if k not in imports}
+    for key, source in _order_local_dependencies(locals_):
+        namespace[key] = eval(source, namespace)
+    return namespace
+
+
+def _flags_entry(flags: CompileFlags) -> dict[str, typing.Any]:
+    return {name: getattr(flags, name) for name in dir(flags)
+            if not name.startswith('_') and not callable(getattr(flags, name))}
+
+
+_whitespace = re.compile(r'[ \t\n\r]*')
+_bytes_whitespace = re.compile(rb'[ \t\n\r]*')
+
+_parallel_schema: Schema | None = None
+
+
+def _parallel_initialize(schema_path: tuple[str, str], entry: bytes):
+    global _parallel_schema
+    module_name, qualname = schema_path
+    schema_class = importlib.import_module(module_name)
+    for name in qualname.split('.'):
+        schema_class = getattr(schema_class, name)
+    schema = schema_class()
+    if not schema._compile_from_cache(marshal.loads(entry)):
+        raise RuntimeError(f'Could not restore compiled {qualname} in worker {os.getpid()}')
+    _parallel_schema = schema
+
+
+def _load_chunk(schema: Schema, records: list, partial: bool | types.StrSequenceOrSet | None,
+                unknown: str | None) -> tuple:
+    try:
+        return True, schema.load_compiled(records, many=True, partial=partial, unknown=unknown)
+    except ValidationError as error:
+        return False, error.messages, error.valid_data
+
+
+def _parallel_load(records: list, partial: bool | types.StrSequenceOrSet | None, unknown: str | None) -> tuple:
+    return _load_chunk(_parallel_schema, records, partial, unknown)
+
+
+def _offset_errors(errors: dict | list, offset: int) -> dict | list:
+    if not isinstance(errors, dict):
+        return errors
+    return {k + offset if isinstance(k, int) else k: v for k, v in errors.items()}
+
 
 class CompiledSchema(Schema):
-    _compiled_deserialize = None
-    _compiled_deserialize_locals: dict[str, typing.Any] = {}
+    _compiled_deserialize: typing.Callable | None = None
+    _compiled_deserialize_many: typing.Callable | None = None
+    _compiled_on_demand: dict[str, typing.Callable | None] = {}
+    _compiled_reload: typing.Callable | None = None
 
-    _compiled_serialize = None
-    _compiled_serialize_locals: dict[str, typing.Any] = {}
+    _compiled_serialize: typing.Callable | None = None
+    _compiled_serialize_many: typing.Callable | None = None
+    _compiled_serialize_json: typing.Callable | None = None
+    _compiled_serialize_json_many: typing.Callable | None = None
 
     _routines: dict[str, [typing.Callable]] = {}
 
-    def _encode_deserialize(self, flags: CompileFlags, input_schema: str, input_partial: str, input_unknown: str) -> EncodedReturn:
+    _compiled_entry: dict[str, typing.Any] | None = None
+    _compiled_flags: CompileFlags | None = None
+
+    compile_cache_dir: str | os.PathLike | None = None
+    # records which missed the fast path of the specialize_shapes compile flag
+    shape_guard_misses: int = 0
+    # if set, many loads of a JSON array decode and load this many records at a time instead of the whole document,
+    # the generic dicts of a chunk are freed once its records are loaded but they are still built
+    loads_chunk_size: int | None = None
+
+    _load_statistics: LoadStatistics | None = None
+
+    @property
+    def load_statistics(self) -> LoadStatistics:
+        if self._load_statistics is None:
+            self._load_statistics = LoadStatistics()
+        return self._load_statistics
+
+    def _encode_deserialize(self, flags: CompileFlags, input_schema: str, input_partial: str, input_unknown: str,
+                            many: bool = False, partial_load: bool = False,
+                            statistics: LoadStatistics | None = None) -> EncodedReturn:
+        context = CompileContext(flags=flags, statistics=statistics)
+        with context.stacks.scope(DeserializeArgs(object=input_schema,
+                                                  result='result',
+                                                  value='data',
+                                                  partial=input_partial,
+                                                  unknown=input_unknown,
+                                                  many=many),
+                                  partial_load=partial_load,
+                                  load_statistics=self.load_statistics if flags.collect_statistics else None):
+            return visitor.deserialize(self, context)
+
+    def _encode_reload(self, flags: CompileFlags, input_schema: str, input_partial: str,
+                       input_unknown: str) -> EncodedReturn:
         context = CompileContext(flags=flags)
         with context.stacks.scope(DeserializeArgs(object=input_schema,
                                                   result='result',
                                                   value='data',
                                                   partial=input_partial,
+                                                  unknown=input_unknown,
+                                                  many=False),
+                                  reload=True,
+                                  reload_schema=self,
+                                  previous_value='previous_data',
+                                  previous_field='previous_result'):
+            encoded = visitor.deserialize(self, context)
+        # the ahead of time module passes no unknown, it defaults to the option of the schema
+        schema_key = SchemaEncoder._schema_key(self)
+        encoded.code = (f'if unchanged(data, previous_data):\n'
+                        f'    return previous_result\n'
+                        f'{input_unknown} = {input_unknown} or {schema_key}.unknown\n'
+                        f'{encoded.code}')
+        encoded.locals[schema_key] = (self, input_schema)
+        encoded.locals['unchanged'] = (unchanged, f'from {unchanged.__module__} import unchanged')
+        return encoded
+
+    def _encode_deserialize_columns(self, flags: CompileFlags, input_schema: str,
+                                    input_unknown: str) -> EncodedReturn | None:
+        context = CompileContext(flags=flags)
+        with context.stacks.scope(DeserializeArgs(object=input_schema,
+                                                  value='data',
                                                   unknown=input_unknown)):
-            return visitor.deserialize(self, context)
+            return visitor.deserialize_columns(self, context)
 
-    def _encode_serialize(self, flags: CompileFlags, input_schema: str, input_obj: str) -> EncodedReturn:
+    def _encode_serialize(self, flags: CompileFlags, input_schema: str, input_obj: str,
+                          many: bool = False) -> EncodedReturn:
         context = CompileContext(flags)
         with context.stacks.scope(SerializeArgs(object=input_schema,
                                                 result='result',
-                                                obj=input_obj)):
+                                                obj=input_obj,
+                                                many=many)):
             return visitor.serialize(self, context)
 
-    def compile(self, flags: CompileFlags):
-        encoded_deserialize = self._encode_deserialize(flags, 'schema', 'partial', 'unknown')
-        code = '\n\n'.join(encoded_deserialize.definitions) + '\n\n' + encoded_deserialize.code
-        with open('raw_test_load.py', 'w') as f:
-            f.write(code)
-        self._compiled_deserialize_locals = {k: v[0] for k, v in encoded_deserialize.locals.items() if v[0] is not None}
-        self._compiled_deserialize = compile(code, '', 'exec')
-        self._routines[PRE_LOAD] = [v for v, _ in encoded_deserialize.pre_deserialize_routines.values()]
-        self._routines[POST_LOAD] = [v for v, _ in encoded_deserialize.post_deserialize_routines.values()]
-
-        encoded_serialize = self._encode_serialize(flags, 'schema', 'obj')
-        code = '\n\n'.join(encoded_serialize.definitions) + '\n\n' + encoded_serialize.code
-        with open('raw_test_dump.py', 'w') as f:
-            f.write(code)
-        self._compiled_serialize = compile(code, '', 'exec')
-        self._compiled_serialize_locals = {k: v[0] for k, v in encoded_serialize.locals.items() if v[0] is not None}
-        self._routines[PRE_DUMP] = [v for v, _ in encoded_serialize.pre_deserialize_routines.values()]
-        self._routines[POST_DUMP] = [v for v, _ in encoded_serialize.post_deserialize_routines.values()]
+    def _encode_serialize_json(self, flags: CompileFlags, input_schema: str, input_obj: str,
+                               many: bool = False) -> EncodedReturn:
+        context = CompileContext(flags)
+        format_key, format_local = Encoder._json_format_local(json_value)
+        with context.stacks.scope(SerializeArgs(object=input_schema,
+                                                result='result',
+                                                set_result=JsonResult('parts', '', format_key),
+                                                obj=input_obj,
+                                                many=many)):
+            encoded = visitor.serialize(self, context)
+        encoded.code = f"parts = []\n{encoded.code}\nresult = ''.join(parts)"
+        encoded.locals[format_key] = format_local
+        return encoded
+
+    def _encode_functions(self, flags: CompileFlags, statistics: LoadStatistics | None = None,
+                          names: typing.Collection[str] | None = None) -> dict[str, EncodedReturn]:
+        encoders = {
+            'load': lambda: self._encode_deserialize(flags, 'schema', 'partial', 'unknown', statistics=statistics),
+            'load_many': lambda: self._encode_deserialize(flags, 'schema', 'partial', 'unknown', many=True,
+                                                          statistics=statistics),
+            'load_partial': lambda: self._encode_deserialize(flags, 'schema', 'partial', 'unknown', partial_load=True,
+                                                             statistics=statistics),
+            'load_many_partial': lambda: self._encode_deserialize(flags, 'schema', 'partial', 'unknown', many=True,
+                                                                  partial_load=True, statistics=statistics),
+            'dump': lambda: self._encode_serialize(flags, 'schema', 'obj'),
+            'dump_many': lambda: self._encode_serialize(flags, 'schema', 'obj', many=True),
+            'dumps': lambda: self._encode_serialize_json(flags, 'schema', 'obj'),
+            'dumps_many': lambda: self._encode_serialize_json(flags, 'schema', 'obj', many=True),
+            'load_columns': lambda: self._encode_deserialize_columns(flags, 'schema', 'unknown'),
+        }
+        if flags.reload:
+            encoders['reload'] = lambda: self._encode_reload(flags, 'schema', 'partial', 'unknown')
+        encoded = {name: encoder() for name, encoder in encoders.items() if names is None or name in names}
+        # only schemas of flat fields without hooks can be loaded into columns
+        return {name: encoded_function for name, encoded_function in encoded.items() if encoded_function is not None}
+
+    def _compile_on_demand(self, name: str) -> typing.Callable | None:
+        # concurrent first uses may both compile the function, either result is the same
+        if name in self._compiled_on_demand:
+            return self._compiled_on_demand[name]
+        encoded = self._encode_functions(self._compiled_flags, names=(name,))
+        function = None
+        if name in encoded:
+            source, local_names = _function_source(name, _function_arguments[name], encoded[name])
+            code = compile(source, f'<{self.__class__.__name__}.compiled>', 'exec')
+            function = _create_functions(code, {name: local_names},
+                                         {k: v for k, (v, _) in encoded[name].locals.items()})[name]
+        self._compiled_on_demand = {**self._compiled_on_demand, name: function}
+        return function
+
+    def compile(self, flags: CompileFlags, cache_dir: str | os.PathLike | None = None,
+                statistics: LoadStatistics | None = None):
+        cache_dir = cache_dir or self.compile_cache_dir
+        # code specialized to load statistics is not described by the fingerprint, so it is never cached
+        cache = CodeCache(cache_dir) if cache_dir is not None and statistics is None else None
+        fingerprint = schema_fingerprint(self, flags) if cache is not None else None
+        self._compiled_flags = flags
+        if cache is not None and self._compile_from_cache(cache.get(fingerprint)):
+            return
+
+        encoded = self._encode_functions(flags, statistics,
+                                         names=_function_arguments.keys() - set(_on_demand_functions))
+        sources, functions, locals_ = [], {}, {}
+        for name, encoded_function in encoded.items():
+            source, functions[name] = _function_source(name, _function_arguments[name], encoded_function)
+            sources.append(source)
+            locals_.update(encoded_function.locals)
+        source = '\n\n\n'.join(sources)
+        code = compile(source, f'<{self.__class__.__name__}.compiled>', 'exec')
+
+        compiled = _create_functions(code, functions, {k: v for k, (v, _) in locals_.items()})
+        self._compiled_entry = {
+            'code': code,
+            'functions': functions,
+            'locals': {k: s for k, (_, s) in locals_.items()},
+            'flags': _flags_entry(flags),
+        }
+        self._set_compiled(compiled, {
+            PRE_LOAD: [v for v, _ in encoded['load'].pre_deserialize_routines.values()],
+            POST_LOAD: [v for v, _ in encoded['load'].post_deserialize_routines.values()],
+            PRE_DUMP: [v for v, _ in encoded['dump'].pre_deserialize_routines.values()],
+            POST_DUMP: [v for v, _ in encoded['dump'].post_deserialize_routines.values()],
+        })
+
+        # routines are arbitrary callables, they cannot be restored from the cache
+        if cache is not None and not any(self._routines.values()):
+            cache.set(fingerprint, source, self._compiled_entry)
+
+    def recompile_from_statistics(self, flags: CompileFlags | None = None):
+        if self._compiled_flags is None:
+            raise RuntimeError('Schema not compiled')
+        elif self._load_statistics is None:
+            raise RuntimeError(f'Schema {self.__class__.__name__} has no load statistics, '
+                               f'compile it with the collect_statistics flag first')
+        self.compile(flags or self._compiled_flags, statistics=self._load_statistics)
+
+    def _compile_from_cache(self, entry: dict[str, typing.Any] | None) -> bool:
+        if entry is None:
+            return False
+        try:
+            locals_ = _evaluate_locals(self, entry['locals'])
+            compiled = _create_functions(entry['code'], entry['functions'], locals_)
+            # the functions which are compiled on demand need the flags, also in parallel workers
+            flags = CompileFlags(**entry['flags'])
+        except Exception:
+            return False
+        self._compiled_entry = entry
+        self._compiled_flags = flags
+        self._set_compiled(compiled, {PRE_LOAD: [], POST_LOAD: [], PRE_DUMP: [], POST_DUMP: []})
+        return True
+
+    def _set_compiled(self, compiled: dict[str, typing.Callable], routines: dict[str, [typing.Callable]]):
+        # load_compiled and dump_compiled check the plain functions, so they are set last for concurrent callers
+        self._routines = routines
+        self._compiled_deserialize_many = compiled['load_many']
+        self._compiled_on_demand = {}
+        self._compiled_reload = compiled.get('reload')
+        self._compiled_serialize_many = compiled['dump_many']
+        self._compiled_serialize_json = compiled['dumps']
+        self._compiled_serialize_json_many = compiled['dumps_many']
+        self._compiled_deserialize = compiled['load']
+        self._compiled_serialize = compiled['dump']
 
     def compile_to_string(self, flags: CompileFlags, experiment_filename: str, profile_filename: str = None) -> tuple[str, str]:
         profile = profile_filename is not None
@@ -216,45 +495,230 @@ class CompiledSchema(Schema):
             self,
             data: (typing.Mapping[str, typing.Any] | typing.Iterable[typing.Mapping[str, typing.Any]]),
             *,
+            many: bool | None = None,
             partial: bool | types.StrSequenceOrSet | None = None,
             unknown: str | None = None
     ):
         if self._compiled_deserialize is None:
             raise RuntimeError('Schema not compiled')
-        local = {'schema': self, 'data': data, 'partial': partial, 'unknown': unknown}
-        local.update(self._compiled_deserialize_locals)
+        many = self.many if many is None else bool(many)
+        partial = self.partial if partial is None else partial
+        unknown = unknown or self.unknown
+        for routine in self._routines[PRE_LOAD]:
+            routine()
+        if partial is True or partial and is_collection(partial):
+            if many:
+                result = self._compile_on_demand('load_many_partial')(data, partial, unknown)
+            else:
+                result = self._compile_on_demand('load_partial')(data, partial, unknown)
+        elif many:
+            result = self._compiled_deserialize_many(data, partial, unknown)
+        else:
+            result = self._compiled_deserialize(data, partial, unknown)
+        for routine in self._routines[POST_LOAD]:
+            routine()
+        return result
+
+    def load_compiled_columns(
+            self,
+            data: typing.Iterable[typing.Mapping[str, typing.Any]],
+            *,
+            kind: str = 'list',
+            unknown: str | None = None
+    ) -> ColumnarResult:
+        if self._compiled_deserialize is None:
+            raise RuntimeError('Schema not compiled')
+        load_columns = self._compile_on_demand('load_columns')
+        if load_columns is None:
+            raise ValueError(f'Schema {self.__class__.__name__} can not be loaded into columns, '
+                             f'it has hooks or fields which are not flat')
         for routine in self._routines[PRE_LOAD]:
             routine()
-        start = datetime.now()
-        exec(self._compiled_deserialize, local, local)
-        compiled_load_time = (datetime.now() - start).total_seconds()
+        result = load_columns(data, unknown or self.unknown, kind)
         for routine in self._routines[POST_LOAD]:
             routine()
-        return local['result']
+        return result
+
+    def reload_compiled(
+            self,
+            data: typing.Mapping[str, typing.Any],
+            previous_data: typing.Mapping[str, typing.Any],
+            previous_result: typing.Any,
+            *,
+            unknown: str | None = None
+    ):
+        # nested data which equals its previous data is not loaded again, its previous result is shared instead
+        if self._compiled_deserialize is None:
+            raise RuntimeError('Schema not compiled')
+        elif self._compiled_reload is None:
+            raise RuntimeError(f'Schema {self.__class__.__name__} was compiled without reload, '
+                               f'compile it with the reload flag first')
+        elif self.many or self.partial:
+            raise ValueError(f'Schema {self.__class__.__name__} can only reload single documents without partial')
+        for routine in self._routines[PRE_LOAD]:
+            routine()
+        result = self._compiled_reload(data, previous_data, previous_result, None, unknown or self.unknown)
+        for routine in self._routines[POST_LOAD]:
+            routine()
+        return result
+
+    def _has_pass_many_hooks(self) -> bool:
+        # hooks with pass_many see the whole collection, chunks would change their input
+        return any(self._hooks[(tag, True)] for tag in (PRE_LOAD, POST_LOAD, VALIDATES_SCHEMA))
+
+    def create_parallel_executor(self, workers: int | None = None) -> ProcessPoolExecutor:
+        if self._compiled_entry is None:
+            raise RuntimeError('Schema not compiled')
+        elif any(self._routines.values()):
+            raise ValueError(f'Schema {self.__class__.__name__} uses routines, which can not be sent to worker processes')
+        elif '<locals>' in self.__class__.__qualname__:
+            raise ValueError(f'Schema {self.__class__.__qualname__} is not importable')
+        elif schema_fingerprint(self, self._compiled_flags) != schema_fingerprint(self.__class__(), self._compiled_flags):
+            raise ValueError(f'Schema {self.__class__.__qualname__} differs from a default instance, '
+                             f'which can not be recreated in worker processes')
+        return ProcessPoolExecutor(max_workers=workers,
+                                   initializer=_parallel_initialize,
+                                   initargs=((self.__class__.__module__, self.__class__.__qualname__),
+                                             marshal.dumps(self._compiled_entry)))
+
+    def load_compiled_parallel(
+            self,
+            records: typing.Sequence[typing.Mapping[str, typing.Any]],
+            *,
+            workers: int | None = None,
+            chunk_size: int | None = None,
+            executor: Executor | None = None,
+            partial: bool | types.StrSequenceOrSet | None = None,
+            unknown: str | None = None
+    ) -> list:
+        if self._has_pass_many_hooks():
+            raise ValueError(f'Schema {self.__class__.__name__} has pass_many hooks, which can not run on chunks')
+        elif not is_collection(records):
+            return self.load_compiled(records, many=True, partial=partial, unknown=unknown)
+        records = records if isinstance(records, typing.Sequence) else list(records)
+
+        own_executor = executor is None
+        executor = executor or self.create_parallel_executor(workers)
+        try:
+            chunk_size = chunk_size or max(1, math.ceil(len(records) / (4 * (workers or os.cpu_count() or 1))))
+            starts = range(0, len(records), chunk_size)
+            futures = [executor.submit(_parallel_load, records[start:start + chunk_size], partial, unknown)
+                       for start in starts]
+            return self._join_chunks(((start, future.result()) for start, future in zip(starts, futures)), records)
+        finally:
+            if own_executor:
+                executor.shutdown(cancel_futures=True)
+
+    def _join_chunks(self, chunks: typing.Iterable[tuple[int, tuple]], data: typing.Any) -> list:
+        result, errors = [], {}
+        for start, (succeeded, *outcome) in chunks:
+            if succeeded:
+                result += outcome[0]
+                continue
+            messages, valid_data = outcome
+            if not (self._compiled_flags.validate and self._compiled_flags.collect_errors):
+                raise ValidationError(messages, data=data, valid_data=valid_data)
+            errors = merge_errors(errors, _offset_errors(messages, start))
+            result += valid_data or []
+
+        if errors:
+            raise ValidationError(errors, data=data, valid_data=result)
+        return result
+
+    def _loads_compiled_chunked(self, json_data: str | bytes, partial: bool | types.StrSequenceOrSet | None,
+                                unknown: str | None) -> list:
+        def load_chunks():
+            start, records = 0, []
+            for record in iter_json_array(json_data):
+                records.append(record)
+                if len(records) == self.loads_chunk_size:
+                    yield start, _load_chunk(self, records, partial, unknown)
+                    start, records = start + len(records), []
+            if records or start == 0:
+                yield start, _load_chunk(self, records, partial, unknown)
+        return self._join_chunks(load_chunks(), None)
 
     def loads_compiled(
             self,
             json_data: str,
             *,
+            many: bool | None = None,
             partial: bool | types.StrSequenceOrSet | None = None,
             unknown: str | None = None,
             **kwargs
     ):
+        many = self.many if many is None else bool(many)
+        if many and not kwargs and self._chunked_loads_supported(json_data):
+            return self._loads_compiled_chunked(json_data, partial, unknown)
         data = self.opts.render_module.loads(json_data, **kwargs)
-        return self.load_compiled(data, partial=partial, unknown=unknown)
-
-    def dump_compiled(self, obj: typing.Any):
+        return self.load_compiled(data, many=many, partial=partial, unknown=unknown)
+
+    def _chunked_loads_supported(self, json_data: str | bytes) -> bool:
+        if not self.loads_chunk_size or self.opts.render_module is not json:
+            return False
+        elif self._has_pass_many_hooks():
+            return False
+        whitespace = _whitespace if isinstance(json_data, str) else _bytes_whitespace
+        start = whitespace.match(json_data).end()
+        return json_data[start:start + 1] in ('[', b'[')
+
+    def loads_compiled_stream(
+            self,
+            source: JsonSource,
+            *,
+            json_lines: bool = False,
+            partial: bool | types.StrSequenceOrSet | None = None,
+            unknown: str | None = None,
+            chunk_size: int = 65536
+    ) -> typing.Iterator[typing.Any]:
+        # records are loaded one at a time, hooks with pass_many would see single records instead of the collection
+        if self._has_pass_many_hooks():
+            raise ValueError(f'Schema {self.__class__.__name__} has pass_many hooks, which can not run on streamed records')
+        elif not json_lines and self.opts.render_module is not json:
+            raise ValueError(f'Schema {self.__class__.__name__} has a custom render module, '
+                             f'only JSON Lines can be streamed with it')
+        if json_lines:
+            records = iter_json_lines(source, self.opts.render_module.loads, chunk_size)
+        else:
+            records = iter_json_array(source, chunk_size)
+        return self._load_stream(records, partial, unknown)
+
+    def _load_stream(self, records: typing.Iterator[typing.Any], partial: bool | types.StrSequenceOrSet | None,
+                     unknown: str | None) -> typing.Iterator[typing.Any]:
+        for index, record in enumerate(records):
+            try:
+                yield self.load_compiled(record, many=False, partial=partial, unknown=unknown)
+            except ValidationError as error:
+                messages = {index: error.messages} if self.opts.index_errors else error.messages
+                raise ValidationError(messages, data=record, valid_data=error.valid_data) from error
+
+    def dump_compiled(self, obj: typing.Any, *, many: bool | None = None):
         if self._compiled_serialize is None:
             raise RuntimeError('Schema not compiled')
-        local = {'schema': self, 'obj': obj}
-        local.update(self._compiled_serialize_locals)
+        many = self.many if many is None else bool(many)
         for routine in self._routines[PRE_DUMP]:
             routine()
-        exec(self._compiled_serialize, local, local)
+        if many:
+            result = self._compiled_serialize_many(obj)
+        else:
+            result = self._compiled_serialize(obj)
         for routine in self._routines[POST_DUMP]:
             routine()
-        return local['result']
+        return result
 
-    def dumps_compiled(self, obj: typing.Any):
-        serialized = self.dump_compiled(obj)
-        return self.opts.render_module.dumps(serialized)
+    def dumps_compiled(self, obj: typing.Any, *, many: bool | None = None):
+        # the json text is written directly only for the default render module, others get the dumped result
+        if self.opts.render_module is not json:
+            return self.opts.render_module.dumps(self.dump_compiled(obj, many=many))
+        if self._compiled_serialize_json is None:
+            raise RuntimeError('Schema not compiled')
+        many = self.many if many is None else bool(many)
+        for routine in self._routines[PRE_DUMP]:
+            routine()
+        if many:
+            result = self._compiled_serialize_json_many(obj)
+        else:
+            result = self._compiled_serialize_json(obj)
+        for routine in self._routines[POST_DUMP]:
+            routine()
+        return result
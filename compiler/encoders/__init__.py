@@ -1,38 +1,87 @@
 from .encoder import Encoder, DeserializeArgs, SerializeArgs
+from .validator_encoder import ValidatorEncoder
 from .visitor import visitor
 
+from .aware_datetime_encoder import AwareDateTimeEncoder
 from .boolean_encoder import BooleanEncoder
 from .constant_encoder import ConstantEncoder
+from .date_encoder import DateEncoder
+from .datetime_encoder import BaseDateTimeEncoder, DateTimeEncoder
+from .decimal_encoder import DecimalEncoder
+from .email_encoder import EmailEncoder
+from .enum_encoder import EnumEncoder
 from .field_encoder import FieldEncoder, GeneralFieldEncoder
 from .float_encoder import FloatEncoder
+from .function_encoder import FunctionEncoder
 from .integer_encoder import IntegerEncoder
+from .ip_encoder import BaseIPEncoder, IPEncoder, IPv4Encoder, IPv6Encoder
+from .ip_interface_encoder import IPInterfaceEncoder, IPv4InterfaceEncoder, IPv6InterfaceEncoder
 from .list_encoder import ListEncoder
 from .mapping_encoder import MappingEncoder
+from .method_encoder import MethodEncoder
+from .naive_datetime_encoder import NaiveDateTimeEncoder
 from .nested_encoder import NestedEncoder
 from .number_encoder import NumberEncoder
 from .pluck_encoder import PluckEncoder
 from .schema_encoder import SchemaEncoder
-from .string_encoder import StringEncoder
+from .string_encoder import BaseStringEncoder, StringEncoder
+from .time_encoder import TimeEncoder
+from .timedelta_encoder import TimeDeltaEncoder
 from .tuple_encoder import TupleEncoder
+from .url_encoder import UrlEncoder
+from .uuid_encoder import UUIDEncoder
+from .validators import *
 
 __all__ = [
     'Encoder',
     'DeserializeArgs',
     'SerializeArgs',
+    'ValidatorEncoder',
     'visitor',
 
+    'AwareDateTimeEncoder',
+    'BaseDateTimeEncoder',
+    'BaseIPEncoder',
+    'BaseStringEncoder',
     'BooleanEncoder',
     'ConstantEncoder',
+    'DateEncoder',
+    'DateTimeEncoder',
+    'DecimalEncoder',
+    'EmailEncoder',
+    'EnumEncoder',
     'FieldEncoder',
-    'GeneralFieldEncoder',
     'FloatEncoder',
+    'FunctionEncoder',
+    'GeneralFieldEncoder',
     'IntegerEncoder',
+    'IPEncoder',
+    'IPInterfaceEncoder',
+    'IPv4Encoder',
+    'IPv4InterfaceEncoder',
+    'IPv6Encoder',
+    'IPv6InterfaceEncoder',
     'ListEncoder',
     'MappingEncoder',
+    'MethodEncoder',
+    'NaiveDateTimeEncoder',
     'NestedEncoder',
     'NumberEncoder',
     'PluckEncoder',
     'SchemaEncoder',
     'StringEncoder',
+    'TimeDeltaEncoder',
+    'TimeEncoder',
     'TupleEncoder',
+    'UrlEncoder',
+    'UUIDEncoder',
+
+    'EmailValidatorEncoder',
+    'EqualEncoder',
+    'LengthEncoder',
+    'OneOfEncoder',
+    'PredicateEncoder',
+    'RangeEncoder',
+    'RegexpEncoder',
+    'URLValidatorEncoder',
 ]
\ No newline at end of file
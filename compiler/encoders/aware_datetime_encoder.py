@@ -0,0 +1,15 @@
+from marshmallow.fields import AwareDateTime
+
+from .datetime_encoder import BaseDateTimeEncoder, CompileContext, visitor, _deserialize_invalid_awareness_template
+
+
+class AwareDateTimeEncoder(BaseDateTimeEncoder[AwareDateTime]):
+    def _encode_naive(self, field: AwareDateTime, context: CompileContext, locals_: dict) -> str:
+        if field.default_timezone is None:
+            return _deserialize_invalid_awareness_template
+        timezone_key = f'default_timezone_{id(field)}'
+        locals_[timezone_key] = (field.default_timezone, f'{context.stacks.object}.default_timezone')
+        return f'__datetime = __datetime.replace(tzinfo={timezone_key})'
+
+
+visitor.register_encoder(AwareDateTimeEncoder)
@@ -1,4 +1,7 @@
+import typing
+
 from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor, Template
+from ..utils.json_format import json_bool
 
 from marshmallow.fields import Boolean
 
@@ -50,5 +53,17 @@ class BooleanEncoder(FieldEncoder[Boolean]):
         set_value = self.set_result(context, f'bool({context.stacks.value})')
         return self._encode(boolean, context, set_value, set_value)
 
+    def _encode_load_type(self, _: Boolean) -> type:
+        return bool
+
+    def _encode_load_shape(self, boolean: Boolean, context: CompileContext) -> tuple[str, str] | None:
+        # with truthy values marshmallow looks the value up instead of converting it, False must end up falsy
+        if boolean.truthy and not (True in boolean.truthy and False not in boolean.truthy and False in boolean.falsy):
+            return None
+        return f'{context.stacks.value}.__class__ is bool', context.stacks.value
+
+    def _encode_json_format(self, _: Boolean) -> typing.Callable[[typing.Any], str]:
+        return json_bool
+
 
 visitor.register_encoder(BooleanEncoder)
@@ -0,0 +1,41 @@
+import datetime as dt
+import re
+
+from marshmallow import utils
+from marshmallow.fields import Date
+
+from .datetime_encoder import BaseDateTimeEncoder, CompileContext, visitor, Template
+
+
+_iso_date_match = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}\Z').match
+_date_fromisoformat = dt.date.fromisoformat
+_date_isoformat = dt.date.isoformat
+
+
+_deserialize_iso_template = '''
+if $value.__class__ is str and $iso_match($value) is not None:
+    try:
+        __datetime = $fromisoformat($value)
+    except ValueError:
+        __datetime = $field._deserialize($value, None, None)
+else:
+    __datetime = $field._deserialize($value, None, None)
+'''.strip()
+
+
+class DateEncoder(BaseDateTimeEncoder[Date]):
+    def _encode_parse(self, date: Date, context: CompileContext, locals_: dict) -> str:
+        if date.DESERIALIZATION_FUNCS.get(self._format(date)) is not utils.from_iso_date:
+            return super()._encode_parse(date, context, locals_)
+        template = Template(_deserialize_iso_template)
+        template.safe_substitute(iso_match=self._import_local(locals_, globals(), '_iso_date_match'),
+                                 fromisoformat=self._import_local(locals_, globals(), '_date_fromisoformat'))
+        return str(template)
+
+    def _encode_format(self, date: Date, context: CompileContext, locals_: dict) -> str:
+        if date.SERIALIZATION_FUNCS.get(self._format(date)) is not utils.to_iso_date:
+            return super()._encode_format(date, context, locals_)
+        return f'{self._import_local(locals_, globals(), "_date_isoformat")}({context.stacks.value})'
+
+
+visitor.register_encoder(DateEncoder)
@@ -0,0 +1,153 @@
+import datetime as dt
+import functools
+import re
+import typing
+from abc import ABC
+
+from marshmallow import utils
+from marshmallow.fields import DateTime
+
+from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor, Template, _F
+from ..utils.json_format import json_string, json_value
+
+
+# only shapes which datetime.fromisoformat parses exactly like marshmallow, everything else takes the field's path
+_iso_datetime_match = re.compile(r'([0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}'
+                                 r'(?::[0-9]{2}(?:\.[0-9]{3}(?:[0-9]{3})?)?)?)'
+                                 r'(Z|[+-][0-9]{2}(?::?[0-9]{2})?)?\Z').match
+_datetime_fromisoformat = dt.datetime.fromisoformat
+_datetime_fromtimestamp = dt.datetime.fromtimestamp
+_utc = dt.timezone.utc
+
+
+@functools.lru_cache(maxsize=None)
+def _fixed_timezone(tzinfo: str) -> dt.tzinfo:
+    if tzinfo == 'Z':
+        return dt.timezone.utc
+    offset = 60 * int(tzinfo[1:3]) + (int(tzinfo[-2:]) if len(tzinfo) > 3 else 0)
+    return utils.get_fixed_timezone(-offset if tzinfo[0] == '-' else offset)
+
+
+_deserialize_template = '''
+$parse
+$set_result
+'''.strip()
+
+_deserialize_fallback_template = '__datetime = $field._deserialize($value, None, None)'
+
+_deserialize_iso_template = '''
+__match = $iso_match($value) if $value.__class__ is str else None
+if __match is None:
+    __datetime = $field._deserialize($value, None, None)
+else:
+    try:
+        __datetime = $fromisoformat(__match.group(1))
+    except ValueError:
+        __datetime = $field._deserialize($value, None, None)
+    else:
+        if __match.group(2) is not None:
+            $handle_aware
+        else:
+            $handle_naive
+'''.strip()
+
+_deserialize_iso_aware_template = '__datetime = __datetime.replace(tzinfo=$fixed_timezone(__match.group(2)))'
+
+_deserialize_timestamp_template = '''
+if ($value.__class__ is int or $value.__class__ is float) and $value > 0:
+    try:
+        __datetime = $fromtimestamp(float($value)$divisor, $utc).replace(tzinfo=None)
+    except (OverflowError, OSError, ValueError):
+        __datetime = $field._deserialize($value, None, None)
+    else:
+        $handle_naive
+else:
+    __datetime = $field._deserialize($value, None, None)
+'''.strip()
+
+_deserialize_invalid_awareness_template = \
+    'raise $field.make_error("invalid_awareness", awareness="$awareness", obj_type="$obj_type")'
+
+
+class BaseDateTimeEncoder(FieldEncoder[_F], ABC):
+    @staticmethod
+    def _import_local(locals_: dict, namespace: dict, name: str) -> str:
+        key = name.lstrip('_')
+        locals_[key] = (namespace[name], f'from {namespace["__name__"]} import {name} as {key}')
+        return key
+
+    @staticmethod
+    def _format(field: _F) -> str:
+        return field.format or field.DEFAULT_FORMAT
+
+    def _encode_aware(self, field: _F, context: CompileContext, locals_: dict) -> str:
+        return Template(_deserialize_iso_aware_template).safe_substitute(
+            fixed_timezone=self._import_local(locals_, globals(), '_fixed_timezone'))
+
+    def _encode_naive(self, field: _F, context: CompileContext, locals_: dict) -> str:
+        return 'pass'
+
+    def _encode_iso(self, field: _F, context: CompileContext, locals_: dict) -> str:
+        template = Template(_deserialize_iso_template)
+        template.substitute_indented(handle_aware=self._encode_aware(field, context, locals_),
+                                     handle_naive=self._encode_naive(field, context, locals_))
+        template.safe_substitute(iso_match=self._import_local(locals_, globals(), '_iso_datetime_match'),
+                                 fromisoformat=self._import_local(locals_, globals(), '_datetime_fromisoformat'))
+        return str(template)
+
+    def _encode_timestamp(self, field: _F, context: CompileContext, locals_: dict, divisor: str) -> str:
+        template = Template(_deserialize_timestamp_template)
+        template.substitute_indented(handle_naive=self._encode_naive(field, context, locals_))
+        template.safe_substitute(divisor=divisor,
+                                 fromtimestamp=self._import_local(locals_, globals(), '_datetime_fromtimestamp'),
+                                 utc=self._import_local(locals_, globals(), '_utc'))
+        return str(template)
+
+    def _encode_parse(self, field: _F, context: CompileContext, locals_: dict) -> str:
+        function = field.DESERIALIZATION_FUNCS.get(self._format(field))
+        if function is utils.from_iso_datetime:
+            return self._encode_iso(field, context, locals_)
+        elif function is utils.from_timestamp:
+            return self._encode_timestamp(field, context, locals_, '')
+        elif function is utils.from_timestamp_ms:
+            return self._encode_timestamp(field, context, locals_, ' / 1000')
+        return _deserialize_fallback_template
+
+    def _encode_deserialize(self, field: _F, context: CompileContext) -> EncodedReturn:
+        locals_ = {}
+        template = Template(_deserialize_template)
+        template.substitute_indented(parse=self._encode_parse(field, context, locals_),
+                                     set_result=self.set_result(context, '__datetime'))
+        template.safe_substitute(field=context.stacks.object,
+                                 value=context.stacks.value,
+                                 awareness=getattr(field, 'AWARENESS', ''),
+                                 obj_type=field.OBJ_TYPE)
+        return EncodedReturn(code=str(template), locals_=locals_)
+
+    def _encode_format(self, field: _F, context: CompileContext, locals_: dict) -> str:
+        value = context.stacks.value
+        data_format = self._format(field)
+        function = field.SERIALIZATION_FUNCS.get(data_format)
+        if function is None:
+            return f'{value}.strftime({data_format!r})'
+        elif function is utils.isoformat:
+            return f'{value}.isoformat()'
+        key = f'{type(field).__name__}_format_{id(field)}'
+        locals_[key] = (function, f'{context.stacks.object}.SERIALIZATION_FUNCS[{data_format!r}]')
+        return f'{key}({value})'
+
+    def _encode_serialize(self, field: _F, context: CompileContext) -> EncodedReturn:
+        locals_ = {}
+        code = self._encode_format(field, context, locals_)
+        return EncodedReturn(code=self.set_result(context, f'None if {context.stacks.value} is None else {code}'),
+                             locals_=locals_)
+
+    def _encode_json_format(self, field: _F) -> typing.Callable[[typing.Any], str]:
+        return json_value if self._format(field) in ('timestamp', 'timestamp_ms') else json_string
+
+
+class DateTimeEncoder(BaseDateTimeEncoder[DateTime]):
+    pass
+
+
+visitor.register_encoder(DateTimeEncoder)
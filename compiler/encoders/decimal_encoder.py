@@ -0,0 +1,92 @@
+import decimal
+
+from marshmallow.fields import Decimal
+
+from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor, Template
+
+
+_deserialize_template = '''
+if $value is True or $value is False:
+    raise $field.make_error("invalid", input=$value)
+try:
+    $format_num
+except (TypeError, ValueError) as __error:
+    raise $field.make_error("invalid", input=$value) from __error
+except OverflowError as __error:
+    raise $field.make_error("too_large", input=$value) from __error
+except decimal_InvalidOperation as __error:
+    raise $field.make_error("invalid") from __error
+$check_special
+$set_result
+'''.strip()
+
+_deserialize_special_template = '''
+if not __decimal.is_finite():
+    raise $field.make_error("special")
+'''.strip()
+
+_format_num_template = '''
+__decimal = decimal_Decimal(str($value))
+$handle_nan
+$quantize
+'''.strip()
+
+_format_num_nan_template = '''
+if __decimal.is_nan():
+    __decimal = decimal_nan
+'''.strip()
+
+_format_num_quantize_template = '''
+if __decimal.is_finite():
+    __decimal = __decimal.quantize($places, rounding=$rounding)
+'''.strip()
+
+_serialize_template = '''
+if $value is None:
+    $set_none
+else:
+    $format_num
+    $set_result
+'''.strip()
+
+
+class DecimalEncoder(FieldEncoder[Decimal]):
+    @staticmethod
+    def _encode_format_num(field: Decimal, context: CompileContext, locals_: dict) -> str:
+        locals_['decimal_Decimal'] = (decimal.Decimal, 'from decimal import Decimal as decimal_Decimal')
+        template = Template(_format_num_template)
+        template.substitute_indented(handle_nan=_format_num_nan_template if field.allow_nan else '',
+                                     quantize=_format_num_quantize_template if field.places is not None else '')
+        if field.allow_nan:
+            locals_['decimal_nan'] = (decimal.Decimal('NaN'), 'decimal_Decimal("NaN")')
+        if field.places is not None:
+            places_key = f'places_{id(field)}'
+            locals_[places_key] = (field.places, f'{context.stacks.object}.places')
+            template.safe_substitute(places=places_key, rounding=repr(field.rounding))
+        template.safe_substitute(value=context.stacks.value)
+        return str(template)
+
+    def _encode_deserialize(self, field: Decimal, context: CompileContext) -> EncodedReturn:
+        locals_ = {'decimal_InvalidOperation': (decimal.InvalidOperation,
+                                                'from decimal import InvalidOperation as decimal_InvalidOperation')}
+        template = Template(_deserialize_template)
+        template.substitute_indented(format_num=self._encode_format_num(field, context, locals_),
+                                     check_special=_deserialize_special_template if not field.allow_nan else '',
+                                     set_result=self.set_result(context, '__decimal'))
+        template.safe_substitute(field=context.stacks.object,
+                                 value=context.stacks.value)
+        return EncodedReturn(code=str(template), locals_=locals_)
+
+    def _encode_serialize(self, field: Decimal, context: CompileContext) -> EncodedReturn:
+        locals_ = {}
+        template = Template(_serialize_template)
+        template.substitute_indented(
+            format_num=self._encode_format_num(field, context, locals_),
+            set_none=self.set_result(context, 'None'),
+            set_result=self.set_result(context, 'format(__decimal, "f")' if field.as_string else '__decimal')
+        )
+        template.safe_substitute(value=context.stacks.value)
+        return EncodedReturn(code=str(template), locals_=locals_)
+
+
+visitor.register_encoder(DecimalEncoder)
@@ -0,0 +1,10 @@
+from marshmallow.fields import Email
+
+from .string_encoder import BaseStringEncoder, visitor
+
+
+class EmailEncoder(BaseStringEncoder[Email]):
+    pass
+
+
+visitor.register_encoder(EmailEncoder)
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import TypeVar, Generic, Callable
+from typing import TypeVar, Generic, Callable, Any
 
 from marshmallow.base import SchemaABC, FieldABC
 
@@ -8,9 +8,9 @@ from ..utils.compile_context import CompileContext, EncodedReturn
 
 
 def _check_encoder_type(func):
-    def _decorator(self, field, context, *args, **kwargs):
+    def _decorator(self, field, *args, **kwargs):
         if issubclass(type(field), self.field_type()):
-            return func(self, field, context, *args, **kwargs)
+            return func(self, field, *args, **kwargs)
         raise TypeError(f"Expected {self.field_type().__name__}, got {type(field).__name__}")
     return _decorator
 
@@ -30,6 +30,32 @@ class Encoder(ABC, Generic[_T]):
     def _encode_name(self, to_encode: _T, attr_name: str) -> str:
         return attr_name
 
+    @_check_encoder_type
+    def encode_json_format(self, to_encode: _T) -> Callable[[Any], str] | None:
+        return self._encode_json_format(to_encode)
+
+    def _encode_json_format(self, to_encode: _T) -> Callable[[Any], str] | None:
+        return None
+
+    @_check_encoder_type
+    def encode_load_shape(self, to_encode: _T, context: CompileContext) -> tuple[str, str] | None:
+        return self._encode_load_shape(to_encode, context)
+
+    def _encode_load_shape(self, to_encode: _T, context: CompileContext) -> tuple[str, str] | None:
+        return None
+
+    @_check_encoder_type
+    def encode_deserialize_columns(self, to_encode: _T, context: CompileContext) -> EncodedReturn | None:
+        return self._encode_deserialize_columns(to_encode, context)
+
+    def _encode_deserialize_columns(self, to_encode: _T, context: CompileContext) -> EncodedReturn | None:
+        return None
+
+    @staticmethod
+    def _json_format_local(function: Callable[[Any], str]) -> tuple[str, tuple[Callable[[Any], str], str]]:
+        key = f'json_format_{function.__name__}'
+        return key, (function, f'from {function.__module__} import {function.__name__} as {key}')
+
     @staticmethod
     def set_result(context: CompileContext, result: str) -> str:
         if context.stacks.get('set_result'):
@@ -62,7 +88,8 @@ class DeserializeArgs(dict):
                  data: str = ...,
                  data_key: str | None = ...,
                  partial: str = ...,
-                 unknown: str = ...):
+                 unknown: str = ...,
+                 many: bool = ...):
         super().__init__()
         if object is not ...:
             self['object'] = object
@@ -80,6 +107,8 @@ class DeserializeArgs(dict):
             self['partial'] = partial
         if unknown is not ...:
             self['unknown'] = unknown
+        if many is not ...:
+            self['many'] = many
 
 
 class SerializeArgs(dict):
@@ -89,7 +118,8 @@ class SerializeArgs(dict):
                  set_result: Callable[[str], str] | None = ...,
                  value: str = ...,
                  obj: str = ...,
-                 obj_key: str | None = ...):
+                 obj_key: str | None = ...,
+                 many: bool = ...):
         super().__init__()
         if object is not ...:
             self['object'] = object
@@ -103,3 +133,5 @@ class SerializeArgs(dict):
             self['obj'] = obj
         if obj_key is not ...:
             self['obj_key'] = obj_key
+        if many is not ...:
+            self['many'] = many
@@ -0,0 +1,49 @@
+import typing
+
+from marshmallow.fields import Enum
+
+from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor, Template
+
+
+_deserialize_template = '''
+try:
+    __member = $members[$key]
+except (KeyError, TypeError):
+    __member = $field._deserialize($value, None, None)
+$set_result
+'''.strip()
+
+
+class EnumEncoder(FieldEncoder[Enum]):
+    def _encode_deserialize(self, enum: Enum, context: CompileContext) -> EncodedReturn:
+        field, value = context.stacks.object, context.stacks.value
+        members_key = f'{enum.enum.__name__}_members_{id(enum)}'
+        if enum.by_value is False:
+            members = (dict(enum.enum.__members__), f'dict({field}.enum.__members__)')
+        elif all(isinstance(member.value, typing.Hashable) for member in enum.enum):
+            members = ({member.value: member for member in enum.enum},
+                       f'{{__member.value: __member for __member in {field}.enum}}')
+        else:
+            return EncodedReturn(code=self.set_result(context, f'{field}._deserialize({value}, None, None)'))
+
+        template = Template(_deserialize_template)
+        template.substitute_indented(set_result=self.set_result(context, '__member'))
+        template.safe_substitute(members=members_key,
+                                 key=value if isinstance(enum.by_value, bool) else
+                                 f'{field}.field._deserialize({value}, None, None)',
+                                 field=field,
+                                 value=value)
+        return EncodedReturn(code=str(template), locals_={members_key: members})
+
+    def _encode_serialize(self, enum: Enum, context: CompileContext) -> EncodedReturn:
+        value = context.stacks.value
+        if enum.by_value is False:
+            code = f'{value}.name'
+        elif enum.by_value is True:
+            code = f'{value}.value'
+        else:
+            code = f'{context.stacks.object}.field._serialize({value}.value, "{context.stacks.obj_key}", {context.stacks.obj})'
+        return EncodedReturn(code=self.set_result(context, f'None if {value} is None else {code}'))
+
+
+visitor.register_encoder(EnumEncoder)
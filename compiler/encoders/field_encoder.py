@@ -7,6 +7,7 @@ from marshmallow.fields import Field
 
 from .encoder import Encoder, DeserializeArgs, SerializeArgs, CompileContext, EncodedReturn, _T
 from .visitor import visitor
+from ..utils.load_statistics import data_path
 
 from string import Template
 from ..utils.template import Template
@@ -32,16 +33,46 @@ else:
     $handle_not_in_data
 '''.strip()
 
+_deserialize_partial_handle_not_in_data_template = '''
+elif not ($partial_skip):
+    $handle_not_in_data
+'''.strip()
+
 _deserialize_disallow_none_template = 'raise $field.make_error("null")'
 _deserialize_required_template = 'raise $field.make_error("required")'
 _deserialize_validate_result_template = '$field._validate($result)'
 
+_deserialize_inline_validate_result_template = '''
+$validated = $result
+try:
+    __valid = $conditions
+except TypeError:
+    __valid = False
+if not __valid:
+    $field._validate($validated)
+'''.strip()
+
+
+# values of the type observed in the load statistics take the shape of the field, all others the full path
+_deserialize_observed_type_template = '''
+if $guard:
+    $set_shape_result
+else:
+    $encoded_deserialize
+'''.strip()
+
 
 _serialize_check_attribute_template = '''
 $value = $input_value
 $load_default
 if $value is not missing:
     $encoded_serialize
+$serialize_missing
+'''.strip()
+
+_serialize_missing_template = '''
+else:
+    $serialize_missing
 '''.strip()
 
 _serialize_load_default_template = '''
@@ -62,13 +93,56 @@ class FieldEncoder(Encoder[_F], ABC):
     def _encode_name(self, field: _F, attr_name: str) -> str:
         return field.data_key or attr_name
 
+    @staticmethod
+    def _statistics_key(context: CompileContext) -> tuple[str, str] | None:
+        # only fields directly loaded from a schema's data have statistics
+        data_keys = context.stacks.retrieve('data_key', [])
+        if context.statistics is None or not data_keys or not data_keys[-1]:
+            return None
+        return data_path(data_keys[:-1]), data_keys[-1]
+
+    def _encode_load_type(self, field: _F) -> type | None:
+        return None
+
+    def _encode_observed_type(self, field: _F, context: CompileContext, encoded_field: EncodedReturn):
+        statistics_key = self._statistics_key(context)
+        load_type = self._encode_load_type(field)
+        if statistics_key is None or load_type is None or context.statistics.dominant_type(*statistics_key) is not load_type:
+            return
+        shape = self.encode_load_shape(field, context)
+        if shape is None:
+            return
+        template = Template(_deserialize_observed_type_template)
+        template.substitute_indented(set_shape_result=self.set_result(context, shape[1]),
+                                     encoded_deserialize=encoded_field.code)
+        template.safe_substitute(guard=shape[0])
+        encoded_field.code = str(template)
+
+    @staticmethod
+    def _encode_validators(field: _F, context: CompileContext, encoded_field: EncodedReturn) -> str:
+        validated = f'validated_{context.stacks.scope_counter}'
+        conditions = []
+        for i, validator in enumerate(field.validators):
+            with context.stacks.scope(object=f'{context.stacks.object}.validators[{i}]', value=validated):
+                encoded_condition = visitor.validate(validator, context)
+            if encoded_condition is None:
+                return _deserialize_validate_result_template
+            conditions.append(f'({encoded_condition.code})' if len(field.validators) > 1 else encoded_condition.code)
+            encoded_field.locals.update(encoded_condition.locals)
+
+        template = Template(_deserialize_inline_validate_result_template)
+        template.safe_substitute(validated=validated, conditions=' and '.join(conditions))
+        return str(template)
+
     def encode_deserialize(self, field: _F, context: CompileContext) -> EncodedReturn:
         has_data_key = context.stacks.get('data_key')
         has_default = field.load_default is not None and field.load_default != missing
+        partial_skip = context.stacks.get('partial_skip')
         value = f'value_{context.stacks.scope_counter}'
-        
+
         with context.stacks.scope(DeserializeArgs(value=value)):
             encoded_field = self._encode_deserialize(field, context)
+            self._encode_observed_type(field, context, encoded_field)
 
         if has_data_key:
             template = Template(_deserialize_with_data_key_template)
@@ -76,10 +150,14 @@ class FieldEncoder(Encoder[_F], ABC):
         else:
             template = Template(_deserialize_template)
 
+        handle_not_in_data_template = ''
+        if field.required or has_default:
+            handle_not_in_data_template = (_deserialize_partial_handle_not_in_data_template if partial_skip
+                                           else _deserialize_handle_not_in_data_template)
         template.substitute_indented(
             handle_none=self.set_result(context, 'None') if field.allow_none else _deserialize_disallow_none_template,
-            handle_not_in_data_template=_deserialize_handle_not_in_data_template if field.required or has_default else '',
-            validate_result = _deserialize_validate_result_template if field.validators else ''
+            handle_not_in_data_template=handle_not_in_data_template,
+            validate_result=self._encode_validators(field, context, encoded_field) if field.validators else ''
         )
 
         if field.required:
@@ -99,12 +177,19 @@ class FieldEncoder(Encoder[_F], ABC):
             value=value,
             input_value=context.stacks.value,
             result=context.stacks.result,
+            partial_skip=partial_skip,
         )
 
         template.substitute_indented(encoded_deserialize=encoded_field.code)
         encoded_field.code = str(template)
         return encoded_field
 
+    def encode_load_shape(self, field: _F, context: CompileContext) -> tuple[str, str] | None:
+        # validators may reject any value, so fields with validators have no fast shape
+        if field.validators:
+            return None
+        return self._encode_load_shape(field, context)
+
     def encode_serialize(self, field: _F, context: CompileContext) -> EncodedReturn:
         has_obj_key = context.stacks.get('obj_key')
         has_default = field.dump_default is not None and field.dump_default != missing
@@ -121,14 +206,22 @@ class FieldEncoder(Encoder[_F], ABC):
             template.substitute_indented(
                 load_default = _serialize_load_default_template if has_default else ''
             )
+            # fields whose value must not be skipped, like a plucked field, handle a missing value themselves
+            if context.stacks.get('missing_field') is field:
+                template.substitute_indented(serialize_missing=_serialize_missing_template)
+                template.substitute_indented(serialize_missing=context.stacks.serialize_missing)
+            else:
+                template.substitute_indented(serialize_missing='')
 
             if has_default:
-                default_key = self._default_key(field.load_default)
-                template.safe_substitute(default=default_key)
-                if callable(field.load_default):
-                    encoded_field.locals[default_key] = (str(field.load_default()), f'{context.stacks.object}.dump_default()')
+                default_key = self._default_key(field.dump_default)
+                # like marshmallow, a callable default is called on every dump
+                if callable(field.dump_default):
+                    template.safe_substitute(default=f'{default_key}()')
+                    encoded_field.locals[default_key] = (field.dump_default, f'{context.stacks.object}.dump_default')
                 else:
-                    encoded_field.locals[default_key] = (str(field.load_default), f'{context.stacks.object}.dump_default')
+                    template.safe_substitute(default=default_key)
+                    encoded_field.locals[default_key] = (field.dump_default, f'{context.stacks.object}.dump_default')
 
         template.safe_substitute(value=value,
                                  input_value=context.stacks.value)
@@ -1,14 +1,58 @@
-from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor
+import typing
+from math import isfinite
+
+from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor, Template
+from ..utils.json_format import json_float
 
 from marshmallow.fields import Float
 
 
+_deserialize_template = '''
+if $value is True or $value is False:
+    raise $field.make_error("invalid", input=$value)
+try:
+    __float = float($value)
+except (TypeError, ValueError) as __error:
+    raise $field.make_error("invalid", input=$value) from __error
+except OverflowError as __error:
+    raise $field.make_error("too_large", input=$value) from __error
+$special_template
+$set_result
+'''.strip()
+
+_deserialize_special_template = '''
+if not isfinite(__float):
+    raise $field.make_error("special")
+'''.strip()
+
+
 class FloatEncoder(FieldEncoder[Float]):
     def _encode_deserialize(self, float: Float, context: CompileContext) -> EncodedReturn:
-        return EncodedReturn(code=self.set_result(context, f'float({context.stacks.value})'))
+        if not context.flags.validate:
+            return EncodedReturn(code=self.set_result(context, f'float({context.stacks.value})'))
+
+        template = Template(_deserialize_template)
+        template.substitute_indented(special_template='' if float.allow_nan else _deserialize_special_template,
+                                     set_result=self.set_result(context, '__float'))
+        template.safe_substitute(field=context.stacks.object,
+                                 value=context.stacks.value)
+        return EncodedReturn(code=str(template),
+                             locals_={} if float.allow_nan else {'isfinite': (isfinite, 'from math import isfinite')})
 
     def _encode_serialize(self, _: Float, context: CompileContext) -> EncodedReturn:
         return EncodedReturn(code=self.set_result(context, context.stacks.value))
 
+    def _encode_load_type(self, _: Float) -> type:
+        return float
+
+    def _encode_load_shape(self, float: Float, context: CompileContext) -> tuple[str, str]:
+        value = context.stacks.value
+        # only finite floats give zero when subtracted from themselves
+        finite_condition = '' if float.allow_nan else f' and {value} - {value} == 0.0'
+        return f'{value}.__class__ is float{finite_condition}', value
+
+    def _encode_json_format(self, _: Float) -> typing.Callable[[typing.Any], str]:
+        return json_float
+
 
 visitor.register_encoder(FloatEncoder)
@@ -0,0 +1,72 @@
+import typing
+
+from marshmallow import missing
+from marshmallow.exceptions import ValidationError
+from marshmallow.utils import get_func_args
+
+from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor, Template
+
+from marshmallow.fields import Function
+
+
+_context_template = '''
+__context = $field.parent.context
+if __context is None:
+    raise ValidationError($message)
+'''.strip()
+
+_serialize_template = '''
+$context
+$value = $call
+if $value is not missing:
+    $set_result
+'''.strip()
+
+
+class FunctionEncoder(FieldEncoder[Function]):
+    @staticmethod
+    def _encode_call(function: typing.Callable, key: str, argument: str, context: CompileContext,
+                     attr: str) -> tuple[str, str]:
+        # like marshmallow, the number of arguments decides whether the schema's context is passed
+        if len(get_func_args(function)) > 1:
+            return (Template(_context_template).safe_substitute(field=context.stacks.object,
+                                                                message=repr(f'No context available for Function field {attr!r}')),
+                    f'{key}({argument}, __context)')
+        return '', f'{key}({argument})'
+
+    def _encode_deserialize(self, function: Function, context: CompileContext) -> EncodedReturn:
+        if function.deserialize_func is None:
+            return EncodedReturn(code=self.set_result(context, context.stacks.value))
+
+        key = f'{function.__class__.__name__}_deserialize_{id(function)}'
+        context_code, call = self._encode_call(function.deserialize_func, key, context.stacks.value, context,
+                                               context.stacks.get('data_key') or function.name)
+        code = self.set_result(context, call)
+        return EncodedReturn(code=f'{context_code}\n{code}' if context_code else code,
+                             locals_={
+                                 key: (function.deserialize_func, f'{context.stacks.object}.deserialize_func'),
+                                 'ValidationError': (ValidationError, 'from marshmallow.exceptions import ValidationError'),
+                             })
+
+    def _encode_serialize(self, function: Function, context: CompileContext) -> EncodedReturn:
+        if function.serialize_func is None:
+            return EncodedReturn(code='pass')
+
+        key = f'{function.__class__.__name__}_serialize_{id(function)}'
+        value = f'value_{context.stacks.scope_counter}'
+        context_code, call = self._encode_call(function.serialize_func, key, context.stacks.obj, context,
+                                               context.stacks.get('obj_key') or function.name)
+        template = Template(_serialize_template)
+        template.substitute_indented(context=context_code,
+                                     set_result=self.set_result(context, value))
+        template.safe_substitute(value=value,
+                                 call=call)
+        return EncodedReturn(code=str(template),
+                             locals_={
+                                 key: (function.serialize_func, f'{context.stacks.object}.serialize_func'),
+                                 'ValidationError': (ValidationError, 'from marshmallow.exceptions import ValidationError'),
+                                 'missing': (missing, 'from marshmallow.utils import missing'),
+                             })
+
+
+visitor.register_encoder(FunctionEncoder)
@@ -1,14 +1,48 @@
-from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor
+import typing
+from numbers import Integral
+
+from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor, Template
+from ..utils.json_format import json_int
 
 from marshmallow.fields import Integer
 
 
+_deserialize_template = '''
+if $value is True or $value is False$strict_condition:
+    raise $field.make_error("invalid", input=$value)
+try:
+    $set_result
+except (TypeError, ValueError) as __error:
+    raise $field.make_error("invalid", input=$value) from __error
+except OverflowError as __error:
+    raise $field.make_error("too_large", input=$value) from __error
+'''.strip()
+
+
 class IntegerEncoder(FieldEncoder[Integer]):
     def _encode_deserialize(self, integer: Integer, context: CompileContext) -> EncodedReturn:
-        return EncodedReturn(code=self.set_result(context, f'int({context.stacks.value})'))
+        if not context.flags.validate:
+            return EncodedReturn(code=self.set_result(context, f'int({context.stacks.value})'))
+
+        template = Template(_deserialize_template)
+        template.substitute_indented(set_result=self.set_result(context, f'int({context.stacks.value})'))
+        template.safe_substitute(field=context.stacks.object,
+                                 value=context.stacks.value,
+                                 strict_condition=f' or not isinstance({context.stacks.value}, Integral)' if integer.strict else '')
+        return EncodedReturn(code=str(template),
+                             locals_={'Integral': (Integral, 'from numbers import Integral')} if integer.strict else {})
 
     def _encode_serialize(self, _: Integer, context: CompileContext) -> EncodedReturn:
         return EncodedReturn(code=self.set_result(context, context.stacks.value))
 
+    def _encode_load_type(self, _: Integer) -> type:
+        return int
+
+    def _encode_load_shape(self, _: Integer, context: CompileContext) -> tuple[str, str]:
+        return f'{context.stacks.value}.__class__ is int', context.stacks.value
+
+    def _encode_json_format(self, _: Integer) -> typing.Callable[[typing.Any], str]:
+        return json_int
+
 
 visitor.register_encoder(IntegerEncoder)
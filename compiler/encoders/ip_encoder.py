@@ -0,0 +1,63 @@
+import ipaddress
+import typing
+from abc import ABC
+
+from marshmallow.fields import IP, IPv4, IPv6
+from marshmallow.utils import ensure_text_type
+
+from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor, Template, _F
+from ..utils.json_format import json_string
+
+
+_deserialize_template = '''
+try:
+    __ip = $deserialization_class($value if $value.__class__ is str else ensure_text_type($value))
+except (ValueError, TypeError) as __error:
+    raise $field.make_error("$error_key") from __error
+$set_result
+'''.strip()
+
+
+class BaseIPEncoder(FieldEncoder[_F], ABC):
+    _error_key = 'invalid_ip'
+    _default_deserialization_class = 'ip_address'
+
+    def _encode_deserialize(self, field: _F, context: CompileContext) -> EncodedReturn:
+        deserialization_class = field.DESERIALIZATION_CLASS or getattr(ipaddress, self._default_deserialization_class)
+        class_key = f'ipaddress_{deserialization_class.__name__}'
+        template = Template(_deserialize_template)
+        template.substitute_indented(set_result=self.set_result(context, '__ip'))
+        template.safe_substitute(deserialization_class=class_key,
+                                 error_key=self._error_key,
+                                 field=context.stacks.object,
+                                 value=context.stacks.value)
+        return EncodedReturn(code=str(template), locals_={
+            class_key: (deserialization_class,
+                        f'from {deserialization_class.__module__} import {deserialization_class.__name__} as {class_key}'),
+            'ensure_text_type': (ensure_text_type, 'from marshmallow.utils import ensure_text_type'),
+        })
+
+    def _encode_serialize(self, field: _F, context: CompileContext) -> EncodedReturn:
+        value = context.stacks.value
+        code = f'None if {value} is None else {value}.{"exploded" if field.exploded else "compressed"}'
+        return EncodedReturn(code=self.set_result(context, code))
+
+    def _encode_json_format(self, _: _F) -> typing.Callable[[typing.Any], str]:
+        return json_string
+
+
+class IPEncoder(BaseIPEncoder[IP]):
+    pass
+
+
+class IPv4Encoder(BaseIPEncoder[IPv4]):
+    pass
+
+
+class IPv6Encoder(BaseIPEncoder[IPv6]):
+    pass
+
+
+visitor.register_encoder(IPEncoder)
+visitor.register_encoder(IPv4Encoder)
+visitor.register_encoder(IPv6Encoder)
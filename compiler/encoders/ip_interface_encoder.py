@@ -0,0 +1,21 @@
+from marshmallow.fields import IPInterface, IPv4Interface, IPv6Interface
+
+from .ip_encoder import BaseIPEncoder, visitor
+
+
+class IPInterfaceEncoder(BaseIPEncoder[IPInterface]):
+    _error_key = 'invalid_ip_interface'
+    _default_deserialization_class = 'ip_interface'
+
+
+class IPv4InterfaceEncoder(BaseIPEncoder[IPv4Interface]):
+    _error_key = 'invalid_ip_interface'
+
+
+class IPv6InterfaceEncoder(BaseIPEncoder[IPv6Interface]):
+    _error_key = 'invalid_ip_interface'
+
+
+visitor.register_encoder(IPInterfaceEncoder)
+visitor.register_encoder(IPv4InterfaceEncoder)
+visitor.register_encoder(IPv6InterfaceEncoder)
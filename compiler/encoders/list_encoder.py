@@ -1,19 +1,119 @@
+import typing
+from array import array
+from itertools import chain
+from math import isfinite
+
+from marshmallow.exceptions import ValidationError
+from marshmallow.fields import Field, Float, Integer
 from marshmallow.utils import is_collection
+from marshmallow.validate import Range
 
 from .field_encoder import FieldEncoder, DeserializeArgs, SerializeArgs, CompileContext, EncodedReturn, visitor
+from ..utils.json_format import ITEM_SEPARATOR, JsonResult, json_value
 from ..utils.template import Template
 
 from marshmallow.fields import List
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+# array typecodes, numpy dtypes and the exact item types which convert without changing any value
+_numeric_fields = {
+    Float: ('d', 'float64', frozenset({float, int})),
+    Integer: ('q', 'int64', frozenset({int})),
+}
+_sequence_types = frozenset({list, tuple})
+
+
+def _numeric_values(value: typing.Any, depth: int, types: frozenset) -> bool:
+    if value.__class__ not in _sequence_types:
+        return False
+    for _ in range(depth - 1):
+        if not set(map(type, value)) <= _sequence_types:
+            return False
+        value = list(chain.from_iterable(value))
+    return set(map(type, value)) <= types
+
 
 _template = '''
 $validation_template
 $result = []
+$item_setup
 for $each in $value:
     $encoded_inner
 $set_result
 '''.strip()
 
+_deserialize_collect_template = '''
+$validation_template
+$result = []
+$item_setup
+$errors = {}
+$dropped = 0
+for $index, $each in enumerate($value):
+    try:
+        $encoded_inner
+    except ValidationError as __error:
+        # validators run after the value is appended
+        del $result[$index - $dropped:]
+        if __error.valid_data is not None:
+            $result.append(__error.valid_data)
+        else:
+            $dropped += 1
+        $errors[$index] = __error.messages
+if $errors:
+    raise ValidationError($errors, valid_data=$result)
+$set_result
+'''.strip()
+
+_serialize_template = '''
+if $value is None:
+    $set_none
+else:
+    $serialize
+'''.strip()
+
+# every item is written with a leading separator, the one of the first item is removed when closing
+_serialize_json_template = '''
+$open_array
+$start = len($parts)
+for $each in $value:
+    $encoded_inner
+if len($parts) > $start:
+    $parts[$start] = $parts[$start][$separator_length:]
+$parts.append(']')
+'''.strip()
+
+# numeric values are converted and checked at once, everything else takes the item by item path and its errors
+_deserialize_numeric_template = '''
+$numeric = None
+if numeric_values($value, $depth, $types):
+    try:
+        $numeric = $convert
+    except (OverflowError, ValueError):
+        $numeric = None
+    else:
+        if not ($checks):
+            $numeric = None
+if $numeric is None:
+    $deserialize_list
+    try:
+        $numeric = $convert_result
+    except (OverflowError, TypeError, ValueError):
+        $numeric = $result
+$set_result
+'''.strip()
+
+_serialize_numeric_template = '''
+if $value.__class__ is $array_type:
+    $set_list
+else:
+    $serialize
+'''.strip()
+
 _deserialize_validation_template = '''
 if not is_collection($value):
     raise $field.make_error("invalid")
@@ -21,54 +121,209 @@ if not is_collection($value):
 
 
 class ListEncoder(FieldEncoder[List]):
+    @staticmethod
+    def _numeric_lists(context: CompileContext) -> str:
+        mode = context.flags.numeric_lists
+        if mode not in ('', 'array', 'numpy'):
+            raise ValueError(f'Unknown numeric_lists mode: {mode}')
+        elif mode == 'numpy' and numpy is None:
+            raise ImportError('The numpy numeric_lists mode requires numpy')
+        return mode
+
+    @staticmethod
+    def _numeric_inner(lst: List, mode: str) -> tuple[Field, int] | None:
+        # numpy converts whole lists of lists, arrays only hold the innermost lists
+        inner, depth = lst.inner, 1
+        while mode == 'numpy' and type(inner) is List and not inner.validators:
+            inner, depth = inner.inner, depth + 1
+        if type(inner) not in _numeric_fields:
+            return None
+        return inner, depth
+
+    @staticmethod
+    def _encode_numeric_checks(inner: Field, context: CompileContext, mode: str, numeric: str,
+                               locals_: dict) -> str | None:
+        checks, ranges = [], []
+        for i, validator in enumerate(inner.validators):
+            if type(validator) is not Range:
+                return None
+            for value in (f'min({numeric})', f'max({numeric})') if mode == 'array' else (f'{numeric}.min()', f'{numeric}.max()'):
+                with context.stacks.scope(object=f'{context.stacks.object}.inner.validators[{i}]', value=value):
+                    encoded_condition = visitor.validate(validator, context)
+                ranges.append(encoded_condition.code)
+                locals_.update(encoded_condition.locals)
+
+        # a range compares minimum and maximum, which are only meaningful without nan
+        if type(inner) is Float and (not inner.allow_nan or ranges):
+            checks.append(f'isfinite(sum({numeric}))' if mode == 'array' else f'numpy.isfinite({numeric}).all()')
+        if ranges:
+            empty = f'len({numeric}) == 0' if mode == 'array' else f'{numeric}.size == 0'
+            checks.append(f'({empty} or {" and ".join(f"({r})" for r in ranges)})')
+        return ' and '.join(checks) or 'True'
+
     def _encode_deserialize(self, lst: List, context: CompileContext) -> EncodedReturn:
+        mode = self._numeric_lists(context)
+        numeric_inner = self._numeric_inner(lst, mode) if mode else None
+        if numeric_inner is None:
+            return self._encode_deserialize_items(lst, context, self.set_result)
+
+        inner, depth = numeric_inner
+        typecode, dtype, types = _numeric_fields[type(inner)]
+        result = f'result_{context.stacks.scope_counter}'
+        numeric = f'numeric_{context.stacks.scope_counter}'
+        locals_ = {}
+        checks = self._encode_numeric_checks(inner, context, mode, numeric, locals_)
+        if checks is None:
+            return self._encode_deserialize_items(lst, context, self.set_result)
+        encoded = self._encode_deserialize_items(lst, context, lambda _, v: f'{result} = {v}')
+        encoded.locals.update(locals_)
+
+        types_key = f'numeric_types_{dtype}'
+        encoded.locals.update({
+            'numeric_values': (_numeric_values, f'from {__name__} import _numeric_values as numeric_values'),
+            types_key: (types, f'frozenset({{{", ".join(sorted(t.__name__ for t in types))}}})'),
+            'isfinite': (isfinite, 'from math import isfinite'),
+        })
+        if mode == 'array':
+            encoded.locals['array'] = (array, 'from array import array')
+            convert = f"array('{typecode}', {{}})"
+        else:
+            encoded.locals['numpy'] = (numpy, 'import numpy')
+            convert = f'numpy.array({{}}, dtype=numpy.{dtype})'
+            checks = f'{numeric}.ndim == {depth} and {checks}'
+
+        template = Template(_deserialize_numeric_template)
+        template.substitute_indented(deserialize_list=encoded.code,
+                                     set_result=self.set_result(context, numeric))
+        template.safe_substitute(numeric=numeric,
+                                 value=context.stacks.value,
+                                 result=result,
+                                 depth=depth,
+                                 types=types_key,
+                                 convert=convert.format(context.stacks.value),
+                                 convert_result=convert.format(result),
+                                 checks=checks)
+        encoded.code = str(template)
+        return encoded
+
+    def _encode_deserialize_items(self, lst: List, context: CompileContext,
+                                  set_result: typing.Callable[[CompileContext, str], str]) -> EncodedReturn:
         result = f'result_{context.stacks.scope_counter}'
+        collect = context.flags.validate and context.flags.collect_errors
 
-        template = Template(_template)
+        template = Template(_deserialize_collect_template if collect else _template)
         template.substitute_indented(
             validation_template=_deserialize_validation_template if context.flags.validate else '',
-            set_result=self.set_result(context, result)
+            set_result=set_result(context, result)
         )
         template.safe_substitute(field=context.stacks.object,
                                  value=context.stacks.value,
-                                 result=result)
+                                 result=result,
+                                 errors=f'errors_{context.stacks.scope_counter}',
+                                 dropped=f'dropped_{context.stacks.scope_counter}',
+                                 index=f'index_{context.stacks.scope_counter}')
 
         with context.stacks.scope(DeserializeArgs(object=f'{context.stacks.object}.inner',
                                                   result=f'{result}[-1]',
                                                   set_result=lambda v: f'{result}.append({v})',
                                                   value=f'value_{context.stacks.scope_counter}',
-                                                  data_key=None)):  # TODO: data_key to list index
+                                                  data_key=None),  # TODO: data_key to list index
+                                  item_field=lst.inner,
+                                  item_setup=[]):
             encoded_inner = visitor.deserialize(lst.inner, context)
             template.safe_substitute(each=context.stacks.value,
                                      processed_inner=context.stacks.result)
-            template.substitute_indented(encoded_inner=encoded_inner.code)
+            template.substitute_indented(encoded_inner=encoded_inner.code,
+                                         item_setup='\n'.join(context.stacks.item_setup))
 
         return EncodedReturn(code=str(template),
                              locals_={
-                                 'is_collection': (is_collection, 'from extrap.marshmallow.utils import is_collection')
+                                 'is_collection': (is_collection, 'from marshmallow.utils import is_collection'),
+                                 'ValidationError': (ValidationError, 'from marshmallow.exceptions import ValidationError'),
                              },
                              encoded_returns=[encoded_inner])
 
-    def _encode_serialize(self, lst: List, context: CompileContext) -> EncodedReturn:
-        result = f'result_{context.stacks.scope_counter}'
+    def _encode_serialize_json(self, lst: List, context: CompileContext) -> EncodedReturn:
+        json_result: JsonResult = context.stacks.set_result
+        start = f'start_{context.stacks.scope_counter}'
+        format_key, format_local = self._json_format_local(visitor.json_format(lst.inner) or json_value)
 
-        template = Template(_template)
-        template.substitute_indented(validation_template='',
-                                     set_result=self.set_result(context, result))
+        template = Template(_serialize_json_template)
+        template.substitute_indented(open_array=json_result.append('['))
         template.safe_substitute(value=context.stacks.value,
-                                 result=result)
+                                 parts=json_result.parts,
+                                 start=start,
+                                 separator_length=len(ITEM_SEPARATOR))
 
         with context.stacks.scope(SerializeArgs(object=f'{context.stacks.object}.inner',
-                                                result=f'{result}[-1]',
-                                                set_result=lambda v: f'{result}.append({v})',
+                                                set_result=JsonResult(json_result.parts, ITEM_SEPARATOR, format_key),
                                                 value=f'value_{context.stacks.scope_counter}',
                                                 obj_key=None)):
             encoded_inner = visitor.serialize(lst.inner, context)
-            template.safe_substitute(each=context.stacks.value,
-                                     processed_inner=context.stacks.result)
+            template.safe_substitute(each=context.stacks.value)
             template.substitute_indented(encoded_inner=encoded_inner.code)
 
-        return EncodedReturn(code=str(template), encoded_returns=[encoded_inner])
+        return EncodedReturn(code=str(template),
+                             locals_={format_key: format_local},
+                             encoded_returns=[encoded_inner])
+
+    def _encode_serialize(self, lst: List, context: CompileContext) -> EncodedReturn:
+        if isinstance(context.stacks.get('set_result'), JsonResult):
+            encoded = self._encode_serialize_json(lst, context)
+        else:
+            result = f'result_{context.stacks.scope_counter}'
+
+            template = Template(_template)
+            template.substitute_indented(validation_template='',
+                                         item_setup='',
+                                         set_result=self.set_result(context, result))
+            template.safe_substitute(value=context.stacks.value,
+                                     result=result)
+
+            with context.stacks.scope(SerializeArgs(object=f'{context.stacks.object}.inner',
+                                                    result=f'{result}[-1]',
+                                                    set_result=lambda v: f'{result}.append({v})',
+                                                    value=f'value_{context.stacks.scope_counter}',
+                                                    obj_key=None)):
+                encoded_inner = visitor.serialize(lst.inner, context)
+                template.safe_substitute(each=context.stacks.value,
+                                         processed_inner=context.stacks.result)
+                template.substitute_indented(encoded_inner=encoded_inner.code)
+
+            encoded = EncodedReturn(code=str(template), encoded_returns=[encoded_inner])
+
+        mode = self._numeric_lists(context)
+        numeric_inner = self._numeric_inner(lst, mode) if mode else None
+        if numeric_inner is not None and not numeric_inner[0].as_string:
+            encoded.code = self._encode_serialize_numeric(context, mode, encoded)
+
+        template = Template(_serialize_template)
+        template.safe_substitute(value=context.stacks.value)
+        template.substitute_indented(set_none=self.set_result(context, 'None'),
+                                     serialize=encoded.code)
+        encoded.code = str(template)
+        return encoded
+
+    def _encode_serialize_numeric(self, context: CompileContext, mode: str, encoded: EncodedReturn) -> str:
+        set_list = context.stacks.get('set_result')
+        if isinstance(set_list, JsonResult):
+            format_key, encoded.locals[format_key] = self._json_format_local(json_value)
+            set_list = JsonResult(set_list.parts, set_list.prefix, format_key, set_list.prefix_is_literal)
+        else:
+            set_list = lambda v: self.set_result(context, v)
+
+        if mode == 'array':
+            encoded.locals['array'] = (array, 'from array import array')
+            array_type = 'array'
+        else:
+            encoded.locals['numpy'] = (numpy, 'import numpy')
+            array_type = 'numpy.ndarray'
+        template = Template(_serialize_numeric_template)
+        template.substitute_indented(set_list=set_list(f'{context.stacks.value}.tolist()'),
+                                     serialize=encoded.code)
+        template.safe_substitute(value=context.stacks.value,
+                                 array_type=array_type)
+        return str(template)
 
 
 visitor.register_encoder(ListEncoder)
@@ -1,3 +1,6 @@
+from marshmallow.exceptions import ValidationError
+from marshmallow.utils import missing
+
 from .field_encoder import FieldEncoder, DeserializeArgs, SerializeArgs, CompileContext, EncodedReturn, visitor
 from ..utils.template import Template
 
@@ -15,6 +18,32 @@ for $key, $val in $value.items():
 $set_result
 '''
 
+_deserialize_collect_template = '''
+$value = $input_value
+$validation_template
+
+$result = $mapping_type()
+$errors = {}
+for $key, $val in $value.items():
+    try:
+        $encoded_key
+    except ValidationError as __error:
+        $errors.setdefault($key, {})["key"] = __error.messages
+        $processed_key = missing
+    try:
+        $encoded_value
+    except ValidationError as __error:
+        $errors.setdefault($key, {})["value"] = __error.messages
+        if __error.valid_data is not None and $processed_key is not missing:
+            $result[$processed_key] = __error.valid_data
+    else:
+        if $processed_key is not missing:
+            $result[$processed_key] = $processed_value
+if $errors:
+    raise ValidationError($errors, valid_data=$result)
+$set_result
+'''
+
 _deserialize_validation_template = '''
 if not isinstance($value, Mapping):
     raise $field.make_error("invalid")
@@ -27,13 +56,15 @@ class MappingEncoder(FieldEncoder[Mapping]):
         return f'{mapping.mapping_type.__name__}_{abs(hash(mapping.mapping_type))}'
 
     def _encode(self, mapping: Mapping, context: CompileContext, visitor_fct, data_or_obj_key: str,
-                validate: bool) -> EncodedReturn:
+                validate: bool, collect: bool = False) -> EncodedReturn:
         encoded = []
         mapping_type_key = self._mapping_type_key(mapping)
         key = f'key_{context.stacks.scope_counter}'
         processed_key = f'evaluated_key_{context.stacks.scope_counter}'
         val = f'val_{context.stacks.scope_counter}'
+        processed_value = f'evaluated_val_{context.stacks.scope_counter}'
         result = f'result_{context.stacks.scope_counter}'
+        value_result = processed_value if collect else f'{result}[{processed_key}]'
 
         if not mapping_type_key and not mapping.mapping_type:
             template = Template(_deserialize_validation_template)
@@ -49,22 +80,22 @@ class MappingEncoder(FieldEncoder[Mapping]):
                     encoded_key = visitor_fct(mapping.key_field, context)
                     encoded.append(encoded_key)
             else:
-                encoded_key = EncodedReturn(code='')
+                encoded_key = EncodedReturn(code='pass' if collect else '')
                 processed_key = key
 
             if mapping.value_field is not None:
                 with context.stacks.scope({data_or_obj_key: None},
                                           object=f'{context.stacks.object}.value_field',
-                                          result=f'{result}[{processed_key}]',
+                                          result=value_result,
                                           set_result=None,
                                           value=val,
                                           data_key=None):
                     encoded_value = visitor_fct(mapping.value_field, context)
                     encoded.append(encoded_value)
             else:
-                encoded_value = EncodedReturn(code=f'{result}[{processed_key}] = {val}')
+                encoded_value = EncodedReturn(code=f'{value_result} = {val}')
 
-            template = Template(_template)
+            template = Template(_deserialize_collect_template if collect else _template)
             template.substitute_indented(
                 validation_template=_deserialize_validation_template if validate else '',
                 encoded_key=encoded_key.code,
@@ -77,15 +108,21 @@ class MappingEncoder(FieldEncoder[Mapping]):
                                  result=result,
                                  mapping_type=mapping_type_key,
                                  key=key,
-                                 val=val)
+                                 val=val,
+                                 processed_key=processed_key,
+                                 processed_value=processed_value,
+                                 errors=f'errors_{context.stacks.scope_counter}')
         template.substitute_indented(set_result=self.set_result(context, result))
 
-        return EncodedReturn(code=str(template),
-                             locals_={mapping_type_key: (mapping.mapping_type, mapping.mapping_type.__name__)},
-                             encoded_returns=encoded)
+        locals_ = {mapping_type_key: (mapping.mapping_type, f'from {mapping.mapping_type.__module__} import {mapping.mapping_type.__name__} as {mapping_type_key}')}
+        if collect:
+            locals_['ValidationError'] = (ValidationError, 'from marshmallow.exceptions import ValidationError')
+            locals_['missing'] = (missing, 'from marshmallow.utils import missing')
+        return EncodedReturn(code=str(template), locals_=locals_, encoded_returns=encoded)
 
     def _encode_deserialize(self, mapping: Mapping, context: CompileContext) -> EncodedReturn:
-        return self._encode(mapping, context, visitor.deserialize, 'data_key', context.flags.validate)
+        return self._encode(mapping, context, visitor.deserialize, 'data_key', context.flags.validate,
+                            context.flags.validate and context.flags.collect_errors)
 
     def _encode_serialize(self, mapping: Mapping, context: CompileContext) -> EncodedReturn:
         return self._encode(mapping, context, visitor.serialize, 'obj_key', False)
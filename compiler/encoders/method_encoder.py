@@ -0,0 +1,43 @@
+from marshmallow import missing
+
+from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor, Template
+
+from marshmallow.fields import Method
+
+
+_serialize_template = '''
+$value = $method($obj)
+if $value is not missing:
+    $set_result
+'''.strip()
+
+
+class MethodEncoder(FieldEncoder[Method]):
+    # the methods are bound to the schema when the field is bound, so they are captured once at compile time
+    def _encode_deserialize(self, method: Method, context: CompileContext) -> EncodedReturn:
+        if method._deserialize_method is None:
+            return EncodedReturn(code=self.set_result(context, context.stacks.value))
+
+        key = f'{method.__class__.__name__}_deserialize_{id(method)}'
+        return EncodedReturn(code=self.set_result(context, f'{key}({context.stacks.value})'),
+                             locals_={key: (method._deserialize_method, f'{context.stacks.object}._deserialize_method')})
+
+    def _encode_serialize(self, method: Method, context: CompileContext) -> EncodedReturn:
+        if method._serialize_method is None:
+            return EncodedReturn(code='pass')
+
+        key = f'{method.__class__.__name__}_serialize_{id(method)}'
+        value = f'value_{context.stacks.scope_counter}'
+        template = Template(_serialize_template)
+        template.substitute_indented(set_result=self.set_result(context, value))
+        template.safe_substitute(value=value,
+                                 method=key,
+                                 obj=context.stacks.obj)
+        return EncodedReturn(code=str(template),
+                             locals_={
+                                 key: (method._serialize_method, f'{context.stacks.object}._serialize_method'),
+                                 'missing': (missing, 'from marshmallow.utils import missing'),
+                             })
+
+
+visitor.register_encoder(MethodEncoder)
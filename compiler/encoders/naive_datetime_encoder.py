@@ -0,0 +1,16 @@
+from marshmallow.fields import NaiveDateTime
+
+from .datetime_encoder import BaseDateTimeEncoder, CompileContext, visitor, _deserialize_invalid_awareness_template
+
+
+class NaiveDateTimeEncoder(BaseDateTimeEncoder[NaiveDateTime]):
+    def _encode_aware(self, field: NaiveDateTime, context: CompileContext, locals_: dict) -> str:
+        if field.timezone is None:
+            return _deserialize_invalid_awareness_template
+        timezone_key = f'timezone_{id(field)}'
+        locals_[timezone_key] = (field.timezone, f'{context.stacks.object}.timezone')
+        return (f'{super()._encode_aware(field, context, locals_)}\n'
+                f'__datetime = __datetime.astimezone({timezone_key}).replace(tzinfo=None)')
+
+
+visitor.register_encoder(NaiveDateTimeEncoder)
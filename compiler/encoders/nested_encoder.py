@@ -1,17 +1,67 @@
-from .field_encoder import FieldEncoder, DeserializeArgs, SerializeArgs, CompileContext, EncodedReturn, visitor
+from marshmallow.utils import is_collection
+
+from .field_encoder import FieldEncoder, DeserializeArgs, SerializeArgs, CompileContext, EncodedReturn, visitor, Template
 
 from marshmallow.fields import Nested
 
 
+_deserialize_many_validation_template = '''
+if not is_collection($value):
+    raise $field.make_error("type", input=$value, type=$value.__class__.__name__)
+'''.strip()
+
+_serialize_template = '''
+if $value is None:
+    $set_none
+else:
+    $serialize
+'''.strip()
+
+
 class NestedEncoder(FieldEncoder[Nested]):
+    @staticmethod
+    def _many(nested: Nested) -> bool:
+        return bool(nested.many or nested.schema.many)
+
+    @staticmethod
+    def _lazy(nested: Nested, context: CompileContext) -> bool:
+        return bool(nested.metadata.get('lazy', context.flags.lazy_nested))
+
     def _encode_deserialize(self, nested: Nested, context: CompileContext) -> EncodedReturn:
-        with context.stacks.scope(DeserializeArgs(object=f'{context.stacks.object}.schema')):
-            return visitor.deserialize(nested.schema, context)
+        # like marshmallow, the collection check respects the field but loading only the schema's many option
+        lazy = self._lazy(nested, context)
+        reload = not lazy and context.stacks.get('reload_field') is nested
+        item = context.stacks.get('item_field') is nested
+        with context.stacks.scope(DeserializeArgs(object=f'{context.stacks.object}.schema', many=nested.schema.many),
+                                  nested_unknown=nested.unknown,
+                                  lazy_schema=nested.schema if lazy else None,
+                                  reload_schema=nested.schema if reload else None,
+                                  item_schema=nested.schema if item else None):
+            encoded = visitor.deserialize(nested.schema, context)
+        if self._many(nested):
+            template = Template(_deserialize_many_validation_template)
+            template.safe_substitute(field=context.stacks.object,
+                                     value=context.stacks.value)
+            encoded.code = f'{template}\n{encoded.code}'
+            encoded.locals['is_collection'] = (is_collection, 'from marshmallow.utils import is_collection')
+        return encoded
+
+    def _encode_load_shape(self, nested: Nested, context: CompileContext) -> tuple[str, str] | None:
+        if self._many(nested) or self._lazy(nested, context):
+            return None
+        return visitor.load_shape(nested.schema, context)
 
     def _encode_serialize(self, nested: Nested, context: CompileContext) -> EncodedReturn:
+        template = Template(_serialize_template)
+        template.substitute_indented(set_none=self.set_result(context, 'None'))
+        template.safe_substitute(value=context.stacks.value)
         with context.stacks.scope(SerializeArgs(object=f'{context.stacks.object}.schema',
-                                                obj=context.stacks.value)):
-            return visitor.serialize(nested.schema, context)
+                                                obj=context.stacks.value,
+                                                many=self._many(nested))):
+            encoded = visitor.serialize(nested.schema, context)
+        template.substitute_indented(serialize=encoded.code)
+        encoded.code = str(template)
+        return encoded
 
 
 visitor.register_encoder(NestedEncoder)
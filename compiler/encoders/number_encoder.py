@@ -5,7 +5,12 @@ from marshmallow.fields import Number
 
 _deserialize_template = '''
 $validation_template
-$set_result
+try:
+    $set_result
+except (TypeError, ValueError) as __error:
+    raise $field.make_error("invalid", input=$value) from __error
+except OverflowError as __error:
+    raise $field.make_error("too_large", input=$value) from __error
 '''.strip()
 
 _deserialize_validation_template = '''
@@ -19,10 +24,15 @@ class NumberEncoder(FieldEncoder[Number]):
     def _num_type_key(number: Number) -> str:
         return f'{number.num_type.__name__}_{abs(hash(number.num_type))}'
 
+    @staticmethod
+    def _num_type_import(number: Number) -> str:
+        num_type = number.num_type
+        return f'from {num_type.__module__} import {num_type.__name__} as {NumberEncoder._num_type_key(number)}'
+
     def _encode_deserialize(self, number: Number, context: CompileContext) -> EncodedReturn:
         num_type_key = self._num_type_key(number)
         
-        template = Template(_deserialize_template)
+        template = Template(_deserialize_template if context.flags.validate else '$set_result')
         template.substitute_indented(
             validation_template=_deserialize_validation_template if context.flags.validate else '',
             set_result=self.set_result(context, f'{num_type_key}({context.stacks.value})')
@@ -31,13 +41,13 @@ class NumberEncoder(FieldEncoder[Number]):
                                  value=context.stacks.value)
         
         return EncodedReturn(code=str(template),
-                             locals_={num_type_key: (number.num_type, number.num_type.__name__)})
+                             locals_={num_type_key: (number.num_type, self._num_type_import(number))})
 
     def _encode_serialize(self, number: Number, context: CompileContext) -> EncodedReturn:
         num_type_key = self._num_type_key(number)
         code = f'{num_type_key}({context.stacks.value})'
         return EncodedReturn(code=self.set_result(context, f'str({code})' if number.as_string else code),
-                             locals_={num_type_key: (number.num_type, number.num_type.__name__)})
+                             locals_={num_type_key: (number.num_type, self._num_type_import(number))})
 
 
 visitor.register_encoder(NumberEncoder)
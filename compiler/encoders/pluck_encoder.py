@@ -1,32 +1,193 @@
+from marshmallow.decorators import PRE_LOAD, POST_LOAD, VALIDATES, VALIDATES_SCHEMA, PRE_DUMP, POST_DUMP
+from marshmallow.error_store import ErrorStore
+from marshmallow.exceptions import ValidationError
+from marshmallow.utils import is_collection, set_value
+
 from .field_encoder import FieldEncoder, DeserializeArgs, SerializeArgs, CompileContext, EncodedReturn, visitor, Template
+from .schema_encoder import SchemaEncoder
+from ..utils.json_format import JsonResult, json_value
 
 from marshmallow.fields import Pluck
 
 
-class __DummyObject__:
-    def __init__(self, **kwargs):
-        for k, v in kwargs.items():
-            setattr(self, k, v)
+_deserialize_many_validation_template = '''
+if not is_collection($value):
+    raise $field.make_error("type", input=$value, type=$value.__class__.__name__)
+'''.strip()
+
+# the plucked field is loaded into a dict of its own like marshmallow's nested schema does
+_deserialize_template = '''
+$result = {}
+$deserialize_field
+$set_result
+'''.strip()
+
+_deserialize_collect_template = '''
+$result = {}
+try:
+    $deserialize_field
+except ValidationError as __error:
+    $result = {}
+    if __error.valid_data:
+        $set_valid_data
+    raise ValidationError({"$data_key": __error.messages}, valid_data=$result) from __error
+$set_result
+'''.strip()
+
+_deserialize_many_template = '''
+$results = []
+for $each in $value:
+    $result = {}
+    $deserialize_field
+    $results.append($result)
+$set_result
+'''.strip()
+
+_deserialize_collect_many_template = '''
+$results = []
+$error_store = ErrorStore()
+for $index, $each in enumerate($value):
+    $result = {}
+    try:
+        $deserialize_field
+    except ValidationError as __error:
+        $error_store.store_error(__error.messages, "$data_key", index=$error_index)
+        $result = {}
+        if __error.valid_data:
+            $set_valid_data
+    $results.append($result)
+if $error_store.errors:
+    raise ValidationError($error_store.errors, valid_data=$results)
+$set_result
+'''.strip()
+
+_serialize_template = '''
+if $value is None:
+    $set_none
+else:
+    $obj = $value
+    $object_kind
+    $serialize_field
+'''.strip()
+
+_serialize_many_template = '''
+if $value is None:
+    $set_none
+else:
+    $results = []
+    for $obj in $value:
+        $object_kind
+        $serialize_field
+    $set_result
+'''.strip()
+
+
+class PluckEncoder(FieldEncoder[Pluck]):
+    @staticmethod
+    def _compiles_load(pluck: Pluck) -> bool:
+        schema = pluck.schema
+        return (pluck.field_name in schema.load_fields and bool(pluck.many) == bool(schema.many)
+                and not (schema._has_processors(PRE_LOAD) or schema._has_processors(POST_LOAD)
+                         or schema._hooks[VALIDATES] or schema._has_processors(VALIDATES_SCHEMA)))
 
+    @staticmethod
+    def _compiles_dump(pluck: Pluck) -> bool:
+        schema = pluck.schema
+        return (pluck.field_name in schema.dump_fields and bool(pluck.many) == bool(schema.many)
+                and not (schema._has_processors(PRE_DUMP) or schema._has_processors(POST_DUMP)))
 
-class PluckEncoder(FieldEncoder[Pluck]):  # TODO: optimize
     def _encode_deserialize(self, pluck: Pluck, context: CompileContext) -> EncodedReturn:
-        with context.stacks.scope(DeserializeArgs(
-                object=f'{context.stacks.object}.schema',
-                value=f'{"{"}"{pluck._field_data_key}": {context.stacks.value}{"}"}'
-        )):
-            return visitor.deserialize(pluck.schema, context)
+        if not self._compiles_load(pluck):
+            code = f'{context.stacks.object}._deserialize({context.stacks.value}, None, None, partial={context.stacks.partial})'
+            return EncodedReturn(code=self.set_result(context, code))
+
+        collect = context.flags.validate and context.flags.collect_errors
+        field = pluck.schema.load_fields[pluck.field_name]
+        obj_key = field.attribute or pluck.field_name
+        result = f'result_{context.stacks.scope_counter}'
+        each = f'each_{context.stacks.scope_counter}'
+
+        if pluck.many:
+            template = Template(_deserialize_collect_many_template if collect else _deserialize_many_template)
+        else:
+            template = Template(_deserialize_collect_template if collect else _deserialize_template)
+        template.substitute_indented(set_result=self.set_result(context, f'results_{context.stacks.scope_counter}'
+                                                                if pluck.many else result),
+                                     set_valid_data=SchemaEncoder._deserialize_set_result(result, obj_key, '__error.valid_data'))
+        template.safe_substitute(value=context.stacks.value,
+                                 result=result,
+                                 results=f'results_{context.stacks.scope_counter}',
+                                 each=each,
+                                 index=f'index_{context.stacks.scope_counter}',
+                                 error_index=f'index_{context.stacks.scope_counter}' if pluck.schema.opts.index_errors else 'None',
+                                 error_store=f'error_store_{context.stacks.scope_counter}',
+                                 data_key=pluck._field_data_key)
+
+        with context.stacks.scope(DeserializeArgs(object=f'{context.stacks.object}.schema.load_fields["{pluck.field_name}"]',
+                                                  value=each if pluck.many else context.stacks.value,
+                                                  result=f'{result}["{obj_key}"]',
+                                                  set_result=lambda v: SchemaEncoder._deserialize_set_result(result, obj_key, v),
+                                                  data_key=None)):
+            encoded_field = visitor.deserialize(field, context)
+        template.substitute_indented(deserialize_field=encoded_field.code)
+
+        code = str(template)
+        if pluck.many:
+            validation = Template(_deserialize_many_validation_template)
+            validation.safe_substitute(field=context.stacks.object, value=context.stacks.value)
+            code = f'{validation}\n{code}'
+        return EncodedReturn(code=code,
+                             locals_={
+                                 'is_collection': (is_collection, 'from marshmallow.utils import is_collection'),
+                                 'ErrorStore': (ErrorStore, 'from marshmallow.error_store import ErrorStore'),
+                                 'ValidationError': (ValidationError, 'from marshmallow.exceptions import ValidationError'),
+                                 'set_value': (set_value, 'from marshmallow.utils import set_value'),
+                             },
+                             encoded_returns=[encoded_field])
 
     def _encode_serialize(self, pluck: Pluck, context: CompileContext) -> EncodedReturn:
-        set_result = Template(self.set_result(context, '$value'))
-        with context.stacks.scope(SerializeArgs(
-                object=f'{context.stacks.object}.schema',
-                obj=context.stacks.value,
-                set_result=lambda v: set_result.safe_substitute(value=f'{v}["{pluck._field_data_key}"]')
-        )):
-            encoded = visitor.serialize(pluck.schema, context)
-            encoded.locals['__DummyObject__'] = (__DummyObject__, f'from {__DummyObject__.__module__} import {__DummyObject__.__name__}')
-            return encoded
+        if not self._compiles_dump(pluck):
+            code = f'{context.stacks.object}._serialize({context.stacks.value}, None, None)'
+            return EncodedReturn(code=self.set_result(context, code))
+
+        schema = pluck.schema
+        field = schema.dump_fields[pluck.field_name]
+        obj_key = field.attribute or pluck.field_name
+        obj = f'obj_{context.stacks.scope_counter}'
+        results = f'results_{context.stacks.scope_counter}'
+        schema_object = f'{context.stacks.object}.schema'
+        field_object = f'{schema_object}.dump_fields["{pluck.field_name}"]'
+
+        template = Template(_serialize_many_template if pluck.many else _serialize_template)
+        template.substitute_indented(set_none=self.set_result(context, 'None'),
+                                     set_result=self.set_result(context, results))
+        template.safe_substitute(value=context.stacks.value,
+                                 obj=obj,
+                                 results=results)
+
+        locals_ = {}
+        if pluck.many:
+            set_result = lambda v: f'{results}.append({v})'
+        elif isinstance(context.stacks.get('set_result'), JsonResult):
+            json_result = context.stacks.set_result
+            format_key, locals_[format_key] = self._json_format_local(visitor.json_format(field) or json_value)
+            set_result = JsonResult(json_result.parts, json_result.prefix, format_key, json_result.prefix_is_literal)
+        else:
+            set_result = context.stacks.get('set_result')
+
+        with context.stacks.scope(SerializeArgs(object=field_object,
+                                                obj=obj,
+                                                value=SchemaEncoder._serialize_value(schema, field, schema_object,
+                                                                                     field_object, obj, obj_key),
+                                                set_result=set_result,
+                                                obj_key=obj_key),
+                                  # like marshmallow, an object without the plucked value raises a KeyError
+                                  missing_field=field,
+                                  serialize_missing=f'raise KeyError({pluck._field_data_key!r})'):
+            encoded_field = visitor.serialize(field, context)
+        template.substitute_indented(object_kind=SchemaEncoder._serialize_object_kind(encoded_field.code, obj),
+                                     serialize_field=encoded_field.code)
+        return EncodedReturn(code=str(template), locals_=locals_, encoded_returns=[encoded_field])
 
 
 visitor.register_encoder(PluckEncoder)
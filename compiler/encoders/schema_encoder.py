@@ -1,31 +1,68 @@
+import json
+import re
 import typing
 
 from marshmallow import ValidationError, INCLUDE, EXCLUDE, RAISE
 from marshmallow.decorators import PRE_LOAD, POST_LOAD, PRE_DUMP, POST_DUMP, VALIDATES, VALIDATES_SCHEMA
 from marshmallow.error_store import ErrorStore
+from marshmallow.fields import Field, Boolean, Float, Integer, List, Mapping as MappingField, Nested, Tuple
 from marshmallow.schema import Schema
-from marshmallow.utils import is_collection, set_value, missing
+from marshmallow.utils import is_collection, set_value, missing, _get_value_for_key
 
 from .visitor import Encoder, DeserializeArgs, SerializeArgs, CompileContext, EncodedReturn, visitor
+from ..utils.columns import ColumnarResult
+from ..utils.json_format import ITEM_SEPARATOR, KEY_SEPARATOR, JsonResult, json_value
+from ..utils.lazy import LazyNested
+from ..utils.load_statistics import data_path
+from ..utils.records import RECORD_KINDS, post_load_constructor, record_class, record_fields
+from ..utils.reload import previous_field, previous_value, reload_many, reload_nested
 from ..utils.template import Template
 
+
+def _sub_partial(partial, prefix: str):
+    if partial is True:
+        return True
+    return [f[len(prefix):] for f in partial if f.startswith(prefix)]
+
+
 _recursive_template = '''
 def $function_name($function_arguments):
     $function_body
 '''
 
+_deserialize_setup_template = '''
+__unknown_include = $unknown == INCLUDE
+__unknown_raise = $unknown == RAISE
+'''.strip()
+
+# hooks and their scaffolding are only emitted for schemas which have them, the original data is kept for pre_load
 _deserialize_template = '''
 $data = $input_data
 $partial = $input_partial
+$error_store_template
+$pre_processing_template
+
+$deserialize_data
+$restore_original_data_template
+$field_level_validation_template
+$schema_level_validation_template
+$check_errors_template
+$post_processing_template
 
-#$partial_is_collection = is_collection($partial)
+$set_result
+'''.strip()
 
+_deserialize_keep_original_data_template = '''
 $original_data = $data
 
 # pre processors
-$pre_processing_template
+$pre_processing
+'''.strip()
 
-$result = $dict_class()
+_deserialize_restore_original_data_template = '$data = $original_data'
+
+_deserialize_data_template = '''
+$create_result
 
 # validation
 $validation_template
@@ -33,28 +70,119 @@ $validation_template
 # deserialization
 $field_templates
 
-if unknown != EXCLUDE:
-    __unknown_fields = set($data) - $fields
-    if unknown == INCLUDE:
-        for __key in __unknown_fields:
-            $result[__key] = $data[__key]
-    elif __unknown_fields and unknown == RAISE:
-        raise ValidationError(f'{$schema.error_messages["unknown"]}: {__unknown_fields}', str(__unknown_fields))
+$unknown_template
+$construct_result
+'''.strip()
 
-$data = $original_data
+# the guard checks exact builtin types and all keys once per record, a miss is counted on the schema
+_deserialize_shape_template = '''
+if $guard:
+    $result = $shape_result
+else:
+    $schema.shape_guard_misses += 1
+    $deserialize_data
+'''.strip()
 
-# field level validation
-$field_level_validation_template
+_deserialize_statistics_template = '$statistics.observe($data)'
 
-# schema level validation
-$schema_level_validation_template
+_deserialize_collect_data_template = '''
+$create_result
+if not isinstance($data, Mapping):
+    $error_store.store_error([$schema.error_messages["type"]], index=$index)
+else:
+    # deserialization
+    $field_templates
 
-# post processors
-$post_processing_template
+    $unknown_template
+$construct_result
+'''.strip()
+
+_deserialize_create_result_template = '$result = $dict_class()'
+
+# the field values of records are kept in locals, the record is constructed from them once all fields are loaded
+_deserialize_record_unknown_include_template = '''
+if set($data) - $fields:
+    raise ValueError('Record results can not include unknown fields')
+'''.strip()
+
+# the unknown option of nested schemas is known at compile time, only the first schema decides at runtime
+_deserialize_unknown_template = '''
+if __unknown_include:
+    $unknown_include
+elif __unknown_raise:
+    $unknown_raise
+'''.strip()
 
+_deserialize_unknown_include_template = '''
+for __key in set($data) - $fields:
+    $result[__key] = $data[__key]
+'''.strip()
+
+_deserialize_unknown_raise_template = '''
+__unknown_fields = set($data) - $fields
+if __unknown_fields:
+    raise ValidationError(f'{$schema.error_messages["unknown"]}: {__unknown_fields}', str(__unknown_fields))
+'''.strip()
+
+_deserialize_collect_unknown_raise_template = '''
+for __key in set($data) - $fields:
+    $error_store.store_error([$schema.error_messages["unknown"]], __key, index=$index)
+'''.strip()
+
+# without collected errors and validators nothing is ever stored, so the error store is left out
+_deserialize_error_store_template = '$error_store = ErrorStore()'
+
+_deserialize_check_errors_template = '''
+if $error_store.errors:
+    $raise_errors
+'''.strip()
+
+# the error store of list items is created once before the list loop, errors handed to an exception are replaced
+_deserialize_check_hoisted_errors_template = '''
+if $error_store.errors:
+    __errors, $error_store.errors = $error_store.errors, {}
+    $raise_errors
+'''.strip()
+
+_deserialize_recursive_many_template = '''
+$result = []
+for $item in $value:
+    $result.append($function($item, $partial))
 $set_result
 '''.strip()
 
+_deserialize_collect_recursive_many_template = '''
+$result = []
+$error_store = ErrorStore()
+for $index, $item in enumerate($value):
+    try:
+        $result.append($function($item, $partial))
+    except ValidationError as __error:
+        $error_store.store_error(__error.messages, index=$error_index)
+        $result.append(__error.valid_data)
+if $error_store.errors:
+    raise ValidationError($error_store.errors, valid_data=$result)
+$set_result
+'''.strip()
+
+_deserialize_many_template = '''
+$validation_template
+$result = []
+for $item_data in $data:
+    $deserialize_item
+    $result.append($item_result)
+'''.strip()
+
+_deserialize_collect_many_template = '''
+$result = []
+if not is_collection($data):
+    $error_store.store_error([$schema.error_messages["type"]])
+else:
+    for $index, $item_data in enumerate($data):
+        $deserialize_item
+        $result.append($item_result)
+'''.strip()
+
 _deserialize_pre_processing_template = '''
 $data = $schema._invoke_load_processors(PRE_LOAD, $data, many=$many, original_data=$data, partial=$partial)
 '''.strip()
@@ -64,44 +192,128 @@ if not isinstance($data, Mapping):
     raise ValidationError($schema.error_messages["type"])  # TODO: better error message
 '''.strip()
 
+_deserialize_many_validation_template = '''
+if not is_collection($data):
+    raise ValidationError($schema.error_messages["type"])
+'''.strip()
+
 _deserialize_field_template = '''
 # deserialize $field_comment
 $deserialize_field
 '''.strip()
 
+_deserialize_collect_field_template = '''
+# deserialize $field_comment
+try:
+    $deserialize_field
+except ValidationError as __error:
+    $error_store.store_error(__error.messages, "$data_key", index=$index)
+    $discard_result
+    if __error.valid_data:
+        $set_valid_data
+'''.strip()
+
 _deserialize_field_level_validation_template = '''
-self._invoke_field_validators(error_store=__error_store, data=$result, many=$many)
-if __error_store.errors:
-    raise ValidationError(__error_store.errors, data=$original_data, valid_data=$result)
+# field level validation
+$schema._invoke_field_validators(error_store=$error_store, data=$result, many=$many)
 '''.strip()
 
 _deserialize_schema_level_validation_template = '''
+# schema level validation
+__field_errors = bool($error_store.errors)
 $schema._invoke_schema_validators(
-    error_store=__error_store,
+    error_store=$error_store,
     pass_many=True,
     data=$result,
     original_data=$original_data,
     many=$many,
     partial=$partial,
-    field_errors=False,
+    field_errors=__field_errors,
 )
 $schema._invoke_schema_validators(
-    error_store=__error_store,
+    error_store=$error_store,
     pass_many=False,
     data=$result,
     original_data=$original_data,
     many=$many,
     partial=$partial,
-    field_errors=False,
+    field_errors=__field_errors,
 )
-if __error_store.errors:
-    raise ValidationError(__error_store.errors, data=$data, valid_data=$result)
+'''.strip()
+
+_deserialize_raise_errors_template = '''
+__exception = ValidationError($errors, data=$original_data, valid_data=$valid_data)
+$handle_error
+raise __exception
+'''.strip()
+
+_deserialize_handle_error_template = '$schema.handle_error(__exception, $original_data, many=$many, partial=$partial)'
+
+_deserialize_collect_pre_processing_template = '''
+try:
+    $pre_processing
+except ValidationError as __error:
+    $raise_errors
+'''.strip()
+
+_deserialize_collect_post_processing_template = '''
+try:
+    $post_processing
+except ValidationError as __error:
+    $raise_errors
 '''.strip()
 
 _deserialize_post_processing_template = '''
+# post processors
 $result = $schema._invoke_load_processors(POST_LOAD, $result, many=$many, original_data=$original_data, partial=$partial)
 '''.strip()
 
+_deserialize_fused_post_processing_template = '''
+# post processors
+$result = $constructor(**$result)
+'''.strip()
+
+_deserialize_fused_many_post_processing_template = '''
+# post processors
+$result = [$constructor(**__item) for __item in $result]
+'''.strip()
+
+
+# the record values are kept in locals and appended to one list per field, no dict is created per record
+_deserialize_columns_template = '''
+$unknown = $unknown or $schema.unknown
+if $unknown == INCLUDE:
+    raise ValueError('Columnar loads can not include unknown fields')
+__unknown_raise = $unknown == RAISE
+$error_store = ErrorStore()
+$create_columns
+if not is_collection($many_data):
+    $invalid_data
+else:
+    for $index, $data in enumerate($many_data):
+        $reset_values
+        if not isinstance($data, Mapping):
+            $invalid_item
+        else:
+            $field_templates
+
+            if __unknown_raise:
+                $unknown_template
+        $append_columns
+$result = ColumnarResult.from_lists($names, ($columns,), ($masks,), $numeric, kind)
+if $error_store.errors:
+    $raise_errors
+'''.strip()
+
+_deserialize_columns_invalid_template = 'raise ValidationError($schema.error_messages["type"])'
+
+_deserialize_collect_columns_invalid_template = '$error_store.store_error([$schema.error_messages["type"]], index=$error_index)'
+
+_deserialize_collect_columns_invalid_data_template = '$error_store.store_error([$schema.error_messages["type"]])'
+
+# the array typecodes and numpy dtypes of the columns of these fields, boolean arrays hold 0 and 1
+_numeric_columns = {Float: ('d', 'float64'), Integer: ('q', 'int64'), Boolean: ('b', 'bool')}
+
 
 _serialize_template = '''
 $obj = $input_obj
@@ -109,9 +321,7 @@ $obj = $input_obj
 $original_obj = $obj
 $pre_processing_template
 
-$result = $dict_class()
-
-$field_templates
+$serialize_data
 
 $obj = $original_obj
 $post_processing_template
@@ -119,6 +329,20 @@ $post_processing_template
 $set_result
 '''.strip()
 
+_serialize_data_template = '''
+$object_kind
+$result = $dict_class()
+
+$field_templates
+'''.strip()
+
+_serialize_many_template = '''
+$result = []
+for $item_obj in $obj:
+    $serialize_item
+    $result.append($item_result)
+'''.strip()
+
 _serialize_pre_processing_template = '''
 $obj = $schema._invoke_dump_processors(PRE_DUMP, $obj, many=$many, original_data=$obj)
 '''.strip()
@@ -127,11 +351,47 @@ _serialize_post_processing_template = '''
 $result = $schema._invoke_dump_processors(POST_DUMP, $result, many=$many, original_data=$obj)
 '''.strip()
 
+# the kind of the object decides once how all its fields are accessed
+_serialize_object_kind_template = '''
+$obj_is_dict = $obj.__class__ is dict
+$obj_is_object = not $obj_is_dict and not hasattr($obj, "__getitem__")
+'''.strip()
+
 _serialize_field_template = '''
 # serialize $field_comment
 $serialize_field
 '''.strip()
 
+_serialize_json_template = '''
+$obj = $input_obj
+$pre_processing_template
+
+$serialize_data
+'''.strip()
+
+# every member is written with a leading separator, the one of the first member is removed when closing
+_serialize_json_data_template = '''
+$object_kind
+$open_object
+$start = len($parts)
+
+$field_templates
+
+if len($parts) > $start:
+    $parts[$start] = $parts[$start][$separator_length:]
+$parts.append('}')
+'''.strip()
+
+_serialize_json_many_template = '''
+$open_array
+$start = len($parts)
+for $item_obj in $obj:
+    $serialize_item
+if len($parts) > $start:
+    $parts[$start] = $parts[$start][$separator_length:]
+$parts.append(']')
+'''.strip()
+
 
 class SchemaEncoder(Encoder[Schema]):
     @staticmethod
@@ -152,100 +412,542 @@ class SchemaEncoder(Encoder[Schema]):
             return f'set_value({result}, {obj_key}, {value})'
         return f'{result}["{obj_key}"] = {value}'
 
+    @staticmethod
+    def _fields_key(schema: Schema) -> str:
+        return f'fields_{SchemaEncoder._schema_key(schema)}'
+
+    @staticmethod
+    def _raise_errors(schema: Schema, errors: str, valid_data: str) -> str:
+        template = Template(_deserialize_raise_errors_template)
+        template.substitute_indented(
+            handle_error=_deserialize_handle_error_template if type(schema).handle_error is not Schema.handle_error else ''
+        )
+        template.safe_substitute(errors=errors, valid_data=valid_data)
+        return str(template)
+
+    @staticmethod
+    def _encode_unknown(unknown: str | None, collect: bool, unknown_include: str = _deserialize_unknown_include_template) -> str:
+        unknown_raise = _deserialize_collect_unknown_raise_template if collect else _deserialize_unknown_raise_template
+        if unknown is None:
+            template = Template(_deserialize_unknown_template)
+            template.substitute_indented(unknown_include=unknown_include,
+                                         unknown_raise=unknown_raise)
+            return str(template)
+        elif unknown == INCLUDE:
+            return unknown_include
+        elif unknown == RAISE:
+            return unknown_raise
+        return ''
+
+    @staticmethod
+    def _record_kind(schema: Schema, context: CompileContext) -> str:
+        kind = context.flags.record_results
+        if kind and kind not in RECORD_KINDS:
+            raise ValueError(f'Unknown record_results kind: {kind}')
+        # hooks get the loaded data and may expect a dict
+        if (not kind or schema._has_processors(POST_LOAD) or schema._hooks[VALIDATES]
+                or schema._has_processors(VALIDATES_SCHEMA) or record_fields(schema) is None):
+            return ''
+        return kind
+
+    @staticmethod
+    def _record_class_key(schema: Schema) -> str:
+        return f'record_{SchemaEncoder._schema_key(schema)}'
+
+    @staticmethod
+    def _construct_record(schema: Schema, kind: str, values: typing.Iterable[str]) -> str:
+        record = SchemaEncoder._record_class_key(schema)
+        if kind == 'tuple':
+            # tuple.__new__ skips the python level __new__ of the named tuple
+            return f'tuple_new({record}, ({"".join(f"{v}, " for v in values)}))'
+        return f'{record}({", ".join(values)})'
+
+    @staticmethod
+    def _assign_record(schema: Schema, kind: str, values: dict[str, str]) -> str:
+        if kind == 'tuple':
+            return f'$result = {SchemaEncoder._construct_record(schema, kind, values.values())}'
+        # setting the slots directly is faster than calling the python level __init__
+        return '\n'.join([f'$result = object_new({SchemaEncoder._record_class_key(schema)})',
+                          *[f'$result.{obj_key} = {v}' for obj_key, v in values.items()]])
+
+    @staticmethod
+    def _record_locals(schema: Schema, kind: str) -> dict[str, tuple[typing.Any, str]]:
+        record_locals = {
+            SchemaEncoder._record_class_key(schema): (record_class(schema, kind),
+                                                      f'record_class({SchemaEncoder._schema_key(schema)}, {kind!r})'),
+            'record_class': (record_class, f'from {record_class.__module__} import record_class'),
+        }
+        if kind == 'tuple':
+            record_locals['tuple_new'] = (tuple.__new__, 'tuple.__new__')
+        else:
+            record_locals['object_new'] = (object.__new__, 'object.__new__')
+        return record_locals
+
+    @staticmethod
+    def _lazy_locals() -> dict[str, tuple[typing.Any, str]]:
+        return {'LazyNested': (LazyNested, f'from {LazyNested.__module__} import LazyNested')}
+
+    @staticmethod
+    def _reload_locals() -> dict[str, tuple[typing.Any, str]]:
+        return {f.__name__: (f, f'from {f.__module__} import {f.__name__}')
+                for f in (previous_field, previous_value, reload_many, reload_nested)}
+
+    @staticmethod
+    def _function_arguments(context: CompileContext) -> str:
+        # reload functions also get the previous data and result, recursive calls without them load everything
+        if context.stacks.get('reload'):
+            return f'{context.stacks.value}, {context.stacks.partial}, input_previous_data=missing, input_previous_result=missing'
+        return f'{context.stacks.value}, {context.stacks.partial}'
+
+    def _encode_deserialize_reload_many(self, schema: Schema, context: CompileContext) -> EncodedReturn:
+        with context.stacks.scope(many=False):
+            encoded_item = self._encode_deserialize(schema, context)
+        collect = context.flags.validate and context.flags.collect_errors
+        arguments = ', '.join([self._recursive_function_name(schema), context.stacks.value, context.stacks.partial,
+                               context.stacks.previous_value, context.stacks.previous_field,
+                               str(schema.opts.index_errors), str(collect)])
+        return EncodedReturn(code=self.set_result(context, f'reload_many({arguments})'),
+                             locals_=self._reload_locals(),
+                             encoded_returns=[encoded_item])
+
+    def _encode_deserialize_lazy_many(self, schema: Schema, context: CompileContext) -> EncodedReturn:
+        # the item function is compiled like the one of a recursive schema, the whole list is loaded on first access
+        with context.stacks.scope(many=False):
+            encoded_item = self._encode_deserialize(schema, context)
+        function = f'{self._recursive_function_name(schema)}_many'
+        with context.stacks.scope(value='input_data', partial='input_partial', set_result=lambda v: f'return {v}'):
+            function_body = self._encode_deserialize_recursive_many(schema, context)
+        template = Template(_recursive_template)
+        template.safe_substitute(function_name=function, function_arguments='input_data, input_partial')
+        template.substitute_indented(function_body=function_body)
+        return EncodedReturn(
+            code=self.set_result(context, f'LazyNested({function}, {context.stacks.value}, {context.stacks.partial})'),
+            definitions=[str(template)],
+            locals_={
+                **self._lazy_locals(),
+                'ErrorStore': (ErrorStore, 'from marshmallow.error_store import ErrorStore'),
+                'ValidationError': (ValidationError, 'from marshmallow.exceptions import ValidationError'),
+            },
+            encoded_returns=[encoded_item]
+        )
+
+    def _encode_deserialize_recursive_many(self, schema: Schema, context: CompileContext) -> str:
+        collect = context.flags.validate and context.flags.collect_errors
+        template = Template(_deserialize_collect_recursive_many_template if collect
+                            else _deserialize_recursive_many_template)
+        template.substitute_indented(set_result=self.set_result(context, f'result_{context.stacks.scope_counter}'))
+        template.safe_substitute(function=self._recursive_function_name(schema),
+                                 value=context.stacks.value,
+                                 partial=context.stacks.partial,
+                                 result=f'result_{context.stacks.scope_counter}',
+                                 error_store=f'error_store_{context.stacks.scope_counter}',
+                                 index=f'index_{context.stacks.scope_counter}',
+                                 error_index=f'index_{context.stacks.scope_counter}' if schema.opts.index_errors else 'None',
+                                 item=f'item_{context.stacks.scope_counter}')
+        return str(template)
+
+    def _encode_load_shape(self, schema: Schema, context: CompileContext) -> tuple[str, str] | None:
+        if (schema.dict_class is not dict or schema._has_processors(PRE_LOAD) or schema._has_processors(POST_LOAD)
+                or schema._hooks[VALIDATES] or schema._has_processors(VALIDATES_SCHEMA)
+                or any(schema.__class__ == s.__class__ for s in context.stacks.retrieve('shape_schema', []))):
+            return None
+
+        value = context.stacks.value
+        guards = [f'{value}.__class__ is dict', f'{value}.keys() == {self._fields_key(schema)}']
+        items = []
+        with context.stacks.scope(shape_schema=schema):
+            for attr_name, field in schema.load_fields.items():
+                obj_key = field.attribute or attr_name
+                if '.' in obj_key:
+                    return None
+                with context.stacks.scope(value=f'{value}["{visitor.name(field, attr_name)}"]'):
+                    shape = visitor.load_shape(field, context)
+                if shape is None:
+                    return None
+                guards.append(shape[0])
+                items.append((obj_key, shape[1]))
+        record_kind = self._record_kind(schema, context)
+        if record_kind:
+            return ' and '.join(guards), self._construct_record(schema, record_kind, [v for _, v in items])
+        return ' and '.join(guards), f'{{{", ".join(f"{k!r}: {v}" for k, v in items)}}}'
+
+    def _encode_deserialize_fields(self, schema: Schema, context: CompileContext, collect: bool, partial_load: bool,
+                                   schema_locals: dict, field_result: typing.Callable[[str], str],
+                                   set_field: typing.Callable[[str, str], str], discard_field: typing.Callable[[str], str],
+                                   reload: bool = False) -> tuple[str, list[str], list[EncodedReturn], set[str]]:
+        field_code = ''
+        deserialize_templates = []
+        data_keys = set()
+        encoded_fields = []
+        partial = context.stacks.partial
+        sub_partial = f'sub_partial_{context.stacks.scope_counter}'
+        for attr_name, field in schema.load_fields.items():
+            data_key = visitor.name(field, attr_name)
+            obj_key = field.attribute or attr_name
+
+            data_keys.add(data_key)
+
+            # partial loads skip missing fields by attribute name, but nested fields get the prefix of the data key
+            partial_args = {}
+            if partial_load:
+                partial_args = {'partial': sub_partial, 'partial_skip': f'{partial} is True or "{attr_name}" in {partial}'}
+            # the previous data and result of this schema only hold the fields without pre and post processors
+            reload_args = {}
+            if reload:
+                reload_args = {
+                    'reload_field': field,
+                    'previous_value': 'missing' if schema._has_processors(PRE_LOAD)
+                    else f'previous_value($input_previous_data, "{data_key}")',
+                    'previous_field': 'missing' if '.' in obj_key or schema._has_processors(POST_LOAD)
+                    else f'previous_field($input_previous_result, "{obj_key}")',
+                }
+            with context.stacks.scope(DeserializeArgs(
+                    object=f'{context.stacks.object}.load_fields["{attr_name}"]',
+                    value=f'{context.stacks.data}["{data_key}"]',
+                    result=field_result(obj_key),
+                    set_result=lambda v, obj_key=obj_key: set_field(obj_key, v),
+                    data_key=data_key
+            ), **partial_args, **reload_args):
+                encoded_field = visitor.deserialize(field, context)
+                encoded_fields.append(encoded_field)
+
+            if partial_load and re.search(fr'\b{sub_partial}\b', encoded_field.code):
+                encoded_field.code = f'{sub_partial} = sub_partial({partial}, {data_key + "."!r})\n{encoded_field.code}'
+                schema_locals['sub_partial'] = (_sub_partial, f'from {__name__} import _sub_partial as sub_partial')
+
+            comment = f'''{'.'.join([n for n in context.stacks.retrieve("data_key", []) if n] + [data_key])}'''
+
+            field_template = Template(_deserialize_collect_field_template if collect else _deserialize_field_template)
+            # validators run after the value is set, an invalid value must not end up in the valid data
+            field_template.substitute_indented(
+                discard_result=discard_field(obj_key),
+                set_valid_data=set_field(obj_key, '__error.valid_data')
+            )
+            field_template.safe_substitute(field_comment=comment,
+                                           data=context.stacks.data,
+                                           data_key=data_key,
+                                           obj_key=obj_key,
+                                           deserialize_field=f'$deserialize_field_{len(deserialize_templates)}')
+
+            deserialize_templates.append(encoded_field.code.strip())
+
+            field_code += '\n\n' + str(field_template)
+        return field_code, deserialize_templates, encoded_fields, data_keys
+
+    @staticmethod
+    def _columns_supported(schema: Schema) -> bool:
+        # only flat records without hooks, which could expect a dict per record
+        return not (schema._has_processors(PRE_LOAD) or schema._has_processors(POST_LOAD)
+                    or schema._hooks[VALIDATES] or schema._has_processors(VALIDATES_SCHEMA)
+                    or any(isinstance(f, (Nested, List, Tuple, MappingField)) for f in schema.load_fields.values()))
+
+    def _encode_deserialize_columns(self, schema: Schema, context: CompileContext) -> EncodedReturn | None:
+        if not self._columns_supported(schema):
+            return None
+
+        collect = context.flags.validate and context.flags.collect_errors
+        schema_locals = {}
+        obj_keys = [field.attribute or attr_name for attr_name, field in schema.load_fields.items()]
+        column_values = {obj_key: f'column_value_{i}' for i, obj_key in enumerate(obj_keys)}
+        columns = [f'column_{i}' for i in range(len(obj_keys))]
+        masks = [f'mask_{i}' for i in range(len(obj_keys))]
+        error_store = f'error_store_{context.stacks.scope_counter}'
+        index = f'index_{context.stacks.scope_counter}'
+        with context.stacks.scope(DeserializeArgs(object=self._schema_key(schema),
+                                                  data=f'data_{context.stacks.scope_counter}',
+                                                  partial='None',
+                                                  value=f'value_{context.stacks.scope_counter}',
+                                                  result=f'result_{context.stacks.scope_counter}',
+                                                  many=False),
+                                  schema=schema):
+            field_code, deserialize_templates, encoded_fields, data_keys = self._encode_deserialize_fields(
+                schema, context, collect, False, schema_locals,
+                lambda obj_key: column_values[obj_key],
+                lambda obj_key, v: f'{column_values[obj_key]} = {v}',
+                lambda obj_key: f'{column_values[obj_key]} = missing'
+            )
+
+            template = Template(_deserialize_columns_template)
+            template.substitute_indented(
+                create_columns='\n'.join([f'{c} = []' for c in columns] + [f'{m} = bytearray()' for m in masks]),
+                invalid_data=_deserialize_collect_columns_invalid_data_template if collect else _deserialize_columns_invalid_template,
+                invalid_item=_deserialize_collect_columns_invalid_template if collect else _deserialize_columns_invalid_template,
+                reset_values=f'{" = ".join(column_values.values())} = missing' if column_values else '',
+                field_templates=field_code.strip(),
+                unknown_template=self._encode_unknown(RAISE, collect),
+                append_columns='\n'.join(f'{c}.append({v})\n{m}.append({v} is not missing)'
+                                          for c, m, v in zip(columns, masks, column_values.values())),
+                raise_errors=self._raise_errors(schema, f'{error_store}.errors', '$result')
+            )
+            template.substitute_indented({f'deserialize_field_{i}': t for i, t in enumerate(deserialize_templates)})
+            numeric = {obj_key: _numeric_columns[type(field)] for obj_key, field in zip(obj_keys, schema.load_fields.values())
+                       if type(field) in _numeric_columns}
+            template.safe_substitute(schema=context.stacks.object,
+                                     unknown=context.stacks.unknown,
+                                     many_data=context.stacks.retrieve('value')[-2],
+                                     data=context.stacks.data,
+                                     original_data=context.stacks.retrieve('value')[-2],
+                                     result='result',
+                                     fields=self._fields_key(schema),
+                                     error_store=error_store,
+                                     index=index,
+                                     error_index=index if schema.opts.index_errors else 'None',
+                                     names=repr(tuple(obj_keys)),
+                                     columns=', '.join(columns),
+                                     masks=', '.join(masks),
+                                     numeric=repr(numeric),
+                                     many='True',
+                                     partial='None')
+            schema_locals[context.stacks.object] = (schema, context.stacks.retrieve('object')[-2])
+
+        schema_locals[self._fields_key(schema)] = (frozenset(data_keys), f'frozenset({sorted(data_keys)})')
+        schema_locals.update({
+            'ColumnarResult': (ColumnarResult, f'from {ColumnarResult.__module__} import ColumnarResult'),
+            'ErrorStore': (ErrorStore, 'from marshmallow.error_store import ErrorStore'),
+            'Mapping': (typing.Mapping, 'from typing import Mapping'),
+            'ValidationError': (ValidationError, 'from marshmallow.exceptions import ValidationError'),
+            'missing': (missing, 'from marshmallow.utils import missing'),
+            'is_collection': (is_collection, 'from marshmallow.utils import is_collection'),
+            'RAISE': (RAISE, 'from marshmallow.utils import RAISE'),
+            'INCLUDE': (INCLUDE, 'from marshmallow.utils import INCLUDE'),
+        })
+        return EncodedReturn(code=str(template), locals_=schema_locals, encoded_returns=encoded_fields)
+
     def _encode_deserialize(self, schema: Schema, context: CompileContext) -> EncodedReturn:
         first_schema = len(context.stacks.retrieve('schema', [])) == 0
+        many = context.stacks.get('many', False)
+        collect = context.flags.validate and context.flags.collect_errors
+        partial_load = context.stacks.get('partial_load', False)
         recursive = next((
             s for s in context.stacks.retrieve('schema', [])
             if schema.__class__ == s.__class__ and schema.load_fields.keys() == s.load_fields.keys()
         ), None)
+        lazy = context.stacks.get('lazy_schema') is schema
+        reload = context.stacks.get('reload_schema') is schema
+        item = context.stacks.get('item_schema') is schema
         if recursive:
+            if many and lazy:
+                return self._encode_deserialize_lazy_many(recursive, context)
+            elif many and reload:
+                return self._encode_deserialize_reload_many(recursive, context)
+            elif many:
+                return EncodedReturn(self._encode_deserialize_recursive_many(recursive, context), recurse={recursive})
             function = self._recursive_function_name(recursive)
             arguments = f'{context.stacks.value}, {context.stacks.partial}'
-            return EncodedReturn(context.stacks.set_result(f'{function}({arguments})'), recurse={recursive})
+            if lazy:
+                return EncodedReturn(self.set_result(context, f'LazyNested({function}, {arguments})'),
+                                     locals_=self._lazy_locals(), recurse={recursive})
+            elif reload:
+                arguments += f', {context.stacks.previous_value}, {context.stacks.previous_field}'
+                return EncodedReturn(self.set_result(context, f'reload_nested({function}, {arguments})'),
+                                     locals_=self._reload_locals(), recurse={recursive})
+            return EncodedReturn(self.set_result(context, f'{function}({arguments})'), recurse={recursive})
+        elif lazy and many:
+            return self._encode_deserialize_lazy_many(schema, context)
+        elif reload and many:
+            return self._encode_deserialize_reload_many(schema, context)
 
         schema_locals = {}
+        statistics_path = data_path(context.stacks.retrieve('data_key', []))
         result = f'result_{context.stacks.scope_counter}'
+        many_data = f'many_data_{context.stacks.scope_counter}'
+        many_result = f'many_result_{context.stacks.scope_counter}'
+        error_store = f'error_store_{context.stacks.scope_counter}'
+        many_index = f'index_{context.stacks.scope_counter}'
+        index = many_index if many and schema.opts.index_errors else 'None'
+        record_kind = self._record_kind(schema, context)
+        record_values = {obj_key: f'record_value_{context.stacks.scope_counter}_{i}'
+                         for i, obj_key in enumerate(record_fields(schema) if record_kind else ())}
         with context.stacks.scope(DeserializeArgs(object=self._schema_key(schema),
                                                   data=f'data_{context.stacks.scope_counter}',
                                                   partial=f'partial_{context.stacks.scope_counter}',
                                                   value=f'value_{context.stacks.scope_counter}',
-                                                  result=result),
-                                  schema=schema):
-            field_code = ''
-            deserialize_templates = []
-            data_keys = set()
-            encoded_fields = []
-            for attr_name, field in schema.load_fields.items():
-                data_key = visitor.name(field, attr_name)
-                obj_key = field.attribute or attr_name
-
-                data_keys.add(data_key)
-
-                with context.stacks.scope(DeserializeArgs(
-                        object=f'{context.stacks.object}.load_fields["{attr_name}"]',
-                        value=f'{context.stacks.data}["{data_key}"]',
-                        result=f'{context.stacks.result}["{obj_key}"]',
-                        set_result=lambda v: self._deserialize_set_result(result, obj_key, v),
-                        data_key=data_key
-                )):
-                    encoded_field = visitor.deserialize(field, context)
-                    encoded_fields.append(encoded_field)
-
-                if schema in encoded_field.recurse:
-                    recursive = True
-
-                comment = f'''{'.'.join([n for n in context.stacks.retrieve("data_key", []) if n] + [data_key])}'''
-
-                field_template = Template(_deserialize_field_template)
-                field_template.safe_substitute(field_comment=comment,
-                                               data=context.stacks.data,
-                                               data_key=data_key,
-                                               obj_key=obj_key,
-                                               deserialize_field=f'$deserialize_field_{len(deserialize_templates)}')
-
-                deserialize_templates.append(encoded_field.code.strip())
-
-                field_code += '\n\n' + str(field_template)
-
-            template = Template(('__error_store = ErrorStore()\n' if first_schema else '') + _deserialize_template)
-            template.safe_substitute(
-                pre_processing_template=(_deserialize_pre_processing_template if schema._has_processors(PRE_LOAD) else ''),
+                                                  result=result,
+                                                  many=False),
+                                  schema=schema,
+                                  lazy_schema=None,
+                                  reload_schema=None,
+                                  item_schema=None):
+            if record_kind:
+                field_code, deserialize_templates, encoded_fields, data_keys = self._encode_deserialize_fields(
+                    schema, context, collect, partial_load, schema_locals,
+                    lambda obj_key: record_values[obj_key],
+                    lambda obj_key, v: f'{record_values[obj_key]} = {v}',
+                    lambda obj_key: f'{record_values[obj_key]} = missing',
+                    reload
+                )
+            else:
+                field_code, deserialize_templates, encoded_fields, data_keys = self._encode_deserialize_fields(
+                    schema, context, collect, partial_load, schema_locals,
+                    lambda obj_key: f'{result}["{obj_key}"]',
+                    lambda obj_key, v: self._deserialize_set_result(result, obj_key, v),
+                    lambda obj_key: '' if '.' in obj_key else f'{result}.pop("{obj_key}", None)',
+                    reload
+                )
+            if any(schema in encoded_field.recurse for encoded_field in encoded_fields):
+                recursive = True
+
+            fields_key = self._fields_key(schema)
+            schema_locals[fields_key] = (frozenset(data_keys), f'frozenset({sorted(data_keys)})')
+
+            data_template = Template(_deserialize_collect_data_template if collect else _deserialize_data_template)
+            data_template.substitute_indented(
+                create_result=(f'{" = ".join(record_values.values())} = missing' if record_values else '')
+                if record_kind else _deserialize_create_result_template,
                 validation_template=_deserialize_validation_template if context.flags.validate else '',
-                field_templates=field_code,
+                field_templates=field_code.strip(),
+                unknown_template=self._encode_unknown(
+                    None if first_schema else context.stacks.get('nested_unknown') or schema.unknown, collect,
+                    _deserialize_record_unknown_include_template if record_kind else _deserialize_unknown_include_template
+                ),
+                construct_result=self._assign_record(schema, record_kind, record_values) if record_kind else ''
+            )
+            if record_kind:
+                schema_locals.update(self._record_locals(schema, record_kind))
+            # records which always had all fields are worth the guarded fast path even without the flag
+            shape = None
+            if first_schema and not reload and (context.flags.specialize_shapes or
+                                 context.statistics is not None and context.statistics.always_present(statistics_path)):
+                with context.stacks.scope(value=context.stacks.data):
+                    shape = self._encode_load_shape(schema, context)
+            if shape is not None:
+                shape_template = Template(_deserialize_shape_template)
+                shape_template.safe_substitute(guard=shape[0], shape_result=shape[1])
+                shape_template.substitute_indented(deserialize_data=str(data_template))
+                data_template = shape_template
+            load_statistics = context.stacks.get('load_statistics')
+            if load_statistics is not None:
+                statistics_key = f'statistics_{abs(hash(statistics_path))}'
+                load_fields = tuple(visitor.name(f, n) for n, f in schema.load_fields.items())
+                schema_locals[statistics_key] = (
+                    load_statistics.schema_statistics(statistics_path, load_fields),
+                    f'schema.load_statistics.schema_statistics({statistics_path!r}, {load_fields!r})'
+                )
+                statistics_template = Template(_deserialize_statistics_template)
+                statistics_template.safe_substitute(statistics=statistics_key)
+                data_template = Template(f'{statistics_template}\n{data_template}')
+            data_template.safe_substitute(schema=context.stacks.object,
+                                          result=context.stacks.result,
+                                          data=context.stacks.data,
+                                          fields=fields_key,
+                                          error_store=error_store,
+                                          index=index)
+            if many:
+                item_template = data_template
+                data_template = Template(_deserialize_collect_many_template if collect else _deserialize_many_template)
+                data_template.safe_substitute(
+                    validation_template=_deserialize_many_validation_template if context.flags.validate else ''
+                )
+                data_template.safe_substitute(schema=context.stacks.object,
+                                              data=many_data,
+                                              result=many_result,
+                                              item_data=context.stacks.data,
+                                              item_result=context.stacks.result,
+                                              error_store=error_store,
+                                              index=many_index)
+                data_template.substitute_indented(deserialize_item=str(item_template))
+
+            pre_processing, post_processing = '', ''
+            if schema._has_processors(PRE_LOAD):
+                pre_processing = _deserialize_pre_processing_template
+                if collect:
+                    pre_processing = Template(_deserialize_collect_pre_processing_template)
+                    pre_processing.substitute_indented(
+                        pre_processing=_deserialize_pre_processing_template,
+                        raise_errors=self._raise_errors(schema, '__error.normalized_messages()', 'None')
+                    )
+                keep_original_data = Template(_deserialize_keep_original_data_template)
+                keep_original_data.substitute_indented(pre_processing=str(pre_processing))
+                pre_processing = keep_original_data
+            if schema._has_processors(POST_LOAD):
+                post_processing = _deserialize_post_processing_template
+                constructor = post_load_constructor(schema) if context.flags.fuse_post_load else None
+                if constructor is not None:
+                    constructor_key = f'constructor_{self._schema_key(schema)}'
+                    schema_locals[constructor_key] = (constructor, f'post_load_constructor({self._schema_key(schema)})')
+                    schema_locals['post_load_constructor'] = (
+                        post_load_constructor, f'from {post_load_constructor.__module__} import post_load_constructor'
+                    )
+                    post_processing = Template(_deserialize_fused_many_post_processing_template if many
+                                               else _deserialize_fused_post_processing_template)
+                    post_processing = post_processing.safe_substitute(constructor=constructor_key)
+                if collect:
+                    post_processing_template = post_processing
+                    post_processing = Template(_deserialize_collect_post_processing_template)
+                    post_processing.substitute_indented(
+                        post_processing=post_processing_template,
+                        raise_errors=self._raise_errors(schema, '__error.normalized_messages()', '$result')
+                    )
+
+            stores_errors = collect or schema._hooks[VALIDATES] or schema._has_processors(VALIDATES_SCHEMA)
+            # list items of schemas without hooks share one error store, created by the list before its loop
+            hoist_error_store = (stores_errors and item and not many and not (recursive or lazy or reload) and
+                                 not any(schema._has_processors(tag) for tag in (PRE_LOAD, POST_LOAD, VALIDATES_SCHEMA))
+                                 and not schema._hooks[VALIDATES])
+            if hoist_error_store:
+                context.stacks.get('item_setup').append(f'{error_store} = ErrorStore()')
+            template = Template((_deserialize_setup_template + '\n' if first_schema else '') + _deserialize_template)
+            template.substitute_indented(
+                pre_processing_template=str(pre_processing),
+                restore_original_data_template=(_deserialize_restore_original_data_template
+                                                if schema._has_processors(PRE_LOAD) else ''),
                 field_level_validation_template=(_deserialize_field_level_validation_template if schema._hooks[VALIDATES] else ''),
                 schema_level_validation_template=(_deserialize_schema_level_validation_template if schema._has_processors(VALIDATES_SCHEMA) else ''),
-                post_processing_template=(_deserialize_post_processing_template if schema._has_processors(POST_LOAD) else '')
+                post_processing_template=str(post_processing),
+                error_store_template=_deserialize_error_store_template if stores_errors and not hoist_error_store else '',
+                check_errors_template=(_deserialize_check_hoisted_errors_template if hoist_error_store else
+                                       _deserialize_check_errors_template if stores_errors else '')
             )
+            # like the valid data of marshmallow, the valid data of records are dicts of the loaded fields
+            valid_data = '$result'
+            if record_kind:
+                valid_data = '[__record._asdict() for __record in $result]' if many else '$result._asdict()'
+            errors = '__errors' if hoist_error_store else f'{error_store}.errors'
+            template.substitute_indented(raise_errors=self._raise_errors(schema, errors, valid_data))
+            template.substitute_indented(deserialize_data=str(data_template))
             template.safe_substitute(schema=context.stacks.object,
-                                     result=context.stacks.result,
-                                     data=context.stacks.data,
+                                     error_store=error_store,
+                                     result=many_result if many else context.stacks.result,
+                                     data=many_data if many else context.stacks.data,
                                      partial=context.stacks.partial,
-                                     partial_is_collection=f'{context.stacks.partial}_is_collection',
-                                     original_data=f'original_data_{context.stacks.scope_counter}',
-                                     fields=str(data_keys),
-                                     many='False')
+                                     unknown=context.stacks.unknown,
+                                     original_data=(f'original_data_{context.stacks.scope_counter}'
+                                                    if schema._has_processors(PRE_LOAD) else
+                                                    many_data if many else context.stacks.data),
+                                     many=str(many))
 
             schema_locals[context.stacks.object] = (schema, context.stacks.retrieve('object')[-2])
 
         recursive_function = self._recursive_function_name(schema)
-        if recursive:
-            context.stacks.push(value='input_data', partial='input_partial')
-            function_body = template.template + f'\nreturn $result'
+        if recursive and many:
+            # the batch loop is inlined, only the single item function is needed for the recursive calls
+            with context.stacks.scope(many=False):
+                encoded_fields.append(self._encode_deserialize(schema, context))
+            recursive = False
+        elif recursive or lazy or reload and not first_schema:
+            context.stacks.push(value='input_data', partial='input_partial',
+                                previous_value='input_previous_data', previous_field='input_previous_result')
+            template.substitute_indented(set_result=f'return {result}')
+            function_body = template.template
             template = Template(_recursive_template)
             template.safe_substitute(function_name=recursive_function,
-                                     function_arguments=f'{context.stacks.value}, {context.stacks.partial}')
+                                     function_arguments=self._function_arguments(context))
             template.substitute_indented(function_body=function_body)
 
         dict_class_key = self._dict_class_key(schema)
         schema_locals[dict_class_key] = (schema.dict_class, f'from {schema.dict_class.__module__} import {schema.dict_class.__name__} as {dict_class_key}')
-        if first_schema:
-            schema_locals['ErrorStore'] = (ErrorStore, 'from marshmallow.error_store import ErrorStore')
+        schema_locals['ErrorStore'] = (ErrorStore, 'from marshmallow.error_store import ErrorStore')
         template.safe_substitute(dict_class=dict_class_key,
                                  input_data=context.stacks.value,
                                  input_partial=context.stacks.partial)
 
         template.substitute_indented({f'deserialize_field_{i}': t for i, t in enumerate(deserialize_templates)},
-                                     set_result=self.set_result(context, result))
+                                     set_result=self.set_result(context, many_result if many else result))
+        if reload:
+            # the fields compare their data to the previous data of this schema
+            template.safe_substitute(input_previous_data=context.stacks.previous_value,
+                                     input_previous_result=context.stacks.previous_field)
+            schema_locals.update(self._reload_locals())
 
         schema_locals.update({
             'Mapping': (typing.Mapping, 'from typing import Mapping'),
@@ -262,10 +964,21 @@ class SchemaEncoder(Encoder[Schema]):
             'INCLUDE': (INCLUDE, 'from marshmallow.utils import INCLUDE'),
         })
 
-        if recursive:
-            context.stacks.pop('value', 'partial')
+        if lazy:
+            schema_locals.update(self._lazy_locals())
+        if recursive or lazy or reload and not first_schema:
+            context.stacks.pop('value', 'partial', 'previous_value', 'previous_field')
+            arguments = f'{context.stacks.value}, {context.stacks.partial}'
+            if reload:
+                arguments += f', {context.stacks.previous_value}, {context.stacks.previous_field}'
+            if lazy:
+                code = f'LazyNested({recursive_function}, {arguments})'
+            elif reload and not first_schema:
+                code = f'reload_nested({recursive_function}, {arguments})'
+            else:
+                code = f'{recursive_function}({arguments})'
             return EncodedReturn(
-                code=self.set_result(context, f'{recursive_function}({context.stacks.value}, {context.stacks.partial})'),
+                code=self.set_result(context, code),
                 definitions=[str(template)],
                 locals_=schema_locals,
                 encoded_returns=encoded_fields
@@ -273,26 +986,196 @@ class SchemaEncoder(Encoder[Schema]):
         else:
             return EncodedReturn(code=str(template), locals_=schema_locals, encoded_returns=encoded_fields)
 
+    @staticmethod
+    def _serialize_value(schema: Schema, field: Field, schema_object: str, field_object: str, obj: str,
+                         obj_key: str) -> str:
+        if type(schema).get_attribute is not Schema.get_attribute:
+            return f'{field_object}.get_value({obj}, "{obj_key}", accessor={schema_object}.get_attribute)'
+        elif type(field).get_value is not Field.get_value:
+            return f'{field_object}.get_value({obj}, "{obj_key}")'
+        elif '.' in obj_key:
+            value = obj
+            for key in obj_key.split('.'):
+                value = f'get_value_for_key({value}, {key!r}, missing)'
+            return value
+
+        # like marshmallow, a key missing in a dict falls back to the attributes of the dict
+        dict_value = (f'get_value_for_key({obj}, {obj_key!r}, missing)' if hasattr(dict, obj_key)
+                      else f'{obj}.get({obj_key!r}, missing)')
+        return (f'{dict_value} if {obj}_is_dict else getattr({obj}, {obj_key!r}, missing) if {obj}_is_object '
+                f'else get_value_for_key({obj}, {obj_key!r}, missing)')
+
+    @staticmethod
+    def _serialize_object_kind(field_code: str, obj: str) -> str:
+        if not re.search(fr'\b{obj}_is_(dict|object)\b', field_code):
+            return ''
+        return Template(_serialize_object_kind_template).safe_substitute(obj=obj,
+                                                                         obj_is_dict=f'{obj}_is_dict',
+                                                                         obj_is_object=f'{obj}_is_object')
+
     @staticmethod
     def _serialize_set_result(result: str, data_key: str, value: str) -> str:
         return f'{result}["{data_key}"] = {value}'
 
+    def _encode_serialize_json(self, schema: Schema, context: CompileContext) -> EncodedReturn:
+        many = context.stacks.get('many', False)
+        json_result: JsonResult = context.stacks.set_result
+        # json schemas are kept apart from the dict schemas, recursive functions exist once per mode
+        recursive = next((
+            s for s in context.stacks.retrieve('json_schema', [])
+            if schema.__class__ == s.__class__ and schema.dump_fields.keys() == s.dump_fields.keys()
+        ), None)
+        if recursive:
+            function = f'{self._recursive_function_name(recursive)}_json'
+            if many:
+                template = Template(_serialize_json_many_template)
+                template.substitute_indented(open_array=json_result.append('['),
+                                             serialize_item=f'{function}($item_obj, {ITEM_SEPARATOR!r})')
+                template.safe_substitute(obj=context.stacks.value,
+                                         item_obj=f'item_{context.stacks.scope_counter}',
+                                         start=f'many_start_{context.stacks.scope_counter}',
+                                         parts=json_result.parts,
+                                         separator_length=len(ITEM_SEPARATOR))
+                return EncodedReturn(code=str(template), recurse={recursive})
+            return EncodedReturn(code=f'{function}({context.stacks.value}, {json_result.prefix_code})',
+                                 recurse={recursive})
+
+        schema_locals = {}
+        parts = json_result.parts
+        start = f'start_{context.stacks.scope_counter}'
+        many_obj = f'many_obj_{context.stacks.scope_counter}'
+        many_start = f'many_start_{context.stacks.scope_counter}'
+        with context.stacks.scope(SerializeArgs(object=f'schema_{id(schema)}',
+                                                obj=f'obj_{context.stacks.scope_counter}',
+                                                value=f'value_{context.stacks.scope_counter}',
+                                                many=False),
+                                  json_schema=schema):
+            field_code = ''
+            serialize_templates = []
+            encoded_fields = []
+            for attr_name, field in schema.dump_fields.items():
+                obj_key = field.attribute or attr_name
+                data_key = visitor.name(field, attr_name)
+
+                format_key, format_local = self._json_format_local(visitor.json_format(field) or json_value)
+                schema_locals[format_key] = format_local
+
+                tmp_object = f'{context.stacks.object}.dump_fields["{attr_name}"]'
+                with context.stacks.scope(SerializeArgs(
+                        object=tmp_object,
+                        value=self._serialize_value(schema, field, context.stacks.object, tmp_object,
+                                                    context.stacks.obj, obj_key),
+                        set_result=JsonResult(parts, f'{ITEM_SEPARATOR}{json.dumps(data_key)}{KEY_SEPARATOR}', format_key),
+                        obj_key=obj_key
+                )):
+                    encoded_field = visitor.serialize(field, context)
+                    encoded_fields.append(encoded_field)
+
+                if schema in encoded_field.recurse:
+                    recursive = True
+
+                comment = f'''{'.'.join([n for n in context.stacks.retrieve("obj_key", []) if n] + [obj_key])}'''
+
+                field_template = Template(_serialize_field_template)
+                field_template.safe_substitute(field_comment=comment,
+                                               serialize_field=f'$serialize_field_{len(serialize_templates)}')
+                serialize_templates.append(encoded_field.code.strip())
+
+                field_code += '\n\n' + str(field_template)
+
+            data_template = Template(_serialize_json_data_template)
+            data_template.substitute_indented(
+                object_kind=self._serialize_object_kind('\n'.join(serialize_templates), context.stacks.obj),
+                field_templates=field_code.strip()
+            )
+            data_template.safe_substitute(start=start)
+            if many:
+                item_template = data_template
+                item_template.substitute_indented(open_object=JsonResult(parts, ITEM_SEPARATOR, '').append('{'))
+                data_template = Template(_serialize_json_many_template)
+                data_template.safe_substitute(obj=many_obj,
+                                              item_obj=context.stacks.obj,
+                                              start=many_start)
+                data_template.substitute_indented(serialize_item=str(item_template))
+
+            template = Template(_serialize_json_template)
+            template.substitute_indented(
+                pre_processing_template=(_serialize_pre_processing_template if schema._has_processors(PRE_DUMP) else ''),
+                serialize_data=str(data_template)
+            )
+            template.safe_substitute(schema=context.stacks.object,
+                                     obj=many_obj if many else context.stacks.obj,
+                                     parts=parts,
+                                     separator_length=len(ITEM_SEPARATOR),
+                                     many=str(many))
+
+            schema_locals[context.stacks.object] = (schema, context.stacks.retrieve('object')[-2])
+            schema_locals.update({
+                'PRE_DUMP': (PRE_DUMP, 'from marshmallow.decorators import PRE_DUMP'),
+                'missing': (missing, 'from marshmallow.utils import missing'),
+                'get_value_for_key': (_get_value_for_key, 'from marshmallow.utils import _get_value_for_key as get_value_for_key'),
+            })
+
+        recursive_function = f'{self._recursive_function_name(schema)}_json'
+        if recursive and many:
+            with context.stacks.scope(many=False):
+                encoded_fields.append(self._encode_serialize_json(schema, context))
+            recursive = False
+        elif recursive:
+            context.stacks.push(obj='input_obj',
+                                set_result=JsonResult(parts, 'input_prefix', json_result.format_function, False))
+            json_result = context.stacks.set_result
+
+        template.substitute_indented(open_object=json_result.append('{'),
+                                     open_array=json_result.append('['))
+        template.safe_substitute(input_obj=context.stacks.obj)
+        template.substitute_indented({f'serialize_field_{i}': t for i, t in enumerate(serialize_templates)})
+
+        if recursive:
+            function_body = template.template
+            template = Template(_recursive_template)
+            template.safe_substitute(function_name=recursive_function,
+                                     function_arguments=f'{context.stacks.obj}, input_prefix')
+            template.substitute_indented(function_body=function_body)
+            context.stacks.pop('obj', 'set_result')
+            return EncodedReturn(code=f'{recursive_function}({context.stacks.obj}, {context.stacks.set_result.prefix_code})',
+                                 definitions=[str(template)],
+                                 locals_=schema_locals,
+                                 encoded_returns=encoded_fields)
+        return EncodedReturn(code=str(template), locals_=schema_locals, encoded_returns=encoded_fields)
+
     def _encode_serialize(self, schema: Schema, context: CompileContext) -> EncodedReturn:
+        if isinstance(context.stacks.get('set_result'), JsonResult):
+            # schemas with post processors need the result dict, their json is written from it
+            if not schema._has_processors(POST_DUMP):
+                return self._encode_serialize_json(schema, context)
+            json_result = context.stacks.set_result
+            with context.stacks.scope(set_result=lambda v: json_result(v)):
+                return self._encode_serialize(schema, context)
+
+        many = context.stacks.get('many', False)
         recursive = next((
             s for s in context.stacks.retrieve('schema', [])
             if schema.__class__ == s.__class__ and schema.dump_fields.keys() == s.dump_fields.keys()
         ), None)
         if recursive:
             function = self._recursive_function_name(recursive)
+            if many:
+                item = f'item_{context.stacks.scope_counter}'
+                return EncodedReturn(code=self.set_result(context, f'[{function}({item}) for {item} in {context.stacks.value}]'),
+                                     recurse={recursive})
             return EncodedReturn(code=self.set_result(context, f'{function}({context.stacks.value})'),
                                  recurse={recursive})
 
         schema_locals = {}
         result = f'result_{context.stacks.scope_counter}'
+        many_obj = f'many_obj_{context.stacks.scope_counter}'
+        many_result = f'many_result_{context.stacks.scope_counter}'
         with context.stacks.scope(SerializeArgs(object=f'schema_{id(schema)}',
                                                 obj=f'obj_{context.stacks.scope_counter}',
                                                 value=f'value_{context.stacks.scope_counter}',
-                                                result=result),
+                                                result=result,
+                                                many=False),
                                   schema=schema):
             field_code = ''
             serialize_templates = []
@@ -304,7 +1187,8 @@ class SchemaEncoder(Encoder[Schema]):
                 tmp_object = f'{context.stacks.object}.dump_fields["{attr_name}"]'
                 with context.stacks.scope(SerializeArgs(
                         object=tmp_object,
-                        value=f'{tmp_object}.get_value({context.stacks.obj}, "{obj_key}")',
+                        value=self._serialize_value(schema, field, context.stacks.object, tmp_object,
+                                                    context.stacks.obj, obj_key),
                         result=f'{context.stacks.result}["{data_key}"]',
                         set_result=lambda v: self._deserialize_set_result(result, data_key, v),
                         obj_key=obj_key
@@ -327,24 +1211,44 @@ class SchemaEncoder(Encoder[Schema]):
 
                 field_code += '\n\n' + str(field_template)
 
+            data_template = Template(_serialize_data_template)
+            data_template.substitute_indented(
+                object_kind=self._serialize_object_kind('\n'.join(serialize_templates), context.stacks.obj)
+            )
+            data_template.safe_substitute(field_templates=field_code)
+            data_template.safe_substitute(result=context.stacks.result)
+            if many:
+                item_template = data_template
+                data_template = Template(_serialize_many_template)
+                data_template.safe_substitute(obj=many_obj,
+                                              result=many_result,
+                                              item_obj=context.stacks.obj,
+                                              item_result=context.stacks.result)
+                data_template.substitute_indented(serialize_item=str(item_template))
+
             template = Template(_serialize_template)
             template.safe_substitute(
                 pre_processing_template=(_serialize_pre_processing_template if schema._has_processors(PRE_DUMP) else ''),
-                field_templates=field_code,
                 post_processing_template=(_serialize_post_processing_template if schema._has_processors(POST_DUMP) else '')
             )
+            template.substitute_indented(serialize_data=str(data_template))
             template.safe_substitute(schema=context.stacks.object,
-                                     result=context.stacks.result,
-                                     obj=context.stacks.obj,
+                                     result=many_result if many else context.stacks.result,
+                                     obj=many_obj if many else context.stacks.obj,
                                      original_obj=f'original_obj_{context.stacks.scope_counter}',
-                                     many='False')
+                                     many=str(many))
 
             schema_locals[context.stacks.object] = (schema, context.stacks.retrieve('object')[-2])
 
         recursive_function = self._recursive_function_name(schema)
-        if recursive:
+        if recursive and many:
+            with context.stacks.scope(many=False):
+                encoded_fields.append(self._encode_serialize(schema, context))
+            recursive = False
+        elif recursive:
             context.stacks.push(obj='input_obj')
-            function_body = template.template + f'\nreturn $result'
+            template.substitute_indented(set_result=f'return {result}')
+            function_body = template.template
             template = Template(_recursive_template)
             template.safe_substitute(function_name=recursive_function,
                                      function_arguments=context.stacks.obj)
@@ -355,7 +1259,7 @@ class SchemaEncoder(Encoder[Schema]):
         template.safe_substitute(dict_class=dict_class_key,
                                  input_obj=context.stacks.obj)
         template.substitute_indented({f'serialize_field_{i}': t for i, t in enumerate(serialize_templates)},
-                                     set_result=self.set_result(context, result))
+                                     set_result=self.set_result(context, many_result if many else result))
 
         schema_locals.update({
             'Mapping': (typing.Mapping, 'from typing import Mapping'),
@@ -363,6 +1267,7 @@ class SchemaEncoder(Encoder[Schema]):
             'PRE_DUMP': (PRE_DUMP, 'from marshmallow.decorators import PRE_DUMP'),
             'POST_DUMP': (POST_DUMP, 'from marshmallow.decorators import POST_DUMP'),
             'missing': (missing, 'from marshmallow.utils import missing'),
+            'get_value_for_key': (_get_value_for_key, 'from marshmallow.utils import _get_value_for_key as get_value_for_key'),
         })
 
         if recursive:
@@ -1,6 +1,10 @@
+import typing
+from abc import ABC
+
 from marshmallow.utils import ensure_text_type
 
-from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor, Template
+from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor, Template, _F
+from ..utils.json_format import json_string
 
 from marshmallow.fields import String
 
@@ -15,10 +19,26 @@ else:
     raise $field.make_error("invalid")
 '''.strip()
 
+_deserialize_bytes_first_template = '''
+__type = type($value)
+if __type == bytes:
+    $set_bytes_result
+elif __type == str:
+    $set_str_result
+else:
+    raise $field.make_error("invalid")
+'''.strip()
+
+
+class BaseStringEncoder(FieldEncoder[_F], ABC):
+    @classmethod
+    def _bytes_first(cls, context: CompileContext) -> bool:
+        statistics_key = cls._statistics_key(context)
+        statistics = context.statistics.field_statistics(*statistics_key) if statistics_key else None
+        return statistics is not None and statistics.types[bytes] > statistics.types[str]
 
-class StringEncoder(FieldEncoder[String]):
-    def _encode_deserialize(self, string: String, context: CompileContext) -> EncodedReturn:
-        template = Template(_deserialize_template)
+    def _encode_deserialize(self, string: _F, context: CompileContext) -> EncodedReturn:
+        template = Template(_deserialize_bytes_first_template if self._bytes_first(context) else _deserialize_template)
         template.safe_substitute(field=context.stacks.object,
                                  value=context.stacks.value)
         template.substitute_indented(
@@ -27,10 +47,23 @@ class StringEncoder(FieldEncoder[String]):
         )
         return EncodedReturn(code=str(template))
 
-    def _encode_serialize(self, string: String, context: CompileContext) -> EncodedReturn:
+    def _encode_serialize(self, string: _F, context: CompileContext) -> EncodedReturn:
         value = context.stacks.value
-        code = f'str({value}.decode("utf-8") if type({value}) == bytes else {value})'
+        code = f'None if {value} is None else str({value}.decode("utf-8") if type({value}) == bytes else {value})'
         return EncodedReturn(code=self.set_result(context, code))
 
+    def _encode_load_type(self, _: _F) -> type:
+        return str
+
+    def _encode_load_shape(self, _: _F, context: CompileContext) -> tuple[str, str]:
+        return f'{context.stacks.value}.__class__ is str', context.stacks.value
+
+    def _encode_json_format(self, _: _F) -> typing.Callable[[typing.Any], str]:
+        return json_string
+
+
+class StringEncoder(BaseStringEncoder[String]):
+    pass
+
 
 visitor.register_encoder(StringEncoder)
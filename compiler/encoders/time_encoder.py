@@ -0,0 +1,41 @@
+import datetime as dt
+import re
+
+from marshmallow import utils
+from marshmallow.fields import Time
+
+from .datetime_encoder import BaseDateTimeEncoder, CompileContext, visitor, Template
+
+
+_iso_time_match = re.compile(r'[0-9]{2}:[0-9]{2}(?::[0-9]{2}(?:\.[0-9]{3}(?:[0-9]{3})?)?)?\Z').match
+_time_fromisoformat = dt.time.fromisoformat
+_time_isoformat = dt.time.isoformat
+
+
+_deserialize_iso_template = '''
+if $value.__class__ is str and $iso_match($value) is not None:
+    try:
+        __datetime = $fromisoformat($value)
+    except ValueError:
+        __datetime = $field._deserialize($value, None, None)
+else:
+    __datetime = $field._deserialize($value, None, None)
+'''.strip()
+
+
+class TimeEncoder(BaseDateTimeEncoder[Time]):
+    def _encode_parse(self, time: Time, context: CompileContext, locals_: dict) -> str:
+        if time.DESERIALIZATION_FUNCS.get(self._format(time)) is not utils.from_iso_time:
+            return super()._encode_parse(time, context, locals_)
+        template = Template(_deserialize_iso_template)
+        template.safe_substitute(iso_match=self._import_local(locals_, globals(), '_iso_time_match'),
+                                 fromisoformat=self._import_local(locals_, globals(), '_time_fromisoformat'))
+        return str(template)
+
+    def _encode_format(self, time: Time, context: CompileContext, locals_: dict) -> str:
+        if time.SERIALIZATION_FUNCS.get(self._format(time)) is not utils.to_iso_time:
+            return super()._encode_format(time, context, locals_)
+        return f'{self._import_local(locals_, globals(), "_time_isoformat")}({context.stacks.value})'
+
+
+visitor.register_encoder(TimeEncoder)
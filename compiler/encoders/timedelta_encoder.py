@@ -0,0 +1,44 @@
+import datetime as dt
+
+from marshmallow.fields import TimeDelta
+from marshmallow.utils import timedelta_to_microseconds
+
+from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor, Template
+
+
+_deserialize_template = '''
+try:
+    __timedelta = $serialization_type($value)
+except (TypeError, ValueError) as __error:
+    raise $field.make_error("invalid") from __error
+try:
+    __timedelta = timedelta($precision=__timedelta)
+except OverflowError as __error:
+    raise $field.make_error("invalid") from __error
+$set_result
+'''.strip()
+
+
+class TimeDeltaEncoder(FieldEncoder[TimeDelta]):
+    def _encode_deserialize(self, timedelta: TimeDelta, context: CompileContext) -> EncodedReturn:
+        template = Template(_deserialize_template)
+        template.substitute_indented(set_result=self.set_result(context, '__timedelta'))
+        template.safe_substitute(field=context.stacks.object,
+                                 value=context.stacks.value,
+                                 serialization_type=timedelta.serialization_type.__name__,
+                                 precision=timedelta.precision)
+        return EncodedReturn(code=str(template),
+                             locals_={'timedelta': (dt.timedelta, 'from datetime import timedelta')})
+
+    def _encode_serialize(self, timedelta: TimeDelta, context: CompileContext) -> EncodedReturn:
+        value = context.stacks.value
+        base_unit = dt.timedelta(**{timedelta.precision: 1})
+        if timedelta.serialization_type is int:
+            microseconds = f'(({value}.days * 86400 + {value}.seconds) * 1000000 + {value}.microseconds)'
+            code = f'{microseconds} // {timedelta_to_microseconds(base_unit)}'
+        else:
+            code = f'{value}.total_seconds() / {base_unit.total_seconds()!r}'
+        return EncodedReturn(code=self.set_result(context, f'None if {value} is None else {code}'))
+
+
+visitor.register_encoder(TimeDeltaEncoder)
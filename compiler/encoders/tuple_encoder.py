@@ -1,11 +1,86 @@
-from .field_encoder import FieldEncoder, DeserializeArgs, SerializeArgs, CompileContext, EncodedReturn, visitor
+from marshmallow.exceptions import ValidationError
+from marshmallow.utils import is_collection
+
+from .field_encoder import FieldEncoder, DeserializeArgs, SerializeArgs, CompileContext, EncodedReturn, visitor, Template
 
 
 from marshmallow.fields import Tuple
 
 
+_deserialize_collect_field_template = '''
+try:
+    $encoded_field
+except ValidationError as __error:
+    # validators run after the value is appended
+    del $result[$index - $dropped:]
+    if __error.valid_data is not None:
+        $result.append(__error.valid_data)
+    else:
+        $dropped += 1
+    $errors[$index] = __error.messages
+'''.strip()
+
+_deserialize_validation_template = '''
+if not is_collection($value):
+    raise $field.make_error("invalid")
+$field.validate_length($value)
+'''.strip()
+
+_deserialize_collect_template = '''
+$validation_template
+$result = []
+$errors = {}
+$dropped = 0
+$encoded_fields
+if $errors:
+    raise ValidationError($errors, valid_data=$result)
+$set_result
+'''.strip()
+
+
 class TupleEncoder(FieldEncoder[Tuple]):
+    @staticmethod
+    def _validation_template(context: CompileContext) -> str:
+        # like marshmallow, the type and length are checked before the items are indexed
+        template = Template(_deserialize_validation_template)
+        template.safe_substitute(field=context.stacks.object, value=context.stacks.value)
+        return str(template)
+
+    def _encode_collect_deserialize(self, tpl: Tuple, context: CompileContext) -> EncodedReturn:
+        encoded_fields = []
+        field_templates = []
+        result = f'result_{context.stacks.scope_counter}'
+        errors = f'errors_{context.stacks.scope_counter}'
+
+        for i, field in enumerate(tpl.tuple_fields):
+            with context.stacks.scope(DeserializeArgs(object=f'{context.stacks.object}.tuple_fields[{i}]',
+                                                      result=f'{result}[-1]',
+                                                      set_result=lambda v: f'{result}.append({v})',
+                                                      value=f'{context.stacks.value}[{i}]',
+                                                      data_key=None)):
+                encoded_field = visitor.deserialize(field, context)
+                encoded_fields.append(encoded_field)
+
+            field_template = Template(_deserialize_collect_field_template)
+            field_template.substitute_indented(encoded_field=encoded_field.code)
+            field_template.safe_substitute(index=i)
+            field_templates.append(str(field_template))
+
+        template = Template(_deserialize_collect_template)
+        template.substitute_indented(validation_template=self._validation_template(context),
+                                     encoded_fields='\n'.join(field_templates),
+                                     set_result=self.set_result(context, f'tuple({result})'))
+        template.safe_substitute(result=result, errors=errors, dropped=f'dropped_{context.stacks.scope_counter}')
+
+        return EncodedReturn(code=str(template), encoded_returns=encoded_fields, locals_={
+            'ValidationError': (ValidationError, 'from marshmallow.exceptions import ValidationError'),
+            'is_collection': (is_collection, 'from marshmallow.utils import is_collection'),
+        })
+
     def _encode_deserialize(self, tpl: Tuple, context: CompileContext) -> EncodedReturn:
+        if context.flags.validate and context.flags.collect_errors:
+            return self._encode_collect_deserialize(tpl, context)
+
         encoded_fields = []
         deserialized = []
 
@@ -21,8 +96,13 @@ class TupleEncoder(FieldEncoder[Tuple]):
 
         code = '\n\n'.join(encoded_field.code for encoded_field in encoded_fields)
         code += '\n\n' + self.set_result(context, f'({", ".join(deserialized)})')
+        if not context.flags.validate:
+            return EncodedReturn(code=code, encoded_returns=encoded_fields)
 
-        return EncodedReturn(code=code, encoded_returns=encoded_fields)
+        code = f'{self._validation_template(context)}\n\n{code}'
+        return EncodedReturn(code=code, encoded_returns=encoded_fields, locals_={
+            'is_collection': (is_collection, 'from marshmallow.utils import is_collection'),
+        })
 
     def _encode_serialize(self, tpl: Tuple, context: CompileContext) -> EncodedReturn:
         encoded_fields = []
@@ -0,0 +1,10 @@
+from marshmallow.fields import Url
+
+from .string_encoder import BaseStringEncoder, visitor
+
+
+class UrlEncoder(BaseStringEncoder[Url]):
+    pass
+
+
+visitor.register_encoder(UrlEncoder)
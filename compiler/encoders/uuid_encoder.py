@@ -0,0 +1,45 @@
+import typing
+import uuid
+
+from marshmallow.fields import UUID
+from marshmallow.utils import ensure_text_type
+
+from .field_encoder import FieldEncoder, CompileContext, EncodedReturn, visitor, Template
+from ..utils.json_format import json_string
+
+
+_deserialize_template = '''
+if $value.__class__ is str:
+    try:
+        __uuid = $uuid_type($value)
+    except (ValueError, AttributeError, TypeError) as __error:
+        raise $field.make_error("invalid_uuid") from __error
+else:
+    __uuid = $field._validated($value)
+$set_result
+'''.strip()
+
+
+class UUIDEncoder(FieldEncoder[UUID]):
+    _uuid_local = {'uuid_UUID': (uuid.UUID, 'from uuid import UUID as uuid_UUID')}
+
+    def _encode_deserialize(self, field: UUID, context: CompileContext) -> EncodedReturn:
+        template = Template(_deserialize_template)
+        template.substitute_indented(set_result=self.set_result(context, '__uuid'))
+        template.safe_substitute(field=context.stacks.object,
+                                 value=context.stacks.value,
+                                 uuid_type='uuid_UUID')
+        return EncodedReturn(code=str(template), locals_=dict(self._uuid_local))
+
+    def _encode_serialize(self, field: UUID, context: CompileContext) -> EncodedReturn:
+        value = context.stacks.value
+        code = f'None if {value} is None else str({value}) if {value}.__class__ is uuid_UUID else ensure_text_type({value})'
+        return EncodedReturn(code=self.set_result(context, code),
+                             locals_={**self._uuid_local,
+                                      'ensure_text_type': (ensure_text_type, 'from marshmallow.utils import ensure_text_type')})
+
+    def _encode_json_format(self, _: UUID) -> typing.Callable[[typing.Any], str]:
+        return json_string
+
+
+visitor.register_encoder(UUIDEncoder)
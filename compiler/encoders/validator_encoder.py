@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import TypeVar, Generic
+
+from marshmallow.validate import Validator
+
+from ..utils.compile_context import CompileContext, EncodedReturn
+
+
+_V = TypeVar('_V', bound=Validator)
+
+
+class ValidatorEncoder(ABC, Generic[_V]):
+    @classmethod
+    def validator_type(cls) -> type[_V]:
+        return cls.__orig_bases__[0].__args__[0]
+
+    @staticmethod
+    def _local_key(validator: _V, name: str) -> str:
+        return f'{validator.__class__.__name__}_{name}_{id(validator)}'
+
+    def encode_condition(self, validator: _V, context: CompileContext) -> EncodedReturn:
+        if not isinstance(validator, self.validator_type()):
+            raise TypeError(f"Expected {self.validator_type().__name__}, got {type(validator).__name__}")
+        return self._encode_condition(validator, context)
+
+    @abstractmethod
+    def _encode_condition(self, validator: _V, context: CompileContext) -> EncodedReturn:
+        ...
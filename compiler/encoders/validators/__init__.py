@@ -0,0 +1,19 @@
+from .email_encoder import EmailValidatorEncoder
+from .equal_encoder import EqualEncoder
+from .length_encoder import LengthEncoder
+from .one_of_encoder import OneOfEncoder
+from .predicate_encoder import PredicateEncoder
+from .range_encoder import RangeEncoder
+from .regexp_encoder import RegexpEncoder
+from .url_encoder import URLValidatorEncoder
+
+__all__ = [
+    'EmailValidatorEncoder',
+    'EqualEncoder',
+    'LengthEncoder',
+    'OneOfEncoder',
+    'PredicateEncoder',
+    'RangeEncoder',
+    'RegexpEncoder',
+    'URLValidatorEncoder',
+]
@@ -0,0 +1,24 @@
+import re
+
+from marshmallow.validate import Email
+
+from ..validator_encoder import ValidatorEncoder, CompileContext, EncodedReturn
+from ..visitor import visitor
+
+
+# dot-atom user part and plain domain of marshmallow's Email validator in one pattern, other addresses are checked
+# by the validator itself
+_email_match = re.compile(
+    r"[-!#$%&'*+/=?^`{}|~\w]+(?:\.[-!#$%&'*+/=?^`{}|~\w]+)*"
+    r"@(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+(?:[A-Z]{2,6}|[A-Z0-9-]{2,})\Z",
+    re.IGNORECASE | re.UNICODE,
+).match
+
+
+class EmailValidatorEncoder(ValidatorEncoder[Email]):
+    def _encode_condition(self, email: Email, context: CompileContext) -> EncodedReturn:
+        return EncodedReturn(code=f'email_match({context.stacks.value}) is not None',
+                             locals_={'email_match': (_email_match, f'from {__name__} import _email_match as email_match')})
+
+
+visitor.register_validator_encoder(EmailValidatorEncoder)
@@ -0,0 +1,14 @@
+from marshmallow.validate import Equal
+
+from ..validator_encoder import ValidatorEncoder, CompileContext, EncodedReturn
+from ..visitor import visitor
+
+
+class EqualEncoder(ValidatorEncoder[Equal]):
+    def _encode_condition(self, equal: Equal, context: CompileContext) -> EncodedReturn:
+        comparable_key = self._local_key(equal, 'comparable')
+        return EncodedReturn(code=f'{context.stacks.value} == {comparable_key}',
+                             locals_={comparable_key: (equal.comparable, f'{context.stacks.object}.comparable')})
+
+
+visitor.register_validator_encoder(EqualEncoder)
@@ -0,0 +1,21 @@
+from marshmallow.validate import Length
+
+from ..validator_encoder import ValidatorEncoder, CompileContext, EncodedReturn
+from ..visitor import visitor
+
+
+class LengthEncoder(ValidatorEncoder[Length]):
+    def _encode_condition(self, length: Length, context: CompileContext) -> EncodedReturn:
+        condition = f'len({context.stacks.value})'
+        if length.equal is not None:
+            return EncodedReturn(code=f'{condition} == {length.equal!r}')
+        if length.min is not None:
+            condition = f'{length.min!r} <= {condition}'
+        if length.max is not None:
+            condition = f'{condition} <= {length.max!r}'
+        if length.min is None and length.max is None:
+            condition = f'{condition} >= 0'
+        return EncodedReturn(code=condition)
+
+
+visitor.register_validator_encoder(LengthEncoder)
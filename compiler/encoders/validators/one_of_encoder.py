@@ -0,0 +1,19 @@
+import typing
+
+from marshmallow.validate import OneOf
+
+from ..validator_encoder import ValidatorEncoder, CompileContext, EncodedReturn
+from ..visitor import visitor
+
+
+class OneOfEncoder(ValidatorEncoder[OneOf]):
+    def _encode_condition(self, one_of: OneOf, context: CompileContext) -> EncodedReturn:
+        choices_key = self._local_key(one_of, 'choices')
+        if all(isinstance(choice, typing.Hashable) for choice in one_of.choices):
+            choices = (frozenset(one_of.choices), f'frozenset({context.stacks.object}.choices)')
+        else:
+            choices = (one_of.choices, f'{context.stacks.object}.choices')
+        return EncodedReturn(code=f'{context.stacks.value} in {choices_key}', locals_={choices_key: choices})
+
+
+visitor.register_validator_encoder(OneOfEncoder)
@@ -0,0 +1,21 @@
+from marshmallow.validate import Predicate
+
+from ..validator_encoder import ValidatorEncoder, CompileContext, EncodedReturn
+from ..visitor import visitor
+
+
+class PredicateEncoder(ValidatorEncoder[Predicate]):
+    def _encode_condition(self, predicate: Predicate, context: CompileContext) -> EncodedReturn:
+        locals_ = {}
+        if predicate.method.isidentifier():
+            method = f'{context.stacks.value}.{predicate.method}'
+        else:
+            method = f'getattr({context.stacks.value}, {predicate.method!r})'
+        if predicate.kwargs:
+            kwargs_key = self._local_key(predicate, 'kwargs')
+            locals_[kwargs_key] = (predicate.kwargs, f'{context.stacks.object}.kwargs')
+            return EncodedReturn(code=f'{method}(**{kwargs_key})', locals_=locals_)
+        return EncodedReturn(code=f'{method}()')
+
+
+visitor.register_validator_encoder(PredicateEncoder)
@@ -0,0 +1,24 @@
+from marshmallow.validate import Range
+
+from ..validator_encoder import ValidatorEncoder, CompileContext, EncodedReturn
+from ..visitor import visitor
+
+
+class RangeEncoder(ValidatorEncoder[Range]):
+    def _encode_condition(self, range_: Range, context: CompileContext) -> EncodedReturn:
+        condition = context.stacks.value
+        locals_ = {}
+        if range_.min is not None:
+            min_key = self._local_key(range_, 'min')
+            condition = f'{min_key} {"<=" if range_.min_inclusive else "<"} {condition}'
+            locals_[min_key] = (range_.min, f'{context.stacks.object}.min')
+        if range_.max is not None:
+            max_key = self._local_key(range_, 'max')
+            condition = f'{condition} {"<=" if range_.max_inclusive else "<"} {max_key}'
+            locals_[max_key] = (range_.max, f'{context.stacks.object}.max')
+        if not locals_:
+            condition = 'True'
+        return EncodedReturn(code=condition, locals_=locals_)
+
+
+visitor.register_validator_encoder(RangeEncoder)
@@ -0,0 +1,14 @@
+from marshmallow.validate import Regexp
+
+from ..validator_encoder import ValidatorEncoder, CompileContext, EncodedReturn
+from ..visitor import visitor
+
+
+class RegexpEncoder(ValidatorEncoder[Regexp]):
+    def _encode_condition(self, regexp: Regexp, context: CompileContext) -> EncodedReturn:
+        match_key = self._local_key(regexp, 'match')
+        return EncodedReturn(code=f'{match_key}({context.stacks.value}) is not None',
+                             locals_={match_key: (regexp.regex.match, f'{context.stacks.object}.regex.match')})
+
+
+visitor.register_validator_encoder(RegexpEncoder)
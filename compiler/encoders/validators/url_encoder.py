@@ -0,0 +1,21 @@
+from marshmallow.validate import URL
+
+from ..validator_encoder import ValidatorEncoder, CompileContext, EncodedReturn
+from ..visitor import visitor
+
+
+class URLValidatorEncoder(ValidatorEncoder[URL]):
+    def _encode_condition(self, url: URL, context: CompileContext) -> EncodedReturn:
+        value, validator = context.stacks.value, context.stacks.object
+        search_key = self._local_key(url, 'search')
+        schemes_key = self._local_key(url, 'schemes')
+        code = (f'{value} != "" and {search_key}({value}) is not None and '
+                f'("://" not in {value} or {value}.partition("://")[0].lower() in {schemes_key})')
+        return EncodedReturn(code=code, locals_={
+            search_key: (url._regex(url.relative, url.absolute, url.require_tld).search,
+                         f'{validator}._regex({validator}.relative, {validator}.absolute, {validator}.require_tld).search'),
+            schemes_key: (frozenset(url.schemes), f'frozenset({validator}.schemes)'),
+        })
+
+
+visitor.register_validator_encoder(URLValidatorEncoder)
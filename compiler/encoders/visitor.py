@@ -1,18 +1,25 @@
 import inspect
 import logging
+import typing
+import weakref
 
 from .encoder import Encoder, DeserializeArgs, SerializeArgs
+from .validator_encoder import ValidatorEncoder
 from ..utils.compile_context import CompileContext, EncodedReturn
 
 from marshmallow.base import SchemaABC, FieldABC
+from marshmallow.validate import Validator
 
 
 class _Visitor:
     _type_to_encoder: dict[type[SchemaABC | FieldABC], type[Encoder]] = {}
     _encoders: list[type[Encoder]] = []
+    _type_to_validator_encoder: dict[type[Validator], type[ValidatorEncoder]] = {}
 
     warn_on_fallback_field_encoder = True
     _field_fallback_encoder = None
+    # every compiled function visits the fields again, each field is only warned about once
+    _fallback_warned_fields = weakref.WeakSet()
 
     warn_on_schema_superclass_encoder = True
 
@@ -20,7 +27,8 @@ class _Visitor:
         if type(to_visit) in self._type_to_encoder:
             return self._type_to_encoder[type(to_visit)]()
         elif isinstance(to_visit, FieldABC) and self._field_fallback_encoder is not None:
-            if self.warn_on_fallback_field_encoder:
+            if self.warn_on_fallback_field_encoder and to_visit not in self._fallback_warned_fields:
+                self._fallback_warned_fields.add(to_visit)
                 logging.warning(f"Using fallback encoder for {type(to_visit).__name__}!")
             return self._field_fallback_encoder()
         elif isinstance(to_visit, SchemaABC):
@@ -34,12 +42,26 @@ class _Visitor:
     def name(self, to_visit: SchemaABC | FieldABC, attr_name: str) -> str:
         return self._find_encoder(to_visit).encode_name(to_visit, attr_name)
 
+    def json_format(self, to_visit: SchemaABC | FieldABC) -> typing.Callable[[typing.Any], str] | None:
+        return self._find_encoder(to_visit).encode_json_format(to_visit)
+
+    def load_shape(self, to_visit: SchemaABC | FieldABC, context: CompileContext) -> tuple[str, str] | None:
+        return self._find_encoder(to_visit).encode_load_shape(to_visit, context)
+
+    def deserialize_columns(self, to_visit: SchemaABC, context: CompileContext) -> EncodedReturn | None:
+        return self._find_encoder(to_visit).encode_deserialize_columns(to_visit, context)
+
     def deserialize(self, to_visit: SchemaABC | FieldABC, context: CompileContext) -> EncodedReturn:
         return self._find_encoder(to_visit).encode_deserialize(to_visit, context)
 
     def serialize(self, to_visit: SchemaABC | FieldABC, context: CompileContext) -> EncodedReturn:
         return self._find_encoder(to_visit).encode_serialize(to_visit, context)
 
+    def validate(self, validator: Validator, context: CompileContext) -> EncodedReturn | None:
+        if type(validator) in self._type_to_validator_encoder:
+            return self._type_to_validator_encoder[type(validator)]().encode_condition(validator, context)
+        return None
+
     def register_encoder(self, encoder_cls: type[Encoder], override: bool = False):
         if not inspect.isclass(encoder_cls):
             encoder_cls = encoder_cls.__class__
@@ -71,6 +93,19 @@ class _Visitor:
         
         self._field_fallback_encoder = encoder_cls
 
+    def register_validator_encoder(self, encoder_cls: type[ValidatorEncoder], override: bool = False):
+        if not inspect.isclass(encoder_cls):
+            encoder_cls = encoder_cls.__class__
+
+        if not issubclass(encoder_cls, ValidatorEncoder):
+            raise TypeError(f"Expected validator encoder class, got {type(encoder_cls).__name__} instance!")
+        elif not issubclass(encoder_cls.validator_type(), Validator):
+            raise TypeError(f"Expected ValidatorEncoder for Validator, got {encoder_cls.validator_type().__name__}!")
+        elif encoder_cls.validator_type() in self._type_to_validator_encoder and not override:
+            raise ValueError(f"Validator encoder for {encoder_cls.validator_type().__name__} already registered!")
+
+        self._type_to_validator_encoder[encoder_cls.validator_type()] = encoder_cls
+
 
 
 
@@ -1,5 +1,13 @@
 from .compile_context import CompileContext, CompileContextData, CompileContextStacks, CompileFlags, EncodedReturn
 from .template import Template
+from .code_cache import CodeCache, schema_fingerprint
+from .columns import ColumnarResult, RowView
+from .json_format import JsonResult
+from .json_stream import iter_json_array, iter_json_lines
+from .lazy import LazyNested, force_lazy
+from .load_statistics import FieldStatistics, LoadStatistics, SchemaStatistics
+from .records import SlotsRecord, post_load_constructor, record_class
+from .reload import reload_many, reload_nested, unchanged
 
 __all__ = [
     'CompileContext',
@@ -8,4 +16,22 @@ __all__ = [
     'CompileFlags',
     'EncodedReturn',
     'Template',
+    'CodeCache',
+    'schema_fingerprint',
+    'ColumnarResult',
+    'RowView',
+    'JsonResult',
+    'iter_json_array',
+    'iter_json_lines',
+    'LazyNested',
+    'force_lazy',
+    'FieldStatistics',
+    'LoadStatistics',
+    'SchemaStatistics',
+    'SlotsRecord',
+    'post_load_constructor',
+    'record_class',
+    'reload_many',
+    'reload_nested',
+    'unchanged',
 ]
\ No newline at end of file
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import hashlib
+import importlib.util
+import marshal
+import os
+import sys
+import threading
+import types
+import typing
+from pathlib import Path
+
+import marshmallow
+from marshmallow.base import SchemaABC, FieldABC
+
+from .compile_context import CompileFlags
+
+
+_ignored_schema_attributes = {'context', 'declared_fields', '_routines'}
+_ignored_field_attributes = {'parent', 'root'}
+
+
+def _describe(value: typing.Any, seen: dict[typing.Hashable, int]) -> typing.Any:
+    if value is None or isinstance(value, (str, bytes, int, float, bool)):
+        return value
+    elif isinstance(value, (list, tuple)):
+        return [_describe(v, seen) for v in value]
+    elif isinstance(value, typing.AbstractSet):
+        return sorted(repr(_describe(v, seen)) for v in value)
+    elif isinstance(value, typing.Mapping):
+        return sorted(((repr(_describe(k, seen)), _describe(v, seen)) for k, v in value.items()), key=lambda i: i[0])
+    elif isinstance(value, types.ModuleType):
+        return f'module {value.__name__}'
+    elif isinstance(value, type) or callable(value) and hasattr(value, '__qualname__'):
+        return f'{getattr(value, "__module__", None)}.{value.__qualname__}'
+
+    # nested schemas may be instantiated lazily, so recursive schemas are detected by class and fields
+    key = (type(value), tuple(value.fields.keys())) if isinstance(value, SchemaABC) else id(value)
+    if key in seen:
+        return f'recursion {seen[key]}'
+    seen[key] = len(seen)
+
+    description = [f'{type(value).__module__}.{type(value).__qualname__}']
+    if isinstance(value, SchemaABC):
+        attributes = {k: v for k, v in vars(value).items()
+                      if k not in _ignored_schema_attributes and not k.startswith('_compiled')}
+        description += [_describe(attributes, seen),
+                        _describe(vars(value.opts), seen),
+                        _describe(value._hooks, seen),
+                        _describe(value.dict_class, seen)]
+    elif isinstance(value, FieldABC):
+        attributes = {k: v for k, v in vars(value).items() if k not in _ignored_field_attributes}
+        description.append(_describe(attributes, seen))
+        if isinstance(value, marshmallow.fields.Nested):
+            description.append(_describe(value.schema, seen))
+    elif hasattr(value, '__dict__'):
+        description.append(_describe(vars(value), seen))
+    else:
+        description.append(repr(value))
+
+    del seen[key]
+    return description
+
+
+_code_version = None
+
+
+def _compiler_code_version() -> str:
+    global _code_version
+    if _code_version is None:
+        from ..encoders.visitor import visitor
+
+        package_root = Path(__file__).parents[2]
+        files = set(package_root.rglob('*.py'))
+        for encoder in [*visitor._encoders, visitor._field_fallback_encoder]:
+            module = sys.modules.get(getattr(encoder, '__module__', None))
+            if getattr(module, '__file__', None):
+                files.add(Path(module.__file__))
+        content_hash = hashlib.sha256()
+        for file in sorted(files):
+            content_hash.update(file.read_bytes())
+        _code_version = content_hash.hexdigest()
+    return _code_version
+
+
+def schema_fingerprint(schema: SchemaABC, flags: CompileFlags) -> str:
+    flags_description = {name: getattr(flags, name) for name in dir(flags)
+                         if not name.startswith('_') and not callable(getattr(flags, name))}
+    description = [
+        marshmallow.__version__,
+        importlib.util.MAGIC_NUMBER.hex(),
+        _compiler_code_version(),
+        _describe(flags_description, {}),
+        _describe(schema, {}),
+    ]
+    return hashlib.sha256(repr(description).encode('utf-8')).hexdigest()
+
+
+class CodeCache:
+    def __init__(self, directory: str | os.PathLike):
+        self.directory = Path(directory)
+
+    def _path(self, fingerprint: str, suffix: str) -> Path:
+        return self.directory / f'{fingerprint}{suffix}'
+
+    def get(self, fingerprint: str) -> dict[str, typing.Any] | None:
+        try:
+            with open(self._path(fingerprint, '.marshal'), 'rb') as f:
+                return marshal.load(f)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+
+    def set(self, fingerprint: str, source: str, entry: dict[str, typing.Any]):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._write(self._path(fingerprint, '.py'), source.encode('utf-8'))
+        self._write(self._path(fingerprint, '.marshal'), marshal.dumps(entry))
+
+    @staticmethod
+    def _write(path: Path, content: bytes):
+        # write to a temporary file first, so concurrent workers never read a partially written entry
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import typing
+from array import array
+from collections.abc import Mapping, Sequence
+
+from marshmallow.utils import missing
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+COLUMN_KINDS = ('list', 'array', 'numpy')
+
+
+def _convert_column(column: list, mask: bytearray, numeric: tuple[str, str] | None, kind: str) -> typing.Any:
+    has_missing = 0 in mask
+    # columns with None values stay lists, arrays can not hold them
+    typecode = numeric and (numeric[0] if kind == 'array' else numeric[1])
+    if kind != 'list' and typecode and None not in column:
+        values = [0 if v is missing else v for v in column] if has_missing else column
+        try:
+            return array(typecode, values) if kind == 'array' else numpy.array(values, dtype=typecode)
+        except (OverflowError, TypeError):
+            pass
+    return [None if v is missing else v for v in column] if has_missing else column
+
+
+class RowView(Mapping):
+    __slots__ = ('_result', '_index')
+
+    def __init__(self, result: ColumnarResult, index: int):
+        self._result = result
+        self._index = index
+
+    def __getitem__(self, key: str) -> typing.Any:
+        if not self._result.masks[key][self._index]:
+            raise KeyError(key)
+        value = self._result.columns[key][self._index]
+        # boolean arrays hold 0 and 1, rows return them as the loaded booleans
+        return value == 1 if key in self._result._boolean_arrays else value
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return (key for key, mask in self._result.masks.items() if mask[self._index])
+
+    def __len__(self) -> int:
+        return sum(mask[self._index] for mask in self._result.masks.values())
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({dict(self)!r})'
+
+
+class ColumnarResult(Sequence):
+    def __init__(self, columns: dict[str, typing.Any], masks: dict[str, bytearray], length: int):
+        self.columns = columns
+        # a mask has a 1 for every record which had the field, the column holds a placeholder for the others
+        self.masks = masks
+        self._length = length
+        self._boolean_arrays = frozenset(k for k, c in columns.items() if isinstance(c, array) and c.typecode == 'b')
+
+    @classmethod
+    def from_lists(cls, names: tuple[str, ...], columns: tuple[list, ...], masks: tuple[bytearray, ...],
+                   numeric: dict[str, tuple[str, str]], kind: str) -> ColumnarResult:
+        if kind not in COLUMN_KINDS:
+            raise ValueError(f'Unknown column kind: {kind}')
+        elif kind == 'numpy' and numpy is None:
+            raise ImportError('numpy columns require numpy')
+        return cls({name: _convert_column(column, mask, numeric.get(name), kind)
+                    for name, column, mask in zip(names, columns, masks)},
+                   dict(zip(names, masks)),
+                   len(masks[0]) if masks else 0)
+
+    def __len__(self) -> int:
+        return self._length
+
+    @typing.overload
+    def __getitem__(self, index: int) -> RowView: ...
+
+    @typing.overload
+    def __getitem__(self, index: slice) -> list[RowView]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [RowView(self, i) for i in range(*index.indices(self._length))]
+        elif index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('row index out of range')
+        return RowView(self, index)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._length} rows, columns={list(self.columns)})'
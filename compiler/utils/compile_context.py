@@ -4,10 +4,13 @@ import typing
 from typing import Any, Mapping
 from contextlib import contextmanager
 
+from .load_statistics import LoadStatistics
+
 
 class CompileContextStacks:
-    _stacks = {}
-    _scope_counter = 0
+    def __init__(self):
+        self._stacks = {}
+        self._scope_counter = 0
 
     @property
     def scope_counter(self):
@@ -59,9 +62,11 @@ class CompileContextStacks:
     def scope(self, mapping: Mapping[str, Any] = None, **kwargs):
         self.push(mapping, **kwargs)
         self._scope_counter += 1
-        yield
-        self._scope_counter -= 1
-        self.pop(*set((mapping or {}).keys()).union(kwargs.keys()))
+        try:
+            yield
+        finally:
+            self._scope_counter -= 1
+            self.pop(*set((mapping or {}).keys()).union(kwargs.keys()))
 
 
 class CompileContextData(dict):
@@ -75,8 +80,23 @@ class CompileContextData(dict):
 
 class CompileFlags:
     validate: bool = True
+    collect_errors: bool = True
 
     always_inline_bool: bool = False
+    # loads records of the exact expected shape without checks, all other records take the checked path
+    specialize_shapes: bool = False
+    # records presence, None values, types and list lengths of the loaded fields on the schema's load_statistics
+    collect_statistics: bool = False
+    # loads lists of Float and Integer fields into 'array' (array.array) or 'numpy' arrays, and dumps them back
+    numeric_lists: str = ''
+    # loads schemas without dict based hooks into generated 'slots' or 'tuple' record classes instead of dicts
+    record_results: str = ''
+    # calls the constructor of a post_load hook which only returns constructor(**data) directly
+    fuse_post_load: bool = False
+    # loads all Nested fields on first access, fields with a lazy metadata entry decide on their own
+    lazy_nested: bool = False
+    # also compiles reload_compiled, which shares the previous results of unchanged nested data
+    reload: bool = False
 
     def __init__(self, **kwargs):
         for key, value in kwargs.items():
@@ -88,11 +108,11 @@ class CompileFlags:
 
 
 class CompileContext:
-    _data = CompileContextData()
-    _stacks = CompileContextStacks()
-
-    def __init__(self, flags: CompileFlags):
+    def __init__(self, flags: CompileFlags, statistics: LoadStatistics | None = None):
         self.flags = flags
+        self.statistics = statistics
+        self._data = CompileContextData()
+        self._stacks = CompileContextStacks()
 
     def push(self):
         pass
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import json
+import typing
+from json.encoder import encode_basestring_ascii
+
+
+# the separators of json.dumps, so the written text equals the default dumps of the result
+ITEM_SEPARATOR = ', '
+KEY_SEPARATOR = ': '
+
+json_value = json.dumps
+
+# results which are known at compile time are written as constant text
+_constant_values = {'None': 'null', 'True': 'true', 'False': 'false'}
+
+
+def json_string(value: typing.Any) -> str:
+    return encode_basestring_ascii(value) if value.__class__ is str else json_value(value)
+
+
+def json_int(value: typing.Any) -> str:
+    return int.__repr__(value) if value.__class__ is int else json_value(value)
+
+
+def json_float(value: typing.Any) -> str:
+    # nan and infinity are written as NaN and Infinity by json.dumps, only finite values pass the check
+    return float.__repr__(value) if value.__class__ is float and value - value == 0.0 else json_value(value)
+
+
+def json_bool(value: typing.Any) -> str:
+    if value is True:
+        return 'true'
+    elif value is False:
+        return 'false'
+    return json_value(value)
+
+
+class JsonResult:
+    def __init__(self, parts: str, prefix: str, format_function: str, prefix_is_literal: bool = True):
+        self.parts = parts
+        self.prefix = prefix
+        self.format_function = format_function
+        self.prefix_is_literal = prefix_is_literal
+
+    @property
+    def prefix_code(self) -> str:
+        return repr(self.prefix) if self.prefix_is_literal else self.prefix
+
+    def append(self, text: str) -> str:
+        if self.prefix_is_literal:
+            return f'{self.parts}.append({self.prefix + text!r})'
+        return f'{self.parts}.append({self.prefix} + {text!r})'
+
+    def __call__(self, value: str) -> str:
+        if value in _constant_values:
+            return self.append(_constant_values[value])
+        return f'{self.parts}.append({self.prefix_code} + {self.format_function}({value}))'
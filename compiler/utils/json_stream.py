@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+import typing
+
+
+_whitespace = re.compile(r'[ \t\n\r]*')
+_delimiter = re.compile(r'[ \t\n\r]*([,\]])[ \t\n\r]*')
+_number_characters = frozenset('0123456789.eE+-')
+
+JsonSource = typing.Union[str, bytes, typing.IO, typing.Iterable[typing.Union[str, bytes]]]
+
+
+def _read_chunks(source: JsonSource, chunk_size: int) -> typing.Iterator[str | bytes]:
+    if isinstance(source, (str, bytes, bytearray)):
+        yield source
+    elif hasattr(source, 'read'):
+        while chunk := source.read(chunk_size):
+            yield chunk
+    else:
+        yield from source
+
+
+def _decode_chunks(chunks: typing.Iterable[str | bytes]) -> typing.Iterator[str]:
+    # incremental, so multibyte characters split between two chunks are decoded correctly
+    decoder = codecs.getincrementaldecoder('utf-8-sig')()
+    for chunk in chunks:
+        text = decoder.decode(chunk) if isinstance(chunk, (bytes, bytearray)) else chunk
+        if text:
+            yield text
+    text = decoder.decode(b'', final=True)
+    if text:
+        yield text
+
+
+class _Buffer:
+    def __init__(self, chunks: typing.Iterator[str]):
+        self.chunks = chunks
+        self.text = ''
+        self.position = 0
+
+    def fill(self) -> bool:
+        chunk = next(self.chunks, None)
+        if chunk is None:
+            return False
+        # only the unconsumed rest is kept, the buffer holds at most one element and one chunk
+        self.text = self.text[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def peek(self) -> str:
+        self.position = _whitespace.match(self.text, self.position).end()
+        while self.position == len(self.text):
+            if not self.fill():
+                return ''
+            self.position = _whitespace.match(self.text, self.position).end()
+        return self.text[self.position]
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.text, self.position)
+
+
+def _iter_json_array_text(text: str) -> typing.Iterator[typing.Any]:
+    # the whole document is in memory, so the decoder's scanner runs directly on it without buffering
+    scan_once = json.JSONDecoder().scan_once
+    skip_whitespace = _whitespace.match
+    match_delimiter = _delimiter.match
+    position = skip_whitespace(text, 0).end()
+    if text[position:position + 1] != '[':
+        raise json.JSONDecodeError('Expecting a JSON array', text, position)
+    position = skip_whitespace(text, position + 1).end()
+    if text[position:position + 1] != ']':
+        while True:
+            try:
+                value, position = scan_once(text, position)
+            except StopIteration as error:
+                raise json.JSONDecodeError('Expecting value', text, error.value) from None
+            yield value
+
+            delimiter = match_delimiter(text, position)
+            if delimiter is None:
+                raise json.JSONDecodeError("Expecting ',' delimiter", text, skip_whitespace(text, position).end())
+            position = delimiter.end()
+            if delimiter.group(1) == ']':
+                break
+    else:
+        position = skip_whitespace(text, position + 1).end()
+    if position != len(text):
+        raise json.JSONDecodeError('Extra data', text, position)
+
+
+def iter_json_array(source: JsonSource, chunk_size: int = 65536) -> typing.Iterator[typing.Any]:
+    if isinstance(source, str):
+        yield from _iter_json_array_text(source)
+        return
+    elif isinstance(source, (bytes, bytearray)):
+        yield from _iter_json_array_text(source.decode(json.detect_encoding(source), 'surrogatepass'))
+        return
+
+    decoder = json.JSONDecoder()
+    buffer = _Buffer(_decode_chunks(_read_chunks(source, chunk_size)))
+    if buffer.peek() != '[':
+        raise buffer.error('Expecting a JSON array')
+    buffer.position += 1
+    if buffer.peek() == ']':
+        buffer.position += 1
+    else:
+        while True:
+            buffer.peek()
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer.text, buffer.position)
+                except json.JSONDecodeError:
+                    if buffer.fill():
+                        continue
+                    raise
+                # a number cut off by the end of the buffer may continue in the next chunk
+                truncated = end == len(buffer.text) or (isinstance(value, (int, float))
+                                                        and buffer.text[end] in _number_characters)
+                if truncated and buffer.fill():
+                    continue
+                break
+            buffer.position = end
+            yield value
+
+            delimiter = buffer.peek()
+            buffer.position += 1
+            if delimiter == ']':
+                break
+            elif delimiter != ',':
+                buffer.position -= 1
+                raise buffer.error("Expecting ',' delimiter")
+    if buffer.peek():
+        raise buffer.error('Extra data')
+
+
+def iter_json_lines(source: JsonSource, loads: typing.Callable[[str], typing.Any] = json.loads,
+                    chunk_size: int = 65536) -> typing.Iterator[typing.Any]:
+    rest = ''
+    for text in _decode_chunks(_read_chunks(source, chunk_size)):
+        lines = (rest + text).split('\n')
+        rest = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield loads(line)
+    if rest.strip():
+        yield loads(rest)
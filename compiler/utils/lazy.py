@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import typing
+
+from marshmallow.error_store import ErrorStore
+from marshmallow.exceptions import ValidationError
+
+from .records import SlotsRecord
+
+
+_unloaded = object()
+
+
+def _loaded(value: typing.Any) -> typing.Any:
+    return value
+
+
+class LazyNested:
+    # the raw nested data is only loaded with the compiled function of the nested schema on first access
+    __slots__ = ('_function', '_data', '_partial', '_result')
+
+    def __init__(self, function: typing.Callable[[typing.Any, typing.Any], typing.Any], data: typing.Any,
+                 partial: typing.Any):
+        self._function = function
+        self._data = data
+        self._partial = partial
+        self._result = _unloaded
+
+    @property
+    def _is_loaded(self) -> bool:
+        return self._result is not _unloaded
+
+    def _load(self) -> typing.Any:
+        # a failed load raises the errors of the nested schema again on the next access
+        if self._result is _unloaded:
+            self._result = self._function(self._data, self._partial)
+            self._function = self._data = self._partial = None
+        return self._result
+
+    def __getattr__(self, name: str) -> typing.Any:
+        return getattr(self._load(), name)
+
+    def __getitem__(self, key: typing.Any) -> typing.Any:
+        return self._load()[key]
+
+    def __setitem__(self, key: typing.Any, value: typing.Any):
+        self._load()[key] = value
+
+    def __iter__(self) -> typing.Iterator:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __contains__(self, item: typing.Any) -> bool:
+        return item in self._load()
+
+    def __bool__(self) -> bool:
+        return bool(self._load())
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if other.__class__ is LazyNested:
+            other = other._load()
+        return self._load() == other
+
+    __hash__ = None
+
+    def __reduce__(self) -> tuple:
+        # the compiled function is a closure, copies and pickles hold the loaded result
+        return _loaded, (self._load(),)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self._result!r})' if self._is_loaded else f'{self.__class__.__name__}(<unloaded>)'
+
+
+def force_lazy(value: typing.Any) -> typing.Any:
+    if value.__class__ is LazyNested:
+        value = value._load()
+
+    # the errors of all nested data are collected and keyed by their path in the loaded result
+    error_store = ErrorStore()
+    if isinstance(value, dict):
+        for key, item in list(value.items()):
+            try:
+                forced = force_lazy(item)
+            except ValidationError as error:
+                error_store.store_error(error.messages, key)
+                continue
+            if forced is not item:
+                value[key] = forced
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            try:
+                forced = force_lazy(item)
+            except ValidationError as error:
+                error_store.store_error(error.messages, index=index)
+                continue
+            if forced is not item:
+                value[index] = forced
+    elif isinstance(value, SlotsRecord) or isinstance(value, tuple) and hasattr(value, '_fields'):
+        changes = {}
+        for key in value._fields:
+            item = getattr(value, key)
+            try:
+                forced = force_lazy(item)
+            except ValidationError as error:
+                error_store.store_error(error.messages, key)
+                continue
+            if forced is not item:
+                changes[key] = forced
+        if changes and isinstance(value, tuple):
+            value = value._replace(**changes)
+        else:
+            for key, forced in changes.items():
+                setattr(value, key, forced)
+
+    if error_store.errors:
+        raise ValidationError(error_store.errors, valid_data=value)
+    return value
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import typing
+from collections import Counter
+from collections.abc import Mapping
+
+
+def data_path(data_keys: typing.Iterable[str | None]) -> str:
+    return '.'.join(k for k in data_keys if k)
+
+
+class FieldStatistics:
+    __slots__ = ('present', 'none', 'types', 'lengths')
+
+    def __init__(self):
+        self.present = 0
+        self.none = 0
+        self.types = Counter()
+        self.lengths = Counter()
+
+    def observe(self, value: typing.Any):
+        self.present += 1
+        if value is None:
+            self.none += 1
+            return
+        value_type = value.__class__
+        self.types[value_type] += 1
+        if value_type is list or value_type is tuple:
+            self.lengths[len(value)] += 1
+
+
+class SchemaStatistics:
+    def __init__(self, data_keys: typing.Iterable[str]):
+        self.records = 0
+        self.fields = {data_key: FieldStatistics() for data_key in data_keys}
+
+    def observe(self, data: typing.Any):
+        # data which is no mapping fails to load anyway and says nothing about the fields
+        if not isinstance(data, Mapping):
+            return
+        self.records += 1
+        for data_key, statistics in self.fields.items():
+            if data_key in data:
+                statistics.observe(data[data_key])
+
+    def presence_rate(self, data_key: str) -> float:
+        return self.fields[data_key].present / self.records if self.records else 0.0
+
+    def none_rate(self, data_key: str) -> float:
+        statistics = self.fields[data_key]
+        return statistics.none / statistics.present if statistics.present else 0.0
+
+
+class LoadStatistics:
+    # decisions are only taken from this many records, and a type must make up this share of the values
+    min_records: int = 100
+    dominant_type_rate: float = 0.95
+
+    def __init__(self):
+        self.schemas: dict[str, SchemaStatistics] = {}
+
+    def schema_statistics(self, path: str, data_keys: typing.Iterable[str]) -> SchemaStatistics:
+        statistics = self.schemas.get(path)
+        if statistics is None:
+            statistics = self.schemas[path] = SchemaStatistics(data_keys)
+        return statistics
+
+    def _sufficient(self, path: str) -> SchemaStatistics | None:
+        statistics = self.schemas.get(path)
+        if statistics is None or statistics.records < self.min_records:
+            return None
+        return statistics
+
+    def field_statistics(self, path: str, data_key: str) -> FieldStatistics | None:
+        statistics = self._sufficient(path)
+        if statistics is None:
+            return None
+        return statistics.fields.get(data_key)
+
+    def dominant_type(self, path: str, data_key: str) -> type | None:
+        statistics = self.field_statistics(path, data_key)
+        if statistics is None or not statistics.types:
+            return None
+        value_type, count = statistics.types.most_common(1)[0]
+        if count < self.dominant_type_rate * (statistics.present - statistics.none):
+            return None
+        return value_type
+
+    def always_present(self, path: str) -> bool:
+        statistics = self._sufficient(path)
+        return statistics is not None and all(s.present == statistics.records and s.none == 0
+                                              for s in statistics.fields.values())
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import ast
+import inspect
+import textwrap
+import typing
+from collections import namedtuple
+from keyword import iskeyword
+
+from marshmallow.decorators import POST_LOAD
+from marshmallow.schema import Schema
+from marshmallow.utils import missing
+
+
+RECORD_KINDS = ('slots', 'tuple')
+
+_record_classes: dict[tuple[type, tuple[str, ...], str], type] = {}
+
+
+def record_fields(schema: Schema) -> tuple[str, ...] | None:
+    obj_keys = tuple(field.attribute or attr_name for attr_name, field in schema.load_fields.items())
+    # the attributes are the constructor arguments, they must be distinct identifiers which do not clash with _fields
+    if len(set(obj_keys)) != len(obj_keys) or not all(k.isidentifier() and not iskeyword(k) and not k.startswith('_')
+                                                      for k in obj_keys):
+        return None
+    return obj_keys
+
+
+def _rebuild_record(schema_class: type, fields: tuple[str, ...], kind: str, values: tuple) -> typing.Any:
+    # missing is no singleton after unpickling
+    return _record_class(schema_class, fields, kind)(*[missing if v.__class__ is missing.__class__ else v for v in values])
+
+
+def _record_values(record: typing.Any) -> tuple:
+    return tuple(getattr(record, f) for f in record._fields)
+
+
+def _asdict(record: typing.Any) -> dict[str, typing.Any]:
+    return {f: v for f, v in zip(record._fields, _record_values(record)) if v is not missing}
+
+
+def _reduce(record: typing.Any) -> tuple:
+    return _rebuild_record, (record._schema, record._fields, record._kind, _record_values(record))
+
+
+class SlotsRecord:
+    __slots__ = ()
+    _fields: tuple[str, ...] = ()
+    _schema: type = None
+    _kind = 'slots'
+
+    _asdict = _asdict
+    __reduce__ = _reduce
+
+    def __eq__(self, other: typing.Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return _record_values(self) == _record_values(other)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({", ".join(f"{k}={v!r}" for k, v in self._asdict().items())})'
+
+
+def _slots_record_class(name: str, fields: tuple[str, ...]) -> type:
+    lines = [f'def __init__(self, {", ".join(fields)}):' if fields else 'def __init__(self):']
+    lines += [f'    self.{f} = {f}' for f in fields] or ['    pass']
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return type(name, (SlotsRecord,), {'__slots__': fields, '_fields': fields, '__init__': namespace['__init__']})
+
+
+def _tuple_record_class(name: str, fields: tuple[str, ...]) -> type:
+    cls = namedtuple(name, fields)
+    cls._kind = 'tuple'
+    cls._asdict = _asdict
+    cls.__reduce__ = _reduce
+    return cls
+
+
+def _record_class(schema_class: type, fields: tuple[str, ...], kind: str) -> type:
+    key = (schema_class, fields, kind)
+    cls = _record_classes.get(key)
+    if cls is None:
+        name = f'{schema_class.__name__}Record'
+        cls = _slots_record_class(name, fields) if kind == 'slots' else _tuple_record_class(name, fields)
+        cls._schema = schema_class
+        cls.__module__ = schema_class.__module__
+        cls.__qualname__ = f'{schema_class.__qualname__}Record'
+        _record_classes[key] = cls
+    return cls
+
+
+def record_class(schema: Schema, kind: str) -> type:
+    if kind not in RECORD_KINDS:
+        raise ValueError(f'Unknown record kind: {kind}')
+    fields = record_fields(schema)
+    if fields is None:
+        raise ValueError(f'The load fields of {schema.__class__.__name__} are no valid record attributes')
+    return _record_class(schema.__class__, fields, kind)
+
+
+def _constructor_expression(function: typing.Callable) -> ast.expr | None:
+    try:
+        tree = ast.parse(textwrap.dedent(inspect.getsource(function)))
+    except (OSError, TypeError, SyntaxError):
+        return None
+    definition = tree.body[0] if tree.body else None
+    if not isinstance(definition, ast.FunctionDef) or len(definition.args.args) != 2:
+        return None
+    body = definition.body
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        body = body[1:]
+    # only "return constructor(**data)" is fused, anything else could depend on the dict or the other arguments
+    data = definition.args.args[1].arg
+    if (len(body) != 1 or not isinstance(body[0], ast.Return) or not isinstance(body[0].value, ast.Call)
+            or body[0].value.args or len(body[0].value.keywords) != 1 or body[0].value.keywords[0].arg is not None
+            or not isinstance(body[0].value.keywords[0].value, ast.Name) or body[0].value.keywords[0].value.id != data):
+        return None
+    return body[0].value.func
+
+
+def post_load_constructor(schema: Schema) -> typing.Callable | None:
+    hooks = schema._hooks[(POST_LOAD, False)]
+    if schema._hooks[(POST_LOAD, True)] or len(hooks) != 1:
+        return None
+    processor = getattr(schema, hooks[0])
+    if processor.__marshmallow_hook__[(POST_LOAD, False)].get('pass_original', False):
+        return None
+    function = inspect.unwrap(processor.__func__)
+    expression = _constructor_expression(function)
+    names = []
+    while isinstance(expression, ast.Attribute):
+        names.insert(0, expression.attr)
+        expression = expression.value
+    code = function.__code__
+    if (not isinstance(expression, ast.Name) or expression.id in code.co_varnames or expression.id in code.co_freevars
+            or expression.id not in function.__globals__):
+        return None
+    constructor = function.__globals__[expression.id]
+    for name in names:
+        constructor = getattr(constructor, name, None)
+    return constructor if callable(constructor) else None
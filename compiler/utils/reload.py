@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import typing
+from collections.abc import Mapping
+
+from marshmallow.error_store import ErrorStore
+from marshmallow.exceptions import ValidationError
+from marshmallow.utils import missing
+
+from .records import SlotsRecord
+
+
+def previous_value(previous_data: typing.Any, data_key: str) -> typing.Any:
+    if isinstance(previous_data, Mapping):
+        return previous_data.get(data_key, missing)
+    return missing
+
+
+def previous_field(previous_result: typing.Any, obj_key: str) -> typing.Any:
+    # only dicts and records are known to hold the loaded values of the fields, post_load results could hold anything
+    if isinstance(previous_result, dict):
+        return previous_result.get(obj_key, missing)
+    elif isinstance(previous_result, SlotsRecord) or isinstance(previous_result, tuple) and hasattr(previous_result, '_fields'):
+        return getattr(previous_result, obj_key, missing)
+    return missing
+
+
+_scalar_classes = frozenset((str, int, float, bool, type(None)))
+
+
+def _same_key(key: typing.Any, previous: Mapping) -> bool:
+    return any(k.__class__ is key.__class__ and k == key for k in previous)
+
+
+def _same_types(value: typing.Any, previous: typing.Any) -> bool:
+    # value == previous holds, only the classes of all nested values are left to compare
+    if value is previous:
+        return True
+    cls = value.__class__
+    if cls is not previous.__class__:
+        return False
+    elif cls in _scalar_classes:
+        return True
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if key.__class__ is not str and not _same_key(key, previous):
+                return False
+            previous_item = previous[key]
+            if item is not previous_item and (item.__class__ is not previous_item.__class__ or
+                                              item.__class__ not in _scalar_classes and not _same_types(item, previous_item)):
+                return False
+        return True
+    elif isinstance(value, (list, tuple)):
+        for item, previous_item in zip(value, previous):
+            if item is not previous_item and (item.__class__ is not previous_item.__class__ or
+                                              item.__class__ not in _scalar_classes and not _same_types(item, previous_item)):
+                return False
+    return True
+
+
+def unchanged(value: typing.Any, previous: typing.Any) -> bool:
+    # unlike ==, True, 1 and 1.0 differ, a load could accept one of them and reject or convert another
+    return value is previous or value.__class__ is previous.__class__ and value == previous and _same_types(value, previous)
+
+
+def reload_nested(function: typing.Callable, value: typing.Any, partial: typing.Any,
+                  previous: typing.Any, previous_result: typing.Any) -> typing.Any:
+    if previous_result is not missing and unchanged(value, previous):
+        return previous_result
+    return function(value, partial, previous, previous_result)
+
+
+def reload_many(function: typing.Callable, values: typing.Iterable, partial: typing.Any,
+                previous: typing.Any, previous_result: typing.Any, index_errors: bool, collect: bool) -> list:
+    # items are compared by their index, an inserted item reloads all items after it
+    reusable = 0
+    if isinstance(previous, (list, tuple)) and isinstance(previous_result, list):
+        reusable = min(len(previous), len(previous_result))
+    results = []
+    reused = 0
+    error_store = ErrorStore()
+    for index, value in enumerate(values):
+        previous_item, previous_item_result = missing, missing
+        if index < reusable:
+            previous_item, previous_item_result = previous[index], previous_result[index]
+            if unchanged(value, previous_item):
+                results.append(previous_item_result)
+                reused += 1
+                continue
+        if not collect:
+            results.append(function(value, partial, previous_item, previous_item_result))
+            continue
+        try:
+            results.append(function(value, partial, previous_item, previous_item_result))
+        except ValidationError as error:
+            error_store.store_error(error.messages, index=index if index_errors else None)
+            results.append(error.valid_data)
+    if error_store.errors:
+        raise ValidationError(error_store.errors, valid_data=results)
+    # an unchanged list shares the previous list like an unchanged nested result
+    return previous_result if reusable and reused == len(results) == len(previous_result) else results
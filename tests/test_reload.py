@@ -0,0 +1,51 @@
+import pytest
+from marshmallow import Schema, ValidationError, fields
+
+from ..compiled_schema import CompiledSchema
+from ..compiler.utils import CompileFlags
+
+
+class Inner(CompiledSchema):
+    x = fields.Integer()
+    raw = fields.Raw()
+
+
+class Outer(CompiledSchema):
+    n = fields.Nested(Inner)
+    items = fields.Nested(Inner, many=True)
+
+
+@pytest.fixture
+def schema():
+    schema = Outer()
+    schema.compile(CompileFlags(reload=True))
+    return schema
+
+
+def test_reload_reuses_unchanged_nested_results(schema):
+    previous_data = {'n': {'x': 1}, 'items': [{'x': 2}, {'x': 3}]}
+    previous_result = schema.load_compiled(previous_data)
+    data = {'n': {'x': 1}, 'items': [{'x': 2}, {'x': 4}]}
+    result = schema.reload_compiled(data, previous_data, previous_result)
+    assert result == Schema.load(schema, data)
+    assert result['n'] is previous_result['n']
+    assert result['items'][0] is previous_result['items'][0]
+    assert result['items'][1] is not previous_result['items'][1]
+
+
+def test_reload_validates_values_which_only_compare_equal(schema):
+    previous_data = {'n': {'x': 1}, 'items': [{'x': 1}]}
+    previous_result = schema.load_compiled(previous_data)
+    data = {'n': {'x': True}, 'items': [{'x': True}]}
+    with pytest.raises(ValidationError) as error:
+        schema.reload_compiled(data, previous_data, previous_result)
+    assert error.value.messages == {'n': {'x': ['Not a valid integer.']}, 'items': {0: {'x': ['Not a valid integer.']}}}
+
+
+def test_reload_loads_values_of_another_type(schema):
+    previous_data = {'n': {'raw': 1}}
+    previous_result = schema.load_compiled(previous_data)
+    data = {'n': {'raw': 1.0}}
+    result = schema.reload_compiled(data, previous_data, previous_result)
+    assert result['n']['raw'].__class__ is float
+    assert schema.reload_compiled(data, data, previous_result) is previous_result